@@ -0,0 +1,82 @@
+from collections import deque
+
+#############################################
+# AUTÓMATA AHO-CORASICK PARA BÚSQUEDA MULTIPATRÓN
+#############################################
+
+class AhoCorasick:
+    """
+    Autómata de Aho-Corasick compilado a partir de una lista de patrones.
+
+    Cada patrón se asocia a una o varias etiquetas (por ejemplo, el índice de la
+    variable de la que proviene). Tras la construcción, `scan` recorre el texto
+    una única vez y retorna el conjunto de etiquetas cuyos patrones aparecen en
+    él, incluyendo coincidencias solapadas o contenidas en otras.
+    """
+
+    def __init__(self, patterns):
+        """
+        patterns: iterable de pares (patrón, etiqueta). Un mismo patrón puede
+        aparecer varias veces con etiquetas distintas.
+        """
+        self._goto = [{}]
+        self._outputs = [set()]
+        self.always = set()  # Etiquetas de patrones vacíos: coinciden con cualquier texto
+
+        for pattern, label in patterns:
+            if not pattern:
+                self.always.add(label)
+                continue
+            state = 0
+            for ch in pattern:
+                next_state = self._goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][ch] = next_state
+                    self._goto.append({})
+                    self._outputs.append(set())
+                state = next_state
+            self._outputs[state].add(label)
+
+        self._delta = self._build_automaton()
+        # Las salidas se congelan para poder unirlas rápidamente durante el recorrido
+        self._outputs = [frozenset(out) for out in self._outputs]
+
+    def _build_automaton(self):
+        """
+        Calcula los enlaces de fallo por BFS y los pliega en una tabla de
+        transiciones determinista: cada estado conoce directamente su siguiente
+        estado para cualquier carácter del alfabeto de los patrones, de modo que
+        el recorrido hace una sola búsqueda en diccionario por carácter (los
+        caracteres ausentes de la tabla regresan a la raíz).
+        """
+        fail = [0] * len(self._goto)
+        delta = [dict() for _ in self._goto]
+        delta[0] = dict(self._goto[0])
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            # Transiciones heredadas del estado de fallo, sobrescritas por las propias
+            delta[state] = dict(delta[fail[state]])
+            for ch, next_state in self._goto[state].items():
+                fail[next_state] = delta[fail[state]].get(ch, 0)
+                delta[state][ch] = next_state
+                queue.append(next_state)
+            self._outputs[state] |= self._outputs[fail[state]]
+        return delta
+
+    def scan(self, text):
+        """Recorre el texto una sola vez y retorna el conjunto de etiquetas encontradas."""
+        delta = self._delta
+        state = 0
+        visited = set()
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            visited.add(state)
+
+        labels = set(self.always)
+        outputs = self._outputs
+        for state in visited:
+            labels |= outputs[state]
+        return labels
@@ -0,0 +1,219 @@
+import os
+import json
+import shutil
+import tempfile
+import numpy as np
+
+from lector_articulos import iter_articles
+
+#############################################
+# ALMACÉN COLUMNAR DE ARTÍCULOS
+#############################################
+#
+# processed_articles.json se convierte una sola vez en columnas NumPy que se
+# abren con memory-mapping:
+#   - Campos categóricos (autor, journal, tipo, ...): códigos int32 + diccionario
+#     de cadenas (código -1 = campo ausente).
+#   - Campos de texto largo (abstract, título, ...): bytes UTF-8 concatenados +
+#     offsets int64, al estilo de Arrow.
+#   - Año numérico: int32, con 0 para años no numéricos (misma regla que ordenamientoDos).
+# El almacén se reconstruye cuando cambian el mtime o el tamaño del JSON.
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_JSON_PATH = os.path.join(SCRIPT_DIR, "processed_articles.json")
+DEFAULT_STORE_DIR = os.path.join(SCRIPT_DIR, ".cache", "articulos")
+
+CATEGORICAL_FIELDS = {"author", "journal", "type", "month", "year", "publisher", "issn", "note", "number", "volume"}
+STORE_VERSION = 1
+
+def _source_signature(json_path):
+    stat = os.stat(json_path)
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+def _store_path(json_path, store_dir, signature):
+    name = os.path.splitext(os.path.basename(json_path))[0]
+    return os.path.join(store_dir, f"{name}-{signature['mtime_ns']}-{signature['size']}")
+
+def _as_text(value):
+    return value if isinstance(value, str) else str(value)
+
+#############################################
+# CONSTRUCCIÓN DEL ALMACÉN
+#############################################
+
+def build_store(articles, output_dir, signature=None):
+    """
+    Escribe las columnas de una secuencia de artículos (dicts) en output_dir.
+    Los artículos se recorren una sola vez, de modo que `articles` puede ser un generador.
+    """
+    fields = []
+    categorical = {}  # campo -> (lista de códigos, {valor: código})
+    text = {}         # campo -> (bytearray, lista de offsets, lista de presencia)
+    years = []
+    count = 0
+
+    for article in articles:
+        for field in article:
+            if field in categorical or field in text:
+                continue
+            fields.append(field)
+            if field in CATEGORICAL_FIELDS:
+                categorical[field] = ([-1] * count, {})
+            else:
+                text[field] = (bytearray(), [0] * (count + 1), [False] * count)
+
+        for field, (codes, dictionary) in categorical.items():
+            if field in article:
+                value = _as_text(article[field])
+                codes.append(dictionary.setdefault(value, len(dictionary)))
+            else:
+                codes.append(-1)
+        for field, (blob, offsets, present) in text.items():
+            if field in article:
+                blob.extend(_as_text(article[field]).encode("utf-8"))
+                present.append(True)
+            else:
+                present.append(False)
+            offsets.append(len(blob))
+
+        year = article.get("year", 0)
+        years.append(int(year) if str(year).isdigit() else 0)
+        count += 1
+
+    os.makedirs(os.path.dirname(output_dir), exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(prefix=".tmp-", dir=os.path.dirname(output_dir))
+    for field, (codes, dictionary) in categorical.items():
+        np.save(os.path.join(tmp_dir, f"{field}.codes.npy"), np.asarray(codes, dtype=np.int32))
+    for field, (blob, offsets, present) in text.items():
+        np.save(os.path.join(tmp_dir, f"{field}.data.npy"), np.frombuffer(bytes(blob), dtype=np.uint8))
+        np.save(os.path.join(tmp_dir, f"{field}.offsets.npy"), np.asarray(offsets, dtype=np.int64))
+        np.save(os.path.join(tmp_dir, f"{field}.present.npy"), np.asarray(present, dtype=bool))
+    np.save(os.path.join(tmp_dir, "year_int.npy"), np.asarray(years, dtype=np.int32))
+
+    meta = {
+        "version": STORE_VERSION,
+        "count": count,
+        "fields": fields,
+        "categorical": {field: list(dictionary) for field, (_, dictionary) in categorical.items()},
+        "source": signature,
+    }
+    with open(os.path.join(tmp_dir, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False)
+
+    try:
+        os.replace(tmp_dir, output_dir)
+    except OSError:
+        # Otro proceso construyó el mismo almacén al mismo tiempo
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    return output_dir
+
+#############################################
+# LECTURA DEL ALMACÉN
+#############################################
+
+class ArticleStore:
+    """
+    Vista de solo lectura sobre las columnas de un almacén construido con build_store.
+    Las columnas se cargan bajo demanda con mmap_mode="r".
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, "meta.json"), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        self.fields = meta["fields"]
+        self.dictionaries = meta["categorical"]
+        self._count = meta["count"]
+        self._arrays = {}
+
+    def __len__(self):
+        return self._count
+
+    def _array(self, name):
+        if name not in self._arrays:
+            self._arrays[name] = np.load(os.path.join(self.path, f"{name}.npy"), mmap_mode="r")
+        return self._arrays[name]
+
+    def codes(self, field):
+        """Códigos int32 de un campo categórico (-1 = ausente)."""
+        return self._array(f"{field}.codes")
+
+    def years(self):
+        """Año como int32 (0 cuando el año no es numérico o falta)."""
+        return self._array("year_int")
+
+    def column(self, field, default="Unknown", start=0, stop=None):
+        """
+        Retorna el campo como lista de cadenas de Python, con `default` para los
+        artículos que no lo tienen (equivalente a [a.get(field, default) for a in data]).
+        """
+        stop = self._count if stop is None else min(stop, self._count)
+        start = min(start, stop)
+        if field in self.dictionaries:
+            dictionary = self.dictionaries[field] + [default]
+            # El código -1 indexa el valor por defecto añadido al final
+            return [dictionary[code] for code in self.codes(field)[start:stop].tolist()]
+        if field not in self.fields:
+            return [default] * (stop - start)
+
+        data = self._array(f"{field}.data")
+        offsets = self._array(f"{field}.offsets")[start:stop + 1].tolist()
+        present = self._array(f"{field}.present")[start:stop].tolist()
+        if not offsets or stop == start:
+            return []
+        raw = data[offsets[0]:offsets[-1]].tobytes()
+        base = offsets[0]
+        return [
+            raw[offsets[i] - base:offsets[i + 1] - base].decode("utf-8") if present[i] else default
+            for i in range(stop - start)
+        ]
+
+    def iter_records(self, limit=None, offset=0, fields=None, batch_size=1024):
+        """
+        Generador de artículos como dicts (solo los campos pedidos). Las columnas
+        se decodifican por lotes, así que la memoria no depende del tamaño del corpus.
+        """
+        stop = self._count if limit is None else min(offset + limit, self._count)
+        fields = self.fields if fields is None else [field for field in fields if field in self.fields]
+        missing = object()
+        for batch_start in range(offset, stop, batch_size):
+            batch_stop = min(batch_start + batch_size, stop)
+            columns = [(field, self.column(field, missing, batch_start, batch_stop)) for field in fields]
+            for i in range(batch_stop - batch_start):
+                yield {field: values[i] for field, values in columns if values[i] is not missing}
+
+    def records(self, limit=None, offset=0, fields=None):
+        """
+        Reconstruye los artículos como lista de dicts, para las funciones que
+        esperan la lista de artículos del JSON original.
+        """
+        return list(self.iter_records(limit, offset, fields))
+
+_open_stores = {}
+
+def load_store(json_path=DEFAULT_JSON_PATH, store_dir=DEFAULT_STORE_DIR):
+    """
+    Abre el almacén columnar de json_path, construyéndolo si no existe o si el
+    archivo fuente cambió (mtime o tamaño). Las versiones anteriores se eliminan.
+    """
+    json_path = os.path.abspath(json_path)
+    signature = _source_signature(json_path)
+    path = _store_path(json_path, store_dir, signature)
+
+    cached = _open_stores.get(json_path)
+    if cached is not None and cached.path == path:
+        return cached
+
+    if not os.path.exists(os.path.join(path, "meta.json")):
+        print(f"[Store] Construyendo almacén columnar para {os.path.basename(json_path)}")
+        # El JSON se recorre en streaming: nunca se carga completo como lista de dicts
+        build_store(iter_articles(json_path), path, signature)
+
+        prefix = os.path.basename(path).rsplit("-", 2)[0] + "-"
+        for entry in os.scandir(store_dir):
+            if entry.is_dir() and entry.name.startswith(prefix) and entry.path != path:
+                shutil.rmtree(entry.path, ignore_errors=True)
+
+    store = ArticleStore(path)
+    _open_stores[json_path] = store
+    return store
@@ -0,0 +1,102 @@
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+
+from carga_masiva import (DEFAULT_BATCH_SIZE, DEFAULT_POOL_SIZE, bulk_insert, ensure_schema, get_connection_pool,
+                          refresh_statistics)
+
+#############################################
+# BACKENDS DE ALMACENAMIENTO DE ARTÍCULOS
+#############################################
+#
+# La tabla `articles` (mismo esquema, ver carga_masiva.SCHEMA) puede vivir en:
+#   - "mysql": el servidor de integrate.DB_CONFIG, con conexiones de un pool;
+#   - "sqlite": un archivo local en modo WAL, sin servidor (equipos de análisis y pruebas).
+# Las agregaciones (histograma de años, autores/journals más frecuentes, año ×
+# tipo) están en consultas y se calculan con GROUP BY en el motor: solo viajan
+# las filas ya agregadas.
+
+STORAGE_BACKENDS = ("mysql", "sqlite")
+QUERY_BATCH_SIZE = 1000
+
+class ArticleStorage(ABC):
+    """Interfaz común; las subclases definen `dialect`, `placeholder` y `connect()`."""
+
+    dialect = None
+    placeholder = None
+
+    @abstractmethod
+    def connect(self):
+        """Conexión DB-API nueva (o del pool); quien la pide la cierra."""
+
+    def query(self, sql, params=()):
+        """Ejecuta una consulta y produce sus filas en bloques de QUERY_BATCH_SIZE."""
+        conn = self.connect()
+        cursor = conn.cursor()
+        try:
+            cursor.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(QUERY_BATCH_SIZE)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cursor.close()
+            conn.close()
+
+    def insert_articles(self, articles, batch_size=DEFAULT_BATCH_SIZE, upsert=True):
+        """
+        Carga masiva (ver carga_masiva.bulk_insert) que además crea los índices
+        que falten y actualiza las estadísticas del optimizador; retorna las
+        estadísticas de la carga.
+        """
+        conn = self.connect()
+        try:
+            ensure_schema(conn, unique_keys=upsert)
+            stats = bulk_insert(conn, articles, batch_size=batch_size, upsert=upsert)
+            refresh_statistics(conn)
+            return stats
+        finally:
+            conn.close()
+
+    def close(self):
+        pass
+
+class MySQLStorage(ArticleStorage):
+    dialect = "mysql"
+    placeholder = "%s"
+
+    def __init__(self, config, pool_size=DEFAULT_POOL_SIZE):
+        self.config = config
+        self.pool_size = pool_size
+
+    def connect(self):
+        return get_connection_pool(self.config, self.pool_size).get_connection()
+
+class SQLiteStorage(ArticleStorage):
+    dialect = "sqlite"
+    placeholder = "?"
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        conn = self.connect()
+        try:
+            # WAL: los lectores (análisis) no bloquean al escritor (carga) ni al revés
+            conn.execute("PRAGMA journal_mode=WAL")
+            ensure_schema(conn)
+        finally:
+            conn.close()
+
+    def connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+def open_storage(backend, mysql_config=None, sqlite_path=None, **options):
+    """Crea el backend indicado ("mysql" con mysql_config o "sqlite" con sqlite_path)."""
+    if backend == "mysql":
+        return MySQLStorage(mysql_config, **options)
+    if backend == "sqlite":
+        return SQLiteStorage(sqlite_path)
+    raise ValueError(f"Backend de almacenamiento desconocido: {backend} (disponibles: {', '.join(STORAGE_BACKENDS)})")
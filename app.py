@@ -1,20 +1,26 @@
 import streamlit as st
 import pandas as pd
-import json
 import os
-from requerimiento2 import estadisticas_generales
-from requerimiento3 import analyze_category_frequencies
-from requerimiento5 import calcular_similitud_entre_abstracts
+from requerimiento5 import mostrar_similitudes
 import categorias
+import cache_app
+
+# Los cálculos costosos están en cache_app: una interacción (p. ej. el selector
+# del sidebar) vuelve a ejecutar este script, pero solo recalcula lo que cambió.
+# Los botones se recuerdan en st.session_state para que sus resultados sigan
+# visibles (desde la caché) en las ejecuciones siguientes.
+JSON_PATH = "processed_articles.json"
+st.session_state["timings"] = {}
 
 # Título
 st.title("Despliegue Proyecto Final - Análisis de Algoritmos")
 
 # Cargar datos
 st.header("Cargar archivo JSON procesado")
-with open("processed_articles.json", encoding="utf-8") as f:
-    data = json.load(f)
-    st.success("Archivo cargado correctamente.")
+signature = cache_app.source_signature(JSON_PATH)
+with cache_app.timed("Carga del JSON"):
+    data = cache_app.load_articles(JSON_PATH, signature)
+st.success("Archivo cargado correctamente.")
 
 # Mostrar una muestra del dataset
 if st.checkbox("Mostrar artículos procesados"):
@@ -26,56 +32,67 @@ st.title("Estadísticas Generales (Requerimiento 2)")
 uploaded_file = st.file_uploader("Sube el archivo JSON procesado", type="json")
 
 if uploaded_file:
+    raw = uploaded_file.getvalue()
     try:
-        data = json.load(uploaded_file)
-        data = data[:1000]  # limitar si es necesario
-        estadisticas_generales(data)
+        # Como en la versión original, el archivo subido (sus primeros 1000
+        # artículos) reemplaza a los datos locales para los requerimientos 3 y 5
+        upload_signature = cache_app.content_signature(raw)
+        with cache_app.timed("Carga del archivo subido"):
+            data = cache_app.uploaded_articles(upload_signature, raw)
+        signature = upload_signature
+        # Lectura incremental: solo se decodifican los artículos necesarios
+        with cache_app.timed("Estadísticas generales"):
+            graficos_req2 = cache_app.statistics_charts(upload_signature, raw)
         st.success("Estadísticas generadas correctamente.")
     except Exception as e:
+        graficos_req2 = {}
         st.error(f"Error al procesar el archivo JSON: {e}")
 
     # Mostrar visualizaciones del Requerimiento 2
     st.subheader("Visualizaciones del Requerimiento 2")
-    imagenes_req2 = [
-        "2_yearly_trends.png",
-        "2_top_authors.png",
-        "2top_journals.png",
-    ]
-    for imagen in imagenes_req2:
-        ruta = os.path.join("resultados", imagen)
-        if os.path.exists(ruta):
-            st.image(ruta, caption=imagen.replace("_", " ").replace(".png", ""), use_column_width=True)
+    for imagen in cache_app.STATISTICS_CHARTS:
+        if imagen in graficos_req2:
+            st.image(graficos_req2[imagen], caption=imagen.replace("_", " ").replace(".png", ""), use_column_width=True)
         else:
             st.warning(f"No se encontró la imagen: {imagen}")
 
 # Requerimiento 3: Frecuencia de categorías y Nube de Palabras
 st.header("Frecuencia de categorías y Nube de Palabras (Requerimiento 3)")
 if st.button("Analizar categorías"):
-    analyze_category_frequencies(data)
+    st.session_state["categorias_analizadas"] = True
+if st.session_state.get("categorias_analizadas"):
+    with cache_app.timed("Frecuencias por categoría"):
+        cache_app.category_frequencies(signature, data)
+    with cache_app.timed("Gráficos de categorías"):
+        graficos_req3 = cache_app.category_charts(signature, data)
     st.success("Frecuencias analizadas correctamente.")
 
     # Mostrar gráficos generados para cada categoría
     st.subheader("Visualización por Categoría")
     for categoria in categorias.CATEGORIAS.keys():
-        imagen_barra = os.path.join("resultados", f"3_{categoria}_frecuencia.png")
-        imagen_nube = os.path.join("resultados", f"3_{categoria}_wordcloud.png")
-        if os.path.exists(imagen_barra):
+        imagen_barra = graficos_req3.get(f"3_{categoria}_frecuencia.png")
+        imagen_nube = graficos_req3.get(f"3_{categoria}_wordcloud.png")
+        if imagen_barra:
             st.image(imagen_barra, caption=f"Frecuencia en {categoria}", use_column_width=True)
-        if os.path.exists(imagen_nube):
+        if imagen_nube:
             st.image(imagen_nube, caption=f"Nube de Palabras en {categoria}", use_column_width=True)
 
     # Mostrar nubes y co-word general
-    imagen_general_nube = os.path.join("resultados", "3_wordcloud_general.png")
-    imagen_co_word = os.path.join("resultados", "3_co_word_network.png")
-    if os.path.exists(imagen_general_nube):
+    imagen_general_nube = graficos_req3.get("3_wordcloud_general.png")
+    imagen_co_word = graficos_req3.get("3_co_word_network.png")
+    if imagen_general_nube:
         st.image(imagen_general_nube, caption="Nube de Palabras General", use_column_width=True)
-    if os.path.exists(imagen_co_word):
+    if imagen_co_word:
         st.image(imagen_co_word, caption="Co-word Network", use_column_width=True)
 
 # Requerimiento 5: Agrupamiento por similitud
 st.header("Similitud entre abstracts (Requerimiento 5)")
 if st.button("Calcular similitudes"):
-    calcular_similitud_entre_abstracts(data)
+    st.session_state["similitudes_calculadas"] = True
+if st.session_state.get("similitudes_calculadas"):
+    with cache_app.timed("Similitud TF-IDF"):
+        abstracts, pares = cache_app.similar_abstracts(signature, data)
+    mostrar_similitudes(abstracts, pares)
     st.success("Similitudes calculadas correctamente.")
 
     # Mostrar dendrogramas generados
@@ -99,3 +116,5 @@ st.write(f"Has seleccionado la categoría: **{categoria_seleccionada}**")
 st.write("Elementos de la categoría seleccionada:")
 for item in categorias.CATEGORIAS[categoria_seleccionada]:
     st.markdown(f"- {item}")
+
+cache_app.show_timings()
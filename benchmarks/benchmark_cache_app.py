@@ -0,0 +1,87 @@
+import os
+import sys
+import time
+import logging
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+import cache_app
+
+#############################################
+# BENCHMARK: CAPA DE CACHÉ DE LA APP (FRÍO VS CALIENTE)
+#############################################
+#
+# 1. Cada paso de cache_app con las cachés de Streamlit vacías (frío) y en la
+#    llamada siguiente (caliente).
+# 2. La app completa con streamlit.testing (AppTest): primera ejecución,
+#    botones de categorías y similitudes, y luego una interacción del sidebar,
+#    que no debe recalcular nada.
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+JSON_PATH = os.path.join(ROOT, "processed_articles.json")
+
+def cold_and_warm(call):
+    start = time.perf_counter()
+    call()
+    cold = time.perf_counter() - start
+    start = time.perf_counter()
+    call()
+    return cold, time.perf_counter() - start
+
+def measure_steps():
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    signature = cache_app.source_signature(JSON_PATH)
+    with open(JSON_PATH, "rb") as f:
+        raw = f.read()
+    data = cache_app.load_articles(JSON_PATH, signature)
+    steps = [
+        ("Carga del JSON", lambda: cache_app.load_articles(JSON_PATH, signature)),
+        ("Frecuencias por categoría", lambda: cache_app.category_frequencies(signature, data)),
+        ("Similitud TF-IDF", lambda: cache_app.similar_abstracts(signature, data)),
+        ("Gráficos de estadísticas", lambda: cache_app.statistics_charts(cache_app.content_signature(raw), raw)),
+    ]
+    st.cache_resource.clear()
+    print(f"{'paso':<28} | {'frío':>9} | {'caliente':>9}")
+    for label, call in steps:
+        cold, warm = cold_and_warm(call)
+        print(f"{label:<28} | {cold * 1000:>6.1f} ms | {warm * 1000:>6.2f} ms")
+
+def measure_app(timeout):
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    app = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=timeout)
+    print(f"\n{'ejecución de app.py':<28} | {'total':>9} | pasos")
+    actions = [
+        ("primera (fría)", lambda: None),
+        ("botón categorías", lambda: app.button[0].click()),
+        ("botón similitudes", lambda: app.button[1].click()),
+        ("selector del sidebar", lambda: app.sidebar.selectbox[0].select_index(1)),
+        ("selector del sidebar (2)", lambda: app.sidebar.selectbox[0].select_index(2)),
+    ]
+    for label, action in actions:
+        action()
+        start = time.perf_counter()
+        app.run()
+        total = time.perf_counter() - start
+        if app.exception:
+            raise RuntimeError(app.exception[0].value)
+        steps = ", ".join(f"{name} {seconds * 1000:.1f} ms" for name, seconds in app.session_state["timings"].items())
+        print(f"{label:<28} | {total * 1000:>6.0f} ms | {steps}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Mide la capa de caché de la app de Streamlit.")
+    parser.add_argument("--timeout", type=float, default=300)
+    args = parser.parse_args()
+    # Fuera de `streamlit run` Streamlit avisa que no hay contexto de ejecución
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+    os.chdir(ROOT)
+    measure_steps()
+    measure_app(args.timeout)
+
+if __name__ == "__main__":
+    main()
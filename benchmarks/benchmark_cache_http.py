@@ -0,0 +1,66 @@
+import os
+import sys
+import time
+import asyncio
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from integrate import SEARCH_TERMS, build_search_url, request_headers, parse_results
+from scraper_async import AsyncScraper
+from cache_http import HttpCache
+from servidor_fixtures import start_hosts
+
+#############################################
+# BENCHMARK: SCRAPING SIN CACHÉ, CON CACHÉ FRESCA Y CON REVALIDACIÓN (304)
+#############################################
+
+def run(base_urls, cache, max_pages, rate):
+    """Ejecuta el scraping completo y retorna (artículos, segundos, llamadas al parser)."""
+    parse_calls = 0
+
+    def parse(database, html):
+        nonlocal parse_calls
+        parse_calls += 1
+        return parse_results(database, html)
+
+    scraper = AsyncScraper(
+        page_url=lambda database, term, page: build_search_url(database, term, page, base_urls),
+        parse=parse, headers=request_headers, rate=rate, cache=cache)
+    start = time.perf_counter()
+    articles = asyncio.run(scraper.scrape_all(list(base_urls), SEARCH_TERMS, max_pages))
+    return articles, time.perf_counter() - start, parse_calls
+
+def main():
+    parser = argparse.ArgumentParser(description="Mide el efecto de cache_http sobre un scraping repetido.")
+    parser.add_argument("--latency", type=float, default=0.3, help="Latencia simulada por respuesta (s)")
+    parser.add_argument("--rate", type=float, default=2.0, help="Peticiones por segundo por host")
+    parser.add_argument("--max-pages", type=int, default=3)
+    args = parser.parse_args()
+
+    servers, base_urls = start_hosts(latency_s=args.latency)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        scenarios = [
+            ("Primera ejecución (caché vacía)", HttpCache(cache_dir)),
+            ("Repetición dentro del TTL", HttpCache(cache_dir)),
+            ("Repetición con TTL vencido (304)", HttpCache(cache_dir, ttl_s=0)),
+        ]
+        reference = None
+        print(f"{'Escenario':<34} | {'tiempo':>8} | {'peticiones':>10} | {'304':>4} | {'parseos':>7}")
+        for name, cache in scenarios:
+            before = sum(len(server.request_log) for server in servers.values())
+            not_modified = sum(server.not_modified for server in servers.values())
+            articles, seconds, parse_calls = run(base_urls, cache, args.max_pages, args.rate)
+            requests_made = sum(len(server.request_log) for server in servers.values()) - before
+            not_modified = sum(server.not_modified for server in servers.values()) - not_modified
+            print(f"{name:<34} | {seconds:>6.2f} s | {requests_made:>10} | {not_modified:>4} | {parse_calls:>7}")
+            reference = reference or articles
+            if articles != reference:
+                raise AssertionError(f"'{name}' no produjo los mismos artículos que la primera ejecución")
+    for server in servers.values():
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
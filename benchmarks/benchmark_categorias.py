@@ -0,0 +1,45 @@
+import os
+import sys
+import json
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from requerimiento3 import analyze_category_frequencies, analyze_category_frequencies_naive
+
+#############################################
+# BENCHMARK: CONTEO DE CATEGORÍAS (AHO-CORASICK VS BUCLE ORIGINAL)
+#############################################
+
+def build_corpus(articles, size, seed=42):
+    """Remuestrea los artículos procesados hasta alcanzar el tamaño pedido."""
+    rng = random.Random(seed)
+    return [rng.choice(articles) for _ in range(size)]
+
+def time_call(function, data):
+    start = time.perf_counter()
+    result = function(data)
+    return (time.perf_counter() - start) * 1000, result
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara el conteo de categorías con Aho-Corasick frente al bucle original.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    args = parser.parse_args()
+
+    script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    with open(os.path.join(script_dir, "processed_articles.json"), "r", encoding="utf-8") as f:
+        articles = json.load(f)
+
+    print(f"{'Abstracts':>10} | {'Original (ms)':>14} | {'Aho-Corasick (ms)':>18} | {'Aceleración':>11}")
+    for size in args.sizes:
+        corpus = build_corpus(articles, size)
+        naive_ms, naive_counts = time_call(analyze_category_frequencies_naive, corpus)
+        fast_ms, fast_counts = time_call(analyze_category_frequencies, corpus)
+        if naive_counts != fast_counts:
+            raise AssertionError(f"Los conteos difieren para {size} abstracts.")
+        print(f"{size:>10} | {naive_ms:>14.1f} | {fast_ms:>18.1f} | {naive_ms / fast_ms:>10.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+import collections
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from almacenamiento import SQLiteStorage
+import consultas
+import requerimiento2
+
+#############################################
+# BENCHMARK: SELECT * + PYTHON VS GROUP BY EN EL MOTOR (SQLITE)
+#############################################
+
+def build_articles(size, seed=42):
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "processed_articles.json")
+    with open(path, encoding="utf-8") as f:
+        base = json.load(f)
+    rng = random.Random(seed)
+    types = ["article", "conference", "book", "chapter"]
+    return [dict(rng.choice(base), doi=f"10.0000/bench.{i}", year=str(rng.randint(2010, 2025)),
+                 type=rng.choice(types)) for i in range(size)]
+
+def python_analysis(storage, top_n):
+    """Camino original: todas las filas al cliente y conteos con Counter."""
+    columns = ["year", "author", "journal", "type"]
+    rows = [dict(zip(columns, row)) for row in storage.query("SELECT year, author, journal, type FROM articles")]
+    years = collections.Counter(row["year"] for row in rows if str(row["year"]).isdigit())
+    for row in rows:
+        row["year"] = str(row["year"])
+    return (sorted(years.items()),
+            requerimiento2.count_frequencies(rows, "author", top_n),
+            requerimiento2.count_frequencies(rows, "journal", top_n),
+            requerimiento2.group_by_year_and_type(rows))
+
+def sql_analysis(storage, top_n):
+    return (consultas.year_histogram(storage), consultas.top_authors(storage, top_n),
+            consultas.top_journals(storage, top_n), consultas.group_by_year_and_type(storage))
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara el análisis en Python con las consultas agregadas de consultas.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000, 500000])
+    parser.add_argument("--top-n", type=int, default=15)
+    args = parser.parse_args()
+
+    print(f"{'filas':>8} | {'SELECT * + Python':>17} | {'GROUP BY':>9} | {'speedup':>7}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size in args.rows:
+            storage = SQLiteStorage(os.path.join(tmp_dir, f"articles-{size}.db"))
+            storage.insert_articles(build_articles(size), batch_size=5000)
+
+            start = time.perf_counter()
+            expected = python_analysis(storage, args.top_n)
+            python_s = time.perf_counter() - start
+            start = time.perf_counter()
+            result = sql_analysis(storage, args.top_n)
+            sql_s = time.perf_counter() - start
+
+            # Los empates del top-N se ordenan distinto (Counter: aparición; SQL: alfabético)
+            if result[0] != expected[0] or result[3] != expected[3] or \
+                    [count for _, count in result[1]] != [count for _, count in expected[1]] or \
+                    [count for _, count in result[2]] != [count for _, count in expected[2]]:
+                raise AssertionError(f"Las consultas agregadas no coinciden con el análisis en Python ({size} filas)")
+            print(f"{size:>8} | {python_s:>15.3f} s | {sql_s:>7.3f} s | {python_s / sql_s:>6.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import os
+import sys
+import csv
+import json
+import time
+import random
+import resource
+import argparse
+import tempfile
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from conversion_bibtex import csv_to_bibtex
+
+#############################################
+# BENCHMARK: CSV -> BIBTEX CON ITERROWS VS STREAMING
+#############################################
+#
+# Cada conversión se ejecuta en un proceso aparte (que solo importa lo que usa)
+# para medir su pico de memoria (ru_maxrss) además del tiempo.
+
+COLUMNS = ["Article title", "Authors", "Volume year", "DOI", "URL", "Abstract", "Journal title"]
+
+def pandas_iterrows(csv_file_path, bibtex_file_path):
+    """La implementación original de integrate.csv_to_bibtex."""
+    import pandas as pd
+    df = pd.read_csv(csv_file_path)
+    with open(bibtex_file_path, mode="w", encoding="utf-8") as bib_file:
+        for index, row in df.iterrows():
+            authors = row["Authors"] if isinstance(row["Authors"], str) else "Unknown"
+            year = row["Volume year"] if not pd.isna(row["Volume year"]) else "UnknownYear"
+            bib_key = f"{authors.split(' ')[0]}{year}".replace(" ", "") if isinstance(authors, str) else f"Unknown{year}"
+            bib_file.write(f"@article{{{bib_key},\n")
+            bib_file.write(f"  author = {{{authors}}},\n")
+            bib_file.write(f"  title = {{{row['Article title']}}},\n")
+            bib_file.write(f"  year = {{{year}}},\n")
+            if "Journal title" in row and pd.notna(row["Journal title"]):
+                bib_file.write(f"  journal = {{{row['Journal title']}}},\n")
+            if "DOI" in row and pd.notna(row["DOI"]):
+                bib_file.write(f"  doi = {{{row['DOI']}}},\n")
+            if "URL" in row and pd.notna(row["URL"]):
+                bib_file.write(f"  url = {{{row['URL']}}},\n")
+            bib_file.write("}\n\n")
+
+CONVERTERS = {"iterrows": pandas_iterrows, "streaming": csv_to_bibtex}
+
+def build_csv(path, rows, seed=3):
+    source = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "processed_articles.json")
+    with open(source, encoding="utf-8") as f:
+        base = json.load(f)
+    rng = random.Random(seed)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(COLUMNS)
+        for i in range(rows):
+            article = rng.choice(base)
+            writer.writerow([article["title"] + rng.choice(["", " & Co.", " (50% faster)", " {v2}"]),
+                             article["author"].replace(" and ", ", "), f"Vol. {i % 40}, {article['year']}",
+                             f"10.0000/csv_{i}", article["url"], article["abstract"], article["journal"]])
+
+def check_output(csv_path, bib_path):
+    """La salida en streaming es BibTeX válido: una entrada por fila y claves únicas."""
+    import bibtexparser
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        rows = sum(1 for _ in csv.reader(f)) - 1
+    with open(bib_path, encoding="utf-8") as f:
+        entries = bibtexparser.load(f).entries
+    keys = {entry["ID"] for entry in entries}
+    if len(entries) != rows or len(keys) != rows:
+        raise AssertionError(f"{rows} filas, {len(entries)} entradas, {len(keys)} claves distintas")
+
+def run_child(name, csv_path, bib_path):
+    start = time.perf_counter()
+    CONVERTERS[name](csv_path, bib_path)
+    print(json.dumps({"seconds": time.perf_counter() - start,
+                      "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}))
+
+def measure(name, csv_path, bib_path):
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", name, csv_path, bib_path],
+                            check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara la conversión CSV -> BibTeX con iterrows y en streaming.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000, 500000])
+    parser.add_argument("--child", nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        run_child(*args.child)
+        return
+
+    print(f"{'filas':>8} | {'CSV':>7} | {'iterrows':>18} | {'streaming':>18} | {'speedup':>7}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for rows in args.rows:
+            csv_path = os.path.join(tmp_dir, f"articles-{rows}.csv")
+            build_csv(csv_path, rows)
+            size_mb = os.path.getsize(csv_path) / 2 ** 20
+            results = {name: measure(name, csv_path, os.path.join(tmp_dir, f"{name}-{rows}.bib")) for name in CONVERTERS}
+            if rows <= 10000:
+                check_output(csv_path, os.path.join(tmp_dir, f"streaming-{rows}.bib"))
+            old, new = results["iterrows"], results["streaming"]
+            print(f"{rows:>8} | {size_mb:>4.0f} MB | {old['seconds']:>6.2f} s {old['max_rss_mb']:>6.0f} MB | "
+                  f"{new['seconds']:>6.2f} s {new['max_rss_mb']:>6.0f} MB | {old['seconds'] / new['seconds']:>6.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+import os
+import sys
+import json
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from deduplicacion import (DEFAULT_AUTHOR_THRESHOLD, DEFAULT_TITLE_THRESHOLD, author_tokens, find_near_duplicates,
+                           jaccard, lsh_parameters, overlap, title_shingles)
+
+#############################################
+# BENCHMARK: MINHASH + LSH VS COMPARACIÓN POR PARES
+#############################################
+#
+# Corpus sintético: títulos y autores armados con el vocabulario de
+# processed_articles.json, y una fracción de copias "de otra base de datos"
+# (mayúsculas, puntuación, acentos, una palabra de menos, autores "F. Apellido").
+# Se mide el tiempo y la precisión/recall frente a las copias generadas; en los
+# tamaños pequeños también se compara con la búsqueda exhaustiva O(n²).
+
+def load_vocabulary():
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "processed_articles.json")
+    with open(path, encoding="utf-8") as f:
+        base = json.load(f)
+    words = sorted({word for article in base for word in article["title"].split() if word.isalpha()})
+    names = [name.strip() for article in base for name in article["author"].split(" and ")]
+    return words, sorted({name for name in names if ", " in name})
+
+def variant(entry, rng):
+    """Copia del artículo con el formato de otra base de datos."""
+    words = entry["title"].split()
+    if len(words) > 6 and rng.random() < 0.5:
+        del words[rng.randrange(len(words))]
+    title = " ".join(words)
+    title = rng.choice([title.upper(), title.lower(), title.replace(" ", " - ", 1), "{" + title + "}."])
+    authors = " and ".join(f"{name.split(', ')[1][0]}. {name.split(', ')[0]}"
+                           for name in entry["author"].split(" and "))
+    return {"ID": entry["ID"] + "_copy", "title": title, "author": authors, "doi": "No DOI"}
+
+def build_corpus(size, duplicate_ratio, seed=7):
+    rng = random.Random(seed)
+    words, names = load_vocabulary()
+    originals = [{"ID": f"art{i}", "title": " ".join(rng.choice(words) for _ in range(rng.randint(6, 14))),
+                  "author": " and ".join(rng.sample(names, rng.randint(1, 4))), "doi": f"10.0000/dedup.{i}"}
+                 for i in range(int(size / (1 + duplicate_ratio)))]
+    entries = list(originals)
+    copies = rng.sample(range(len(originals)), size - len(originals))
+    entries.extend(variant(originals[i], rng) for i in copies)
+    rng.shuffle(entries)
+    positions = {entry["ID"]: i for i, entry in enumerate(entries)}
+    expected = {frozenset((positions[f"art{i}"], positions[f"art{i}_copy"])) for i in copies}
+    return entries, expected
+
+def detected_pairs(clusters):
+    return {frozenset((root, i)) for root, members in clusters.items() for i, _ in members}
+
+def pairwise(entries, title_threshold=DEFAULT_TITLE_THRESHOLD, author_threshold=DEFAULT_AUTHOR_THRESHOLD):
+    """Referencia exhaustiva: todos los pares con la misma verificación que find_near_duplicates."""
+    shingles = [title_shingles(entry["title"]) for entry in entries]
+    authors = [author_tokens(entry["author"]) for entry in entries]
+    pairs = set()
+    for i in range(len(entries)):
+        for j in range(i + 1, len(entries)):
+            if authors[i] and authors[j] and overlap(authors[i], authors[j]) < author_threshold:
+                continue
+            if jaccard(shingles[i], shingles[j]) >= title_threshold:
+                pairs.add(frozenset((i, j)))
+    return pairs
+
+def main():
+    parser = argparse.ArgumentParser(description="Mide la detección de casi duplicados con MinHash + LSH.")
+    parser.add_argument("--entries", type=int, nargs="+", default=[2000, 20000, 100000, 300000])
+    parser.add_argument("--duplicates", type=float, default=0.2, help="Fracción de copias sobre los originales.")
+    parser.add_argument("--pairwise-max", type=int, default=2000, help="Tamaño máximo para la comparación O(n²).")
+    args = parser.parse_args()
+
+    bands, rows = lsh_parameters(DEFAULT_TITLE_THRESHOLD)
+    print(f"LSH: {bands} bandas × {rows} filas (umbral de título {DEFAULT_TITLE_THRESHOLD})")
+    print(f"{'entradas':>9} | {'MinHash+LSH':>11} | {'precisión':>9} | {'recall':>6} | {'pares O(n²)':>11}")
+    for size in args.entries:
+        entries, expected = build_corpus(size, args.duplicates)
+        start = time.perf_counter()
+        found = detected_pairs(find_near_duplicates(entries))
+        lsh_s = time.perf_counter() - start
+        precision = len(found & expected) / len(found) if found else 1.0
+        recall = len(found & expected) / len(expected) if expected else 1.0
+        reference = "-"
+        if size <= args.pairwise_max:
+            start = time.perf_counter()
+            exhaustive = pairwise(entries)
+            reference = f"{time.perf_counter() - start:>9.2f} s"
+            if found != exhaustive:
+                print(f"  aviso: LSH omitió {len(exhaustive - found)} de {len(exhaustive)} pares de la búsqueda exhaustiva")
+        print(f"{size:>9} | {lsh_s:>9.2f} s | {precision:>9.3f} | {recall:>6.3f} | {reference:>11}")
+
+if __name__ == "__main__":
+    main()
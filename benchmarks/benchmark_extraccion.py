@@ -0,0 +1,52 @@
+import os
+import sys
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from extractores_html import BACKENDS, extract_articles
+from medicion import benchmark
+
+#############################################
+# BENCHMARK: BACKENDS DE EXTRACCIÓN HTML SOBRE LAS PÁGINAS DE PRUEBA
+#############################################
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+PAGES = {"IEEE": "ieee", "ScienceDirect": "sciencedirect", "Nature": "nature"}
+
+def load_fixtures():
+    """{database: [html, ...]} con todas las páginas de prueba de cada base de datos."""
+    fixtures = {}
+    for database, prefix in PAGES.items():
+        names = sorted(name for name in os.listdir(FIXTURES_DIR) if name.startswith(prefix + "_"))
+        fixtures[database] = []
+        for name in names:
+            with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as f:
+                fixtures[database].append(f.read())
+    return fixtures
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara los backends de extractores_html con el camino BeautifulSoup.")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    fixtures = load_fixtures()
+    print(f"{'Base de datos':<14} {'Backend':<11} | {'mediana/página':>14} | {'vs bs4':>7}")
+    for database, pages in fixtures.items():
+        reference = [extract_articles(database, html, "bs4") for html in pages]
+        baseline = None
+        for backend in ["bs4"] + [name for name in BACKENDS if name != "bs4"]:
+            if [extract_articles(database, html, backend) for html in pages] != reference:
+                raise AssertionError(f"{backend} no extrajo lo mismo que bs4 en {database}")
+
+            def parse_all(_, backend=backend, database=database, pages=pages):
+                for html in pages:
+                    extract_articles(database, html, backend)
+
+            result = benchmark(parse_all, pages, name=backend, repeat=args.repeat, timeout_s=None)
+            per_page = result["median_ms"] / len(pages)
+            baseline = baseline or per_page
+            print(f"{database:<14} {backend:<11} | {per_page:>11.3f} ms | {baseline / per_page:>6.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+import os
+import sys
+import json
+import time
+import random
+import sqlite3
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from carga_masiva import article_row, bulk_insert, ensure_schema, insert_statement
+
+#############################################
+# BENCHMARK: INSERCIÓN FILA A FILA VS CARGA MASIVA POR LOTES
+#############################################
+#
+# Por defecto usa SQLite como sustituto local de MySQL; con --mysql se mide
+# contra el servidor de integrate.DB_CONFIG (la tabla articles se vacía).
+
+def build_articles(size, seed=42):
+    """Artículos remuestreados de processed_articles.json con DOI único."""
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "processed_articles.json")
+    with open(path, encoding="utf-8") as f:
+        base = json.load(f)
+    rng = random.Random(seed)
+    return [dict(rng.choice(base), doi=f"10.0000/bench.{i}") for i in range(size)]
+
+def row_by_row(conn, articles):
+    """Camino original: un cursor.execute por artículo y un commit al final."""
+    sql = insert_statement("sqlite" if isinstance(conn, sqlite3.Connection) else "mysql")
+    cursor = conn.cursor()
+    start = time.perf_counter()
+    for article in articles:
+        cursor.execute(sql, article_row(article))
+    conn.commit()
+    cursor.close()
+    seconds = time.perf_counter() - start
+    return {"rows": len(articles), "seconds": seconds, "rows_per_s": len(articles) / seconds}
+
+def count_rows(conn):
+    cursor = conn.cursor()
+    cursor.execute("SELECT COUNT(*) FROM articles")
+    count = cursor.fetchone()[0]
+    cursor.close()
+    return count
+
+def main():
+    parser = argparse.ArgumentParser(description="Mide filas/s de la inserción original frente a carga_masiva.bulk_insert.")
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--mysql", action="store_true", help="Usa el servidor MySQL de integrate.DB_CONFIG")
+    args = parser.parse_args()
+    articles = build_articles(args.rows)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        def connect():
+            if args.mysql:
+                from integrate import connect_to_db
+                return connect_to_db()
+            return sqlite3.connect(os.path.join(tmp_dir, "articles.db"))
+
+        def reset(conn):
+            ensure_schema(conn)
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM articles")
+            conn.commit()
+            cursor.close()
+
+        conn = connect()
+        print(f"{'Método':<32} | {'filas':>7} | {'tiempo':>8} | {'filas/s':>9}")
+        reset(conn)
+        stats = row_by_row(conn, articles)
+        print(f"{'Fila a fila (original)':<32} | {stats['rows']:>7} | {stats['seconds']:>6.2f} s | {stats['rows_per_s']:>9.0f}")
+        for batch_size in args.batch_sizes:
+            reset(conn)
+            stats = bulk_insert(conn, articles, batch_size=batch_size, upsert=True)
+            print(f"{f'Lotes de {batch_size} (upsert)':<32} | {stats['rows']:>7} | {stats['seconds']:>6.2f} s | {stats['rows_per_s']:>9.0f}")
+        # Repetir la carga no debe duplicar filas: el DOI las identifica
+        stats = bulk_insert(conn, articles, batch_size=args.batch_sizes[-1], upsert=True)
+        print(f"{'Re-ejecución (upsert por clave)':<32} | {stats['rows']:>7} | {stats['seconds']:>6.2f} s | {stats['rows_per_s']:>9.0f}")
+        if count_rows(conn) != len(articles):
+            raise AssertionError("La re-ejecución con upsert duplicó artículos")
+        conn.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import os
+import sys
+import argparse
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ordenamiento_paralelo import parallel_merge_sort, shutdown_pools
+from medicion import benchmark
+
+#############################################
+# BENCHMARK: ESCALAMIENTO DEL MERGE SORT PARALELO CON EL NÚMERO DE WORKERS
+#############################################
+
+def worker_counts(maximum):
+    """1, 2, 4, ... hasta `maximum` (incluido)."""
+    counts = []
+    workers = 1
+    while workers < maximum:
+        counts.append(workers)
+        workers *= 2
+    return counts + [maximum]
+
+def main():
+    parser = argparse.ArgumentParser(description="Mide el speedup de parallel_merge_sort según el número de workers.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000000, 4000000])
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--inner", default="TimSort", help="Algoritmo de ordenamientoDos para cada fragmento")
+    parser.add_argument("--list", action="store_true", help="Ordena listas de Python en lugar de np.ndarray")
+    parser.add_argument("--timeout", type=float, default=120.0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    print(f"{'n':>9} {'workers':>8} | {'mediana':>12} | {'speedup':>8}")
+    for size in args.sizes:
+        data = rng.integers(0, 10 ** 9, size)
+        data = data.tolist() if args.list else data
+        expected = np.sort(data)
+        base = None
+        for workers in worker_counts(args.max_workers):
+            def sort(arr, workers=workers):
+                return parallel_merge_sort(arr, workers=workers, inner=args.inner)
+            if not np.array_equal(sort(data), expected):
+                raise AssertionError(f"parallel_merge_sort no ordenó correctamente con {workers} workers")
+            result = benchmark(sort, data, repeat=3, timeout_s=args.timeout)
+            if result["status"] != "ok":
+                print(f"{size:>9} {workers:>8} | {result['status']:>12} |")
+                continue
+            base = base or result["median_ms"]
+            print(f"{size:>9} {workers:>8} | {result['median_ms']:>9.1f} ms | {base / result['median_ms']:>7.2f}x")
+    shutdown_pools()
+
+if __name__ == "__main__":
+    main()
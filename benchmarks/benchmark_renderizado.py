@@ -0,0 +1,50 @@
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lector_articulos import iter_articles
+from requerimiento2 import render_statistics
+
+#############################################
+# BENCHMARK: RENDERIZADO EN MEMORIA Y SESIONES CONCURRENTES
+#############################################
+#
+# Renderiza los gráficos de requerimiento2 una vez en secuencia y luego desde
+# --sessions hilos a la vez (como varias sesiones de Streamlit). Con la API
+# orientada a objetos cada hilo tiene sus propias figuras: los PNG de cada
+# sesión deben ser idénticos a los de la ejecución secuencial.
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+JSON_PATH = os.path.join(ROOT, "processed_articles.json")
+
+def render(limit):
+    with open(JSON_PATH, "rb") as f:
+        return render_statistics(iter_articles(f, limit=limit))
+
+def main():
+    parser = argparse.ArgumentParser(description="Mide el renderizado en memoria de los gráficos.")
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--limit", type=int, default=1000)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    expected = render(args.limit)
+    sequential = time.perf_counter() - start
+    print(f"secuencial: {sequential * 1000:.0f} ms, {sum(len(png) for png in expected.values()) / 1024:.0f} KiB en memoria")
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(args.sessions) as pool:
+        results = list(pool.map(render, [args.limit] * args.sessions))
+    concurrent = time.perf_counter() - start
+    print(f"{args.sessions} sesiones concurrentes: {concurrent * 1000:.0f} ms")
+    mismatches = sum(result != expected for result in results)
+    if mismatches:
+        raise AssertionError(f"{mismatches} sesiones generaron gráficos distintos a la ejecución secuencial")
+    print("Todas las sesiones generaron los mismos PNG que la ejecución secuencial.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import os
+import sys
+import time
+import argparse
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from integrate import SEARCH_TERMS, build_search_url, request_headers, parse_results, run_scraper
+from servidor_fixtures import start_hosts
+
+#############################################
+# BENCHMARK: SCRAPER SECUENCIAL VS MOTOR ASÍNCRONO (SERVIDOR LOCAL)
+#############################################
+
+def sequential_scraper(base_urls, max_pages, sleep_s):
+    """Recorrido original: una petición bloqueante tras otra con una pausa fija."""
+    articles = []
+    for database in base_urls:
+        for term in SEARCH_TERMS:
+            for page in range(1, max_pages + 1):
+                url = build_search_url(database, term, page, base_urls)
+                response = requests.get(url, headers=request_headers(url))
+                found = parse_results(database, response.text) if response.status_code == 200 else []
+                time.sleep(sleep_s)
+                if not found:
+                    break
+                articles.extend(found)
+    return articles
+
+def max_host_rate(request_log):
+    """Mayor tasa observada (peticiones/s) entre peticiones consecutivas a un host."""
+    times = [t for t, _, _ in request_log]
+    gaps = [b - a for a, b in zip(times, times[1:])]
+    return 1 / min(gaps) if gaps and min(gaps) > 0 else float("nan")
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara el scraping secuencial con scraper_async contra páginas locales.")
+    parser.add_argument("--latency", type=float, default=0.3, help="Latencia simulada por respuesta (s)")
+    parser.add_argument("--rate", type=float, default=2.0, help="Peticiones por segundo por host (motor asíncrono)")
+    parser.add_argument("--max-pages", type=int, default=3)
+    parser.add_argument("--fail-every", type=int, default=0, help="El servidor responde 503 a una de cada N peticiones")
+    args = parser.parse_args()
+    sleep_s = 1 / args.rate
+
+    servers, base_urls = start_hosts(latency_s=args.latency)
+    start = time.perf_counter()
+    sequential = sequential_scraper(base_urls, args.max_pages, sleep_s)
+    sequential_s = time.perf_counter() - start
+    for server in servers.values():
+        server.shutdown()
+
+    servers, base_urls = start_hosts(latency_s=args.latency, fail_every=args.fail_every)
+    start = time.perf_counter()
+    concurrent = run_scraper(base_urls=base_urls, max_pages=args.max_pages, rate=args.rate, backoff_s=0.1,
+                             cache=None)
+    concurrent_s = time.perf_counter() - start
+    for server in servers.values():
+        server.shutdown()
+
+    print(f"Secuencial (pausa {sleep_s:.2f} s): {len(sequential)} artículos en {sequential_s:.2f} s")
+    print(f"Asíncrono ({args.rate} req/s por host): {len(concurrent)} artículos en {concurrent_s:.2f} s "
+          f"({sequential_s / concurrent_s:.1f}x)")
+    for database, server in servers.items():
+        print(f"  {database}: {len(server.request_log)} peticiones, "
+              f"tasa máxima observada {max_host_rate(server.request_log):.2f} req/s")
+    if not args.fail_every and sequential != concurrent:
+        raise AssertionError("El motor asíncrono no produjo los mismos artículos que el recorrido secuencial")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+import contextlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bibtexparser
+
+from benchmark_deduplicacion import build_corpus
+import integrate
+
+#############################################
+# BENCHMARK: UNIFICACIÓN COMPLETA VS INCREMENTAL
+#############################################
+#
+# Carpeta con --files archivos .bib (corpus sintético de benchmark_deduplicacion,
+# con copias repartidas entre archivos). Se mide la unificación completa
+# original y la incremental en tres situaciones: primera ejecución, ejecución
+# sin cambios y ejecución tras agregar un archivo nuevo.
+
+def write_bib(path, entries):
+    database = bibtexparser.bibdatabase.BibDatabase()
+    database.entries = [dict(entry, ENTRYTYPE="article") for entry in entries]
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(bibtexparser.bwriter.BibTexWriter().write(database))
+
+def timed_unify(folder, incremental):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(open(os.devnull, "w")):
+        integrate.unify_bibtex_files(folder, incremental=incremental)
+    return time.perf_counter() - start
+
+def unified_ids(folder):
+    return sorted(entry["ID"] for entry in integrate.load_bibtex_file(os.path.join(folder, "unified_references.bib")))
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara la unificación BibTeX completa con la incremental.")
+    parser.add_argument("--files", type=int, default=20)
+    parser.add_argument("--entries-per-file", type=int, default=1000)
+    args = parser.parse_args()
+
+    entries, _ = build_corpus(args.files * args.entries_per_file + args.entries_per_file, 0.2)
+    chunks = [entries[i:i + args.entries_per_file] for i in range(0, len(entries), args.entries_per_file)]
+    with tempfile.TemporaryDirectory() as full_dir, tempfile.TemporaryDirectory() as incremental_dir:
+        for folder in (full_dir, incremental_dir):
+            for i, chunk in enumerate(chunks[:-1]):
+                write_bib(os.path.join(folder, f"export_{i:03d}.bib"), chunk)
+
+        print(f"{args.files} archivos × {args.entries_per_file} entradas")
+        print(f"{'ejecución':<22} | {'completa':>9} | {'incremental':>11}")
+        for label, new_file in (("primera", False), ("sin cambios", False), ("un archivo nuevo", True)):
+            if new_file:
+                for folder in (full_dir, incremental_dir):
+                    write_bib(os.path.join(folder, "export_new.bib"), chunks[-1])
+            full_s = timed_unify(full_dir, incremental=False)
+            incremental_s = timed_unify(incremental_dir, incremental=True)
+            print(f"{label:<22} | {full_s:>7.2f} s | {incremental_s:>9.2f} s")
+        if unified_ids(full_dir) != unified_ids(incremental_dir):
+            raise AssertionError("La unificación incremental no coincide con la completa")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import os
+import sys
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ordenamientoDos import (tree_sort, quicksort, bitonic_sort,
+                             tree_sort_iterative, quicksort_introsort, bitonic_sort_inplace)
+from medicion import benchmark
+
+#############################################
+# BENCHMARK: VERSIONES ORIGINALES VS VARIANTES ITERATIVAS
+#############################################
+
+PAIRS = [
+    ("Tree Sort", tree_sort, tree_sort_iterative),
+    ("Quick Sort", quicksort, quicksort_introsort),
+    ("Bitonic Sort", bitonic_sort, bitonic_sort_inplace),
+]
+
+def build_inputs(size, seed=42):
+    """Entradas aleatoria, ordenada, inversa y con muchos duplicados (como la columna 'Año')."""
+    rng = random.Random(seed)
+    values = [rng.randint(0, 10 ** 6) for _ in range(size)]
+    return {
+        "aleatoria": values,
+        "ordenada": sorted(values),
+        "inversa": sorted(values, reverse=True),
+        "duplicados": [rng.choice([2023, 2024, 2025]) for _ in range(size)],
+    }
+
+def describe(result):
+    if result["status"] != "ok":
+        return f"{result['status']:>12}"
+    return f"{result['median_ms']:>9.2f} ms"
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara tree/quick/bitonic sort originales con sus variantes iterativas.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 4096, 10000])
+    parser.add_argument("--timeout", type=float, default=10.0)
+    args = parser.parse_args()
+
+    print(f"{'Algoritmo':<14} {'Entrada':<11} {'n':>7} | {'Original':>12} | {'Iterativa':>12}")
+    for size in args.sizes:
+        for input_name, data in build_inputs(size).items():
+            expected = sorted(data)
+            for name, original, variant in PAIRS:
+                if variant(list(data)) != expected:
+                    raise AssertionError(f"{variant.__name__} no ordenó correctamente la entrada {input_name}")
+                old = benchmark(original, data, repeat=3, timeout_s=args.timeout)
+                new = benchmark(variant, data, repeat=3, timeout_s=args.timeout)
+                # La versión original de bitonic solo ordena bien longitudes potencia de dos
+                if old["status"] == "ok" and original(list(data)) != expected:
+                    old = dict(old, status="incorrecto")
+                print(f"{name:<14} {input_name:<11} {size:>7} | {describe(old)} | {describe(new)}")
+
+if __name__ == "__main__":
+    main()
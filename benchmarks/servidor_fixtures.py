@@ -0,0 +1,129 @@
+import os
+import sys
+import time
+import hashlib
+import argparse
+import threading
+from urllib.parse import urlsplit, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+#############################################
+# SERVIDOR HTTP LOCAL CON PÁGINAS DE PRUEBA (IEEE / SCIENCEDIRECT / NATURE)
+#############################################
+#
+# Sirve las páginas de benchmarks/fixtures imitando la paginación de cada sitio
+# (pageNumber, offset de 25 en 25, page). Las páginas sin fixture devuelven una
+# página sin resultados. Permite simular latencia y errores 503 con Retry-After
+# para ejercitar los límites de tasa y los reintentos de scraper_async. Cada
+# página lleva ETag y Last-Modified y responde 304 a las peticiones condicionales
+# que coinciden (para cache_http).
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+ROUTES = {
+    "/ieee": ("ieee", lambda query: int(query.get("pageNumber", ["1"])[0])),
+    "/sciencedirect": ("sciencedirect", lambda query: int(query.get("offset", ["0"])[0]) // 25 + 1),
+    "/nature": ("nature", lambda query: int(query.get("page", ["1"])[0])),
+}
+
+def fixture_page(prefix, page):
+    """Retorna (cuerpo, mtime) de la página de prueba."""
+    path = os.path.join(FIXTURES_DIR, f"{prefix}_{page}.html")
+    if not os.path.exists(path):
+        path = os.path.join(FIXTURES_DIR, "sin_resultados.html")
+    with open(path, "rb") as f:
+        return f.read(), os.path.getmtime(path)
+
+class FixtureHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        server = self.server
+        parts = urlsplit(self.path)
+        with server.lock:
+            server.request_log.append((time.monotonic(), parts.path, self.path))
+            server.request_count += 1
+            fail = server.fail_every and server.request_count % server.fail_every == 0
+        if parts.path not in ROUTES:
+            self.send_error(404)
+            return
+        if server.latency_s:
+            time.sleep(server.latency_s)
+        if fail:
+            self.send_response(503)
+            self.send_header("Retry-After", "0")
+            self.end_headers()
+            return
+        prefix, page_of = ROUTES[parts.path]
+        body, mtime = fixture_page(prefix, page_of(parse_qs(parts.query)))
+        etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+        if self.headers.get("If-None-Match") == etag:
+            with server.lock:
+                server.not_modified += 1
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", self.date_time_string(mtime))
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+def start_server(port=0, latency_s=0.0, fail_every=0, verbose=False):
+    """
+    Inicia el servidor en un hilo y retorna (servidor, base_urls). base_urls
+    tiene la misma forma que integrate.BASE_URLS. fail_every=N responde 503 a
+    una de cada N peticiones. servidor.request_log guarda (instante, ruta, url)
+    y servidor.not_modified cuenta las respuestas 304.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", port), FixtureHandler)
+    server.daemon_threads = True
+    server.latency_s = latency_s
+    server.fail_every = fail_every
+    server.verbose = verbose
+    server.lock = threading.Lock()
+    server.request_log = []
+    server.request_count = 0
+    server.not_modified = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    root = f"http://127.0.0.1:{server.server_address[1]}"
+    base_urls = {
+        "IEEE": f"{root}/ieee?queryText=",
+        "ScienceDirect": f"{root}/sciencedirect?qs=",
+        "Nature": f"{root}/nature?q=",
+    }
+    return server, base_urls
+
+def start_hosts(latency_s=0.0, fail_every=0, verbose=False):
+    """
+    Un servidor (puerto, y por tanto host) por base de datos, como en los
+    sitios reales, para que cada uno tenga su propio límite de tasa.
+    Retorna ({database: servidor}, base_urls).
+    """
+    servers = {}
+    base_urls = {}
+    for database in ("IEEE", "ScienceDirect", "Nature"):
+        servers[database], urls = start_server(0, latency_s, fail_every, verbose)
+        base_urls[database] = urls[database]
+    return servers, base_urls
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Servidor local con páginas de resultados de prueba.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Segundos de espera por respuesta")
+    parser.add_argument("--fail-every", type=int, default=0, help="Responde 503 a una de cada N peticiones")
+    args = parser.parse_args()
+    server, base_urls = start_server(args.port, args.latency, args.fail_every, verbose=True)
+    for database, url in base_urls.items():
+        print(f"{database}: {url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+        sys.exit(0)
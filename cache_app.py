@@ -0,0 +1,103 @@
+import io
+import os
+import time
+import hashlib
+import contextlib
+import streamlit as st
+
+from almacen_articulos import load_store
+from lector_articulos import iter_articles
+from renderizado import persist
+from requerimiento2 import render_statistics
+from requerimiento3 import analyze_category_frequencies, render_category_charts
+from requerimiento5 import top_similar_abstracts
+
+#############################################
+# CAPA DE CACHÉ DE LA APP DE STREAMLIT
+#############################################
+#
+# Streamlit vuelve a ejecutar app.py completo en cada interacción (un widget
+# del sidebar, un botón, ...). Los pasos costosos se envuelven aquí para que
+# solo se calculen cuando cambian sus entradas:
+#   - st.cache_resource para objetos grandes de solo lectura que se comparten
+#     sin copiarse (los artículos cargados, el modelo TF-IDF y sus pares);
+#   - st.cache_data para resultados pequeños que se devuelven copiados (conteos
+#     por categoría, PNG de los gráficos).
+# Las claves son firmas baratas de la entrada (ruta + mtime + tamaño del JSON,
+# sha256 del archivo subido); los datos van en parámetros con "_" inicial,
+# que Streamlit no hashea, para no recorrer el corpus en cada ejecución.
+
+def source_signature(json_path):
+    """Firma del archivo fuente: cambia si el archivo se reemplaza o modifica."""
+    stat = os.stat(json_path)
+    return f"{os.path.abspath(json_path)}:{stat.st_mtime_ns}:{stat.st_size}"
+
+def content_signature(raw):
+    return hashlib.sha256(raw).hexdigest()
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def load_articles(json_path, signature):
+    """Artículos del almacén columnar (lista compartida: no debe modificarse)."""
+    return load_store(json_path).records()
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def uploaded_articles(signature, _raw, limit=1000):
+    """Primeros `limit` artículos del JSON subido (`_raw`, bytes); reemplazan a los del archivo local."""
+    return list(iter_articles(io.BytesIO(_raw), limit=limit))
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def category_frequencies(signature, _data):
+    """{categoría: Counter(variable: apariciones)} de requerimiento3."""
+    return analyze_category_frequencies(_data)
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def similar_abstracts(signature, _data, top_n=5, max_memory_mb=256):
+    """(abstracts, pares más similares) de requerimiento5; el TF-IDF se ajusta una vez por corpus."""
+    return top_similar_abstracts(_data, top_n, max_memory_mb)
+
+# Gráficos de requerimiento2.render_statistics, en orden de presentación
+STATISTICS_CHARTS = ["2_yearly_trends.png", "2_top_authors.png", "2_top_journals.png", "2_top_publishers.png"]
+
+# Si está definida, los gráficos también se guardan en esta carpeta con nombre
+# por contenido (renderizado.persist); la app los muestra igual desde memoria.
+CHARTS_DIR = os.environ.get("APP_CHARTS_DIR")
+
+def _persisted(charts):
+    if CHARTS_DIR:
+        for png in charts.values():
+            persist(png, CHARTS_DIR)
+    return charts
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def statistics_charts(signature, _raw, limit=1000):
+    """
+    Gráficos de requerimiento2 para el JSON subido (`_raw`, bytes) como
+    {nombre del archivo: PNG en bytes}. Se renderizan en memoria, sin pasar
+    por resultados/, así dos sesiones con archivos distintos no se pisan.
+    """
+    return _persisted(render_statistics(iter_articles(io.BytesIO(_raw), limit=limit)))
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def category_charts(signature, _data):
+    """Gráficos de requerimiento3 (barras, nubes y co-word network) como {nombre: PNG en bytes}."""
+    return _persisted(render_category_charts(category_frequencies(signature, _data)))
+
+#############################################
+# TIEMPOS POR PASO
+#############################################
+
+@contextlib.contextmanager
+def timed(label):
+    """Registra en st.session_state["timings"] cuánto tardó `label` en esta ejecución."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        st.session_state.setdefault("timings", {})[label] = time.perf_counter() - start
+
+def show_timings():
+    timings = st.session_state.get("timings", {})
+    if timings:
+        with st.sidebar.expander("Tiempos de la última ejecución"):
+            for label, seconds in timings.items():
+                st.write(f"{label}: {seconds * 1000:.1f} ms")
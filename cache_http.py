@@ -0,0 +1,199 @@
+import os
+import json
+import time
+import shutil
+import hashlib
+import tempfile
+import threading
+from email.utils import formatdate
+
+#############################################
+# CACHÉ HTTP EN DISCO CON PETICIONES CONDICIONALES
+#############################################
+#
+# Cada URL tiene una entrada (directorio <sha256(url)>) con:
+#   - body.html: el último cuerpo recibido;
+#   - meta.json: ETag, Last-Modified, instante de descarga y sha256 del cuerpo;
+#   - parsed.json: artículos extraídos de ese cuerpo, el hash con que se
+#     extrajeron y el extractor usado (extractores_html.parser_key).
+# Mientras la entrada tiene menos de `ttl_s` segundos se usa sin ir a la red;
+# después se revalida con If-None-Match / If-Modified-Since, y un 304 solo
+# renueva la entrada. Si el cuerpo (nuevo o revalidado) tiene el mismo hash
+# que el último extraído y el extractor es el mismo (backend y versión de los
+# selectores), se reutilizan los artículos sin volver a parsear.
+# El tamaño total se limita eliminando las entradas menos usadas (LRU por mtime).
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE_DIR = os.path.join(SCRIPT_DIR, ".cache", "http")
+DEFAULT_TTL_S = 24 * 3600
+DEFAULT_MAX_CACHE_MB = 256
+
+class CachedResponse:
+    """Respuesta mínima (status_code, text) con el hash del cuerpo y su origen."""
+
+    def __init__(self, status_code, text, body_sha256=None, source="network", headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.body_sha256 = body_sha256
+        self.source = source  # "network", "cache" (fresca) o "revalidated" (304)
+        self.headers = headers or {}
+
+def url_key(url):
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+def _write_atomic(path, data):
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", dir=os.path.dirname(path))
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def _entry_size(entry_dir):
+    return sum(entry.stat().st_size for entry in os.scandir(entry_dir) if entry.is_file())
+
+def evict_lru(cache_dir=DEFAULT_CACHE_DIR, max_cache_mb=DEFAULT_MAX_CACHE_MB, keep=None):
+    """
+    Elimina las entradas menos usadas recientemente hasta que la caché quede
+    por debajo de max_cache_mb. La entrada `keep` nunca se elimina.
+    """
+    if not os.path.isdir(cache_dir):
+        return
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.is_dir() and not entry.name.startswith("."):
+            entries.append((entry.stat().st_mtime, entry.name, _entry_size(entry.path)))
+    total = sum(size for _, _, size in entries)
+    limit = max_cache_mb * 1024 * 1024
+    for _, name, size in sorted(entries):
+        if total <= limit:
+            break
+        if name == keep:
+            continue
+        shutil.rmtree(os.path.join(cache_dir, name), ignore_errors=True)
+        total -= size
+
+class HttpCache:
+    """Caché de respuestas por URL; segura entre hilos de un mismo proceso."""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, ttl_s=DEFAULT_TTL_S, max_cache_mb=DEFAULT_MAX_CACHE_MB):
+        self.cache_dir = cache_dir
+        self.ttl_s = ttl_s
+        self.max_cache_mb = max_cache_mb
+        self._lock = threading.Lock()
+
+    def _entry_dir(self, url):
+        return os.path.join(self.cache_dir, url_key(url))
+
+    def _read_meta(self, entry_dir):
+        try:
+            with open(os.path.join(entry_dir, "meta.json"), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _read_body(self, entry_dir):
+        with open(os.path.join(entry_dir, "body.html"), "rb") as f:
+            return f.read().decode("utf-8")
+
+    def _write_meta(self, entry_dir, meta):
+        _write_atomic(os.path.join(entry_dir, "meta.json"), json.dumps(meta).encode("utf-8"))
+        # El mtime del directorio marca el último uso para la expulsión LRU
+        os.utime(entry_dir, None)
+
+    def _store(self, url, response):
+        entry_dir = self._entry_dir(url)
+        body = response.text.encode("utf-8")
+        meta = {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+            "body_sha256": hashlib.sha256(body).hexdigest(),
+        }
+        with self._lock:
+            os.makedirs(entry_dir, exist_ok=True)
+            _write_atomic(os.path.join(entry_dir, "body.html"), body)
+            self._write_meta(entry_dir, meta)
+            evict_lru(self.cache_dir, self.max_cache_mb, keep=os.path.basename(entry_dir))
+        return meta
+
+    def fresh(self, url):
+        """CachedResponse de la entrada si tiene menos de ttl_s segundos; si no, None."""
+        entry_dir = self._entry_dir(url)
+        meta = self._read_meta(entry_dir)
+        if meta is None or time.time() - meta["fetched_at"] >= self.ttl_s:
+            return None
+        try:
+            body = self._read_body(entry_dir)
+            os.utime(entry_dir, None)
+        except OSError:
+            return None
+        return CachedResponse(200, body, meta["body_sha256"], "cache")
+
+    def get(self, session, url, headers=None, timeout=None):
+        """
+        Equivalente a session.get(url) con caché. Retorna un CachedResponse; las
+        respuestas distintas de 200/304 se retornan sin almacenarse.
+        """
+        cached = self.fresh(url)
+        if cached is not None:
+            return cached
+        entry_dir = self._entry_dir(url)
+        meta = self._read_meta(entry_dir)
+        request_headers = dict(headers or {})
+        if meta is not None:
+            if meta.get("etag"):
+                request_headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                request_headers["If-Modified-Since"] = meta["last_modified"]
+            elif not meta.get("etag"):
+                request_headers["If-Modified-Since"] = formatdate(meta["fetched_at"], usegmt=True)
+
+        response = session.get(url, headers=request_headers, timeout=timeout)
+        if response.status_code == 304 and meta is not None:
+            try:
+                body = self._read_body(entry_dir)
+            except OSError:
+                # La entrada se expulsó entre la lectura y la revalidación: se descarga de nuevo
+                self.forget(url)
+                return self.get(session, url, headers, timeout)
+            meta["fetched_at"] = time.time()
+            meta["etag"] = response.headers.get("ETag", meta.get("etag"))
+            meta["last_modified"] = response.headers.get("Last-Modified", meta.get("last_modified"))
+            with self._lock:
+                self._write_meta(entry_dir, meta)
+            return CachedResponse(200, body, meta["body_sha256"], "revalidated", response.headers)
+        if response.status_code != 200:
+            return CachedResponse(response.status_code, response.text, source="network", headers=response.headers)
+        meta = self._store(url, response)
+        return CachedResponse(200, response.text, meta["body_sha256"], "network", response.headers)
+
+    def forget(self, url):
+        shutil.rmtree(self._entry_dir(url), ignore_errors=True)
+
+    def parse(self, url, response, parse, parser_key=None):
+        """
+        Retorna parse(response.text), reutilizando el resultado guardado si el
+        cuerpo tiene el mismo hash que la última vez que se extrajo y se
+        extrajo con el mismo parser_key (p. ej. extractores_html.parser_key()).
+        """
+        if response.body_sha256 is None:
+            return parse(response.text)
+        path = os.path.join(self._entry_dir(url), "parsed.json")
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+            if saved["body_sha256"] == response.body_sha256 and saved.get("parser") == parser_key:
+                return saved["articles"]
+        except (OSError, ValueError, KeyError):
+            pass
+        articles = parse(response.text)
+        try:
+            with self._lock:
+                _write_atomic(path, json.dumps({"body_sha256": response.body_sha256, "parser": parser_key,
+                                                "articles": articles}, ensure_ascii=False).encode("utf-8"))
+        except OSError:
+            pass
+        return articles
+
+    def clear(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
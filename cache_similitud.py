@@ -0,0 +1,139 @@
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+import numpy as np
+import scipy.sparse
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from similitud import top_k_similar_pairs
+
+#############################################
+# CACHÉ EN DISCO DE MODELOS TF-IDF Y PARES SIMILARES
+#############################################
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE_DIR = os.path.join(SCRIPT_DIR, ".cache", "tfidf")
+DEFAULT_MAX_CACHE_MB = 512
+
+# Parámetros del vectorizador usados por requerimiento5
+DEFAULT_VECTORIZER_PARAMS = {"stop_words": "english"}
+
+def corpus_key(abstracts, vectorizer_params):
+    """
+    Hash del contenido de los abstracts más los parámetros del vectorizador.
+    Cualquier cambio en el corpus o en la configuración produce otra entrada.
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps(vectorizer_params, sort_keys=True, default=repr).encode("utf-8"))
+    for abstract in abstracts:
+        encoded = abstract.encode("utf-8")
+        # Se antepone la longitud para que ["ab", "c"] y ["a", "bc"] no colisionen
+        digest.update(len(encoded).to_bytes(8, "little"))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+def _entry_size(entry_dir):
+    return sum(entry.stat().st_size for entry in os.scandir(entry_dir) if entry.is_file())
+
+def _touch(entry_dir):
+    """Marca la entrada como usada recientemente (la antigüedad se mide por mtime)."""
+    os.utime(entry_dir, None)
+
+def evict_lru(cache_dir=DEFAULT_CACHE_DIR, max_cache_mb=DEFAULT_MAX_CACHE_MB, keep=None):
+    """
+    Elimina las entradas menos usadas recientemente hasta que el tamaño total
+    de la caché quede por debajo de max_cache_mb. La entrada `keep` nunca se elimina.
+    """
+    if not os.path.isdir(cache_dir):
+        return
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.is_dir() and not entry.name.startswith("."):
+            entries.append((entry.stat().st_mtime, entry.name, _entry_size(entry.path)))
+    total = sum(size for _, _, size in entries)
+    limit = max_cache_mb * 1024 * 1024
+    for _, name, size in sorted(entries):
+        if total <= limit:
+            break
+        if name == keep:
+            continue
+        shutil.rmtree(os.path.join(cache_dir, name), ignore_errors=True)
+        total -= size
+
+def _save_model(entry_dir, vectorizer, X):
+    """Escribe vocabulario, idf y matriz en un directorio temporal y lo publica de forma atómica."""
+    os.makedirs(os.path.dirname(entry_dir), exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(prefix=".tmp-", dir=os.path.dirname(entry_dir))
+    with open(os.path.join(tmp_dir, "vocabulary.json"), "w", encoding="utf-8") as f:
+        json.dump({term: int(index) for term, index in vectorizer.vocabulary_.items()}, f)
+    np.save(os.path.join(tmp_dir, "idf.npy"), vectorizer.idf_)
+    scipy.sparse.save_npz(os.path.join(tmp_dir, "matrix.npz"), X.tocsr())
+    try:
+        os.replace(tmp_dir, entry_dir)
+    except OSError:
+        # Otro proceso publicó la misma entrada primero
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+def _load_model(entry_dir, vectorizer_params):
+    with open(os.path.join(entry_dir, "vocabulary.json"), "r", encoding="utf-8") as f:
+        vocabulary = json.load(f)
+    vectorizer = TfidfVectorizer(**vectorizer_params)
+    vectorizer.vocabulary_ = vocabulary
+    vectorizer.idf_ = np.load(os.path.join(entry_dir, "idf.npy"))
+    X = scipy.sparse.load_npz(os.path.join(entry_dir, "matrix.npz")).tocsr()
+    return vectorizer, X
+
+def load_or_fit_tfidf(abstracts, vectorizer_params=None, cache_dir=DEFAULT_CACHE_DIR,
+                      max_cache_mb=DEFAULT_MAX_CACHE_MB):
+    """
+    Retorna (vectorizer, X, key). Si el corpus ya fue vectorizado con los mismos
+    parámetros, se cargan vocabulario, idf y matriz dispersa desde disco; si no,
+    se ajusta el TfidfVectorizer y se guarda el resultado.
+    """
+    vectorizer_params = dict(DEFAULT_VECTORIZER_PARAMS if vectorizer_params is None else vectorizer_params)
+    key = corpus_key(abstracts, vectorizer_params)
+    entry_dir = os.path.join(cache_dir, key)
+
+    if os.path.isdir(entry_dir):
+        try:
+            vectorizer, X = _load_model(entry_dir, vectorizer_params)
+            _touch(entry_dir)
+            return vectorizer, X, key
+        except (OSError, ValueError) as e:
+            print(f"[Cache] Entrada corrupta {key[:12]}, se recalcula: {e}")
+            shutil.rmtree(entry_dir, ignore_errors=True)
+
+    vectorizer = TfidfVectorizer(**vectorizer_params)
+    X = vectorizer.fit_transform(abstracts)
+    _save_model(entry_dir, vectorizer, X)
+    evict_lru(cache_dir, max_cache_mb, keep=key)
+    return vectorizer, X, key
+
+def load_or_compute_top_pairs(X, key, top_n=5, max_memory_mb=256, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Retorna los top_n pares más similares de la entrada `key`, calculándolos con
+    top_k_similar_pairs solo si no están guardados para ese top_n.
+    """
+    entry_dir = os.path.join(cache_dir, key)
+    pairs_path = os.path.join(entry_dir, f"pairs_{top_n}.json")
+
+    if os.path.exists(pairs_path):
+        with open(pairs_path, "r", encoding="utf-8") as f:
+            return [tuple(pair) for pair in json.load(f)]
+
+    pairs = top_k_similar_pairs(X, top_n=top_n, max_memory_mb=max_memory_mb)
+    if os.path.isdir(entry_dir):
+        tmp_path = pairs_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(pairs, f)
+        os.replace(tmp_path, pairs_path)
+    return pairs
+
+def cached_similarity(abstracts, top_n=5, max_memory_mb=256, vectorizer_params=None,
+                      cache_dir=DEFAULT_CACHE_DIR, max_cache_mb=DEFAULT_MAX_CACHE_MB):
+    """Atajo que combina ambas cachés: retorna (vectorizer, X, pares)."""
+    vectorizer, X, key = load_or_fit_tfidf(abstracts, vectorizer_params, cache_dir, max_cache_mb)
+    pairs = load_or_compute_top_pairs(X, key, top_n, max_memory_mb, cache_dir)
+    return vectorizer, X, pairs
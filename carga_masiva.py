@@ -0,0 +1,271 @@
+import time
+import hashlib
+import sqlite3
+from itertools import islice
+
+try:
+    from mysql.connector import pooling
+except ImportError:
+    pooling = None
+
+from deduplicacion import MISSING_VALUES, is_missing, normalize_text
+
+#############################################
+# CARGA MASIVA DE ARTÍCULOS (INSERCIONES POR LOTES)
+#############################################
+#
+# En lugar de un cursor.execute (un viaje de ida y vuelta) por artículo, los
+# artículos se agrupan en lotes de `batch_size` filas y se envían con
+# executemany: mysql.connector lo reescribe como un solo INSERT de varias filas
+# (VALUES (...), (...), ...) y sqlite3 lo ejecuta sin volver a preparar la
+# sentencia. Con upsert=True la carga es idempotente: cada fila lleva una clave
+# determinista (article_key: el DOI o, sin DOI, un hash del título normalizado
+# y el primer autor) y una clave ya existente actualiza la fila en lugar de
+# duplicarla (requiere el índice único sobre article_key).
+# Las conexiones a MySQL salen de un pool (mysql.connector.pooling).
+
+ARTICLE_COLUMNS = ["abstract", "author", "doi", "issn", "journal", "keywords", "month", "note",
+                   "number", "pages", "title", "type", "url", "volume", "year"]
+KEY_COLUMN = "article_key"
+INSERT_COLUMNS = ARTICLE_COLUMNS + [KEY_COLUMN]
+
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_POOL_SIZE = 5
+
+# Los DOIs de relleno ("No DOI", "Unknown", ... ver deduplicacion.is_missing) no
+# identifican al artículo: con upsert se guardan como NULL para no colisionar.
+
+SCHEMA = {
+    "mysql": """CREATE TABLE IF NOT EXISTS articles (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        abstract TEXT, author TEXT, doi VARCHAR(255), issn VARCHAR(64), journal VARCHAR(512),
+        keywords TEXT, month VARCHAR(32), note TEXT, number VARCHAR(64), pages VARCHAR(64),
+        title TEXT, type VARCHAR(64), url TEXT, volume VARCHAR(64), year INT, article_key VARCHAR(260)
+    )""",
+    "sqlite": """CREATE TABLE IF NOT EXISTS articles (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        abstract TEXT, author TEXT, doi TEXT, issn TEXT, journal TEXT,
+        keywords TEXT, month TEXT, note TEXT, number TEXT, pages TEXT,
+        title TEXT, type TEXT, url TEXT, volume TEXT, year INTEGER, article_key TEXT
+    )""",
+}
+def first_part_expression(dialect, column):
+    """Expresión SQL equivalente a value.split(",")[0] de requerimiento2.count_frequencies."""
+    if dialect == "sqlite":
+        return f"CASE WHEN instr({column}, ',') > 0 THEN substr({column}, 1, instr({column}, ',') - 1) ELSE {column} END"
+    # CAST: MySQL no indexa expresiones de tipo TEXT
+    return f"CAST(SUBSTRING_INDEX({column}, ',', 1) AS CHAR(255))"
+
+# Primer autor (lo que precede a la primera coma), como lo cuenta requerimiento2
+FIRST_AUTHOR = "COALESCE(author, 'Unknown')"
+
+DOI_INDEX = ("uq_articles_doi", "CREATE UNIQUE INDEX {if_not_exists}uq_articles_doi ON articles (doi)")
+KEY_INDEX = ("uq_articles_key", "CREATE UNIQUE INDEX {if_not_exists}uq_articles_key ON articles (article_key)")
+# Índices de las consultas de análisis (ver consultas): filtros y GROUP BY por año,
+# journal y tipo; (year, type) cubre la agrupación año × tipo sin leer la tabla y
+# el índice de expresión sobre el primer autor evita recorrerla para el top de
+# autores. MariaDB y MySQL anteriores a 8.0.13 no tienen índices de expresión:
+# ahí se omite (las consultas funcionan igual, recorriendo la tabla).
+INDEXES = [
+    ("ix_articles_year", "CREATE INDEX {if_not_exists}ix_articles_year ON articles (year)"),
+    ("ix_articles_journal", "CREATE INDEX {if_not_exists}ix_articles_journal ON articles (journal)"),
+    ("ix_articles_type", "CREATE INDEX {if_not_exists}ix_articles_type ON articles (type)"),
+    ("ix_articles_year_type", "CREATE INDEX {if_not_exists}ix_articles_year_type ON articles (year, type)"),
+    ("ix_articles_first_author", "CREATE INDEX {if_not_exists}ix_articles_first_author ON articles (({first_author}))"),
+]
+EXPRESSION_INDEXES = {"ix_articles_first_author"}
+
+def is_missing_doi(doi):
+    return is_missing(doi)
+
+def article_key(article):
+    """
+    Clave de upsert del artículo: "doi:<doi en minúsculas>" o, sin DOI,
+    "ta:<sha1 del título normalizado y el primer autor>"; None si tampoco
+    tiene título (la fila se inserta sin clave).
+    """
+    doi = article.get("doi")
+    if not is_missing_doi(doi):
+        return "doi:" + str(doi).strip().lower()
+    title = normalize_text(article.get("title"))
+    if title in MISSING_VALUES:
+        return None
+    first_author = normalize_text(str(article.get("author") or "").split(" and ")[0])
+    if first_author in MISSING_VALUES:
+        first_author = ""
+    return "ta:" + hashlib.sha1(f"{title}|{first_author}".encode("utf-8")).hexdigest()
+
+def article_row(article, upsert=False):
+    """Tupla de valores en el orden de INSERT_COLUMNS (mismos valores por defecto que insert_article)."""
+    year = article.get("year", "0")
+    row = [article.get(column, "Unknown") for column in ARTICLE_COLUMNS[:-1]]
+    row.append(int(year) if str(year).isdigit() else 0)
+    if upsert and is_missing_doi(row[2]):
+        row[2] = None
+    row.append(article_key(article))
+    return tuple(row)
+
+def dialect_of(conn):
+    return "sqlite" if isinstance(conn, sqlite3.Connection) else "mysql"
+
+#############################################
+# ESQUEMA E ÍNDICES
+#############################################
+#
+# Los cursores de mysql.connector no tienen buffer: antes del siguiente execute
+# hay que leer el resultado completo (fetchall), no solo la primera fila, o
+# falla con "Unread result found". information_schema.statistics, por ejemplo,
+# trae una fila por columna de un índice compuesto.
+
+def _has_index(cursor, dialect, name):
+    if dialect == "sqlite":
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?", (name,))
+    else:
+        cursor.execute("SELECT 1 FROM information_schema.statistics "
+                       "WHERE table_schema = DATABASE() AND table_name = 'articles' AND index_name = %s LIMIT 1",
+                       (name,))
+    return bool(cursor.fetchall())
+
+def supports_expression_indexes(cursor, dialect):
+    """SQLite (3.9+) y MySQL 8.0.13+; no MariaDB ni MySQL anteriores."""
+    if dialect == "sqlite":
+        return True
+    cursor.execute("SELECT VERSION()")
+    version = cursor.fetchall()[0][0]
+    if "mariadb" in version.lower():
+        return False
+    numbers = tuple(int(part) for part in version.split("-")[0].split(".")[:3] if part.isdigit())
+    return numbers >= (8, 0, 13)
+
+def _has_column(cursor, dialect, name):
+    if dialect == "sqlite":
+        cursor.execute("PRAGMA table_info(articles)")
+        return any(row[1] == name for row in cursor.fetchall())
+    cursor.execute("SELECT 1 FROM information_schema.columns "
+                   "WHERE table_schema = DATABASE() AND table_name = 'articles' AND column_name = %s LIMIT 1",
+                   (name,))
+    return bool(cursor.fetchall())
+
+def migrate_articles(cursor, dialect):
+    """
+    Prepara una tabla anterior a los índices únicos, que guardaba "No DOI" en
+    las filas sin DOI y duplicaba las filas en cada ejecución: los DOIs de
+    relleno pasan a NULL, cada fila recibe su article_key y de cada clave
+    repetida se conserva la fila más reciente.
+    """
+    placeholder = "?" if dialect == "sqlite" else "%s"
+    # Comparación sin espacios, como deduplicacion.is_missing ("No DOI" y "NoDOI")
+    missing = sorted({value.replace(" ", "") for value in MISSING_VALUES})
+    cursor.execute(f"UPDATE articles SET doi = NULL WHERE LOWER(REPLACE(TRIM(doi), ' ', '')) "
+                   f"IN ({', '.join([placeholder] * len(missing))})", missing)
+    cursor.execute("SELECT id, doi, title, author FROM articles ORDER BY id")
+    newest = {}
+    stale = []
+    for row_id, doi, title, author in cursor.fetchall():
+        key = article_key({"doi": doi, "title": title, "author": author})
+        if key is None:
+            continue
+        if key in newest:
+            stale.append((newest[key],))
+        newest[key] = row_id
+    if stale:
+        cursor.executemany(f"DELETE FROM articles WHERE id = {placeholder}", stale)
+    cursor.executemany(f"UPDATE articles SET {KEY_COLUMN} = {placeholder} WHERE id = {placeholder}",
+                       [(key, row_id) for key, row_id in newest.items()])
+
+def ensure_schema(conn, unique_keys=True):
+    """
+    Crea la tabla articles (o le agrega article_key) y los índices de INDEXES
+    si no existen y, con unique_keys, los índices únicos sobre doi y
+    article_key (antes migra la tabla existente, ver migrate_articles).
+    """
+    dialect = dialect_of(conn)
+    # MySQL no admite CREATE INDEX IF NOT EXISTS: se consulta information_schema
+    if_not_exists = "IF NOT EXISTS " if dialect == "sqlite" else ""
+    cursor = conn.cursor()
+    try:
+        cursor.execute(SCHEMA[dialect])
+        if not _has_column(cursor, dialect, KEY_COLUMN):
+            cursor.execute(f"ALTER TABLE articles ADD COLUMN {KEY_COLUMN} "
+                           f"{'TEXT' if dialect == 'sqlite' else 'VARCHAR(260)'}")
+        if unique_keys and not _has_index(cursor, dialect, KEY_INDEX[0]):
+            migrate_articles(cursor, dialect)
+        expression_indexes = supports_expression_indexes(cursor, dialect)
+        for name, ddl in ([DOI_INDEX, KEY_INDEX] if unique_keys else []) + INDEXES:
+            if name in EXPRESSION_INDEXES and not expression_indexes:
+                continue
+            if not _has_index(cursor, dialect, name):
+                cursor.execute(ddl.format(if_not_exists=if_not_exists,
+                                          first_author=first_part_expression(dialect, FIRST_AUTHOR)))
+        conn.commit()
+    finally:
+        cursor.close()
+
+def refresh_statistics(conn):
+    """Actualiza las estadísticas del optimizador tras una carga (ANALYZE)."""
+    cursor = conn.cursor()
+    try:
+        cursor.execute("ANALYZE" if dialect_of(conn) == "sqlite" else "ANALYZE TABLE articles")
+        if dialect_of(conn) == "mysql":
+            cursor.fetchall()
+        conn.commit()
+    finally:
+        cursor.close()
+
+#############################################
+# INSERCIÓN POR LOTES
+#############################################
+
+def insert_statement(dialect, upsert=False):
+    placeholder = "?" if dialect == "sqlite" else "%s"
+    sql = (f"INSERT INTO articles ({', '.join(INSERT_COLUMNS)}) "
+           f"VALUES ({', '.join([placeholder] * len(INSERT_COLUMNS))})")
+    if not upsert:
+        return sql
+    updated = ARTICLE_COLUMNS
+    if dialect == "sqlite":
+        return sql + f" ON CONFLICT({KEY_COLUMN}) DO UPDATE SET " + ", ".join(f"{c} = excluded.{c}" for c in updated)
+    return sql + " ON DUPLICATE KEY UPDATE " + ", ".join(f"{c} = VALUES({c})" for c in updated)
+
+def bulk_insert(conn, articles, batch_size=DEFAULT_BATCH_SIZE, upsert=True):
+    """
+    Inserta `articles` (cualquier iterable de dicts, p. ej. entradas BibTeX)
+    en lotes de batch_size filas, con un commit por lote. Funciona con una
+    conexión de mysql.connector o de sqlite3.
+
+    Retorna {"rows", "batches", "seconds", "rows_per_s"}.
+    """
+    sql = insert_statement(dialect_of(conn), upsert)
+    cursor = conn.cursor()
+    rows = batches = 0
+    start = time.perf_counter()
+    iterator = iter(articles)
+    try:
+        while True:
+            batch = [article_row(article, upsert) for article in islice(iterator, batch_size)]
+            if not batch:
+                break
+            cursor.executemany(sql, batch)
+            conn.commit()
+            rows += len(batch)
+            batches += 1
+    finally:
+        cursor.close()
+    seconds = time.perf_counter() - start
+    return {"rows": rows, "batches": batches, "seconds": seconds,
+            "rows_per_s": rows / seconds if seconds > 0 else float("inf")}
+
+#############################################
+# POOL DE CONEXIONES MYSQL
+#############################################
+
+_pools = {}
+
+def get_connection_pool(config, pool_size=DEFAULT_POOL_SIZE, pool_name="articles_pool"):
+    """Pool de conexiones MySQL reutilizado entre llamadas (uno por configuración)."""
+    if pooling is None:
+        raise RuntimeError("mysql-connector-python no está instalado.")
+    key = (pool_name, tuple(sorted(config.items())))
+    if key not in _pools:
+        _pools[key] = pooling.MySQLConnectionPool(pool_name=pool_name, pool_size=pool_size, **config)
+    return _pools[key]
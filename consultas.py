@@ -0,0 +1,53 @@
+import collections
+
+from carga_masiva import first_part_expression
+
+#############################################
+# CONSULTAS DE ANÁLISIS CON AGREGACIÓN EN EL SERVIDOR
+#############################################
+#
+# Equivalentes en SQL de los conteos de requerimiento2: cada consulta hace el
+# GROUP BY en el motor (apoyada en los índices de carga_masiva.INDEXES) y solo
+# recorre las filas agregadas, de modo que el tiempo de análisis no depende
+# de traer la tabla completa. `storage` es un almacenamiento.ArticleStorage.
+
+AGGREGABLE_COLUMNS = {"author", "journal", "type", "issn", "keywords", "month", "volume", "note", "number"}
+
+def year_histogram(storage):
+    """[(año, cantidad)] en orden de año, para los años no negativos."""
+    return list(storage.query("SELECT year, COUNT(*) FROM articles WHERE year >= 0 GROUP BY year ORDER BY year"))
+
+def top_counts(storage, column, top_n=15):
+    """
+    [(valor, cantidad)] de los top_n valores más frecuentes de `column`,
+    tomando lo que precede a la primera coma como requerimiento2.count_frequencies.
+    Los empates se ordenan alfabéticamente (Counter los deja en orden de aparición).
+    """
+    if column not in AGGREGABLE_COLUMNS:
+        raise ValueError(f"Columna no agregable: {column}")
+    # Misma expresión que el índice ix_articles_first_author, para que el motor lo use
+    expression = first_part_expression(storage.dialect, f"COALESCE({column}, 'Unknown')")
+    sql = (f"SELECT {expression} AS value, COUNT(*) AS total FROM articles "
+           f"GROUP BY value ORDER BY total DESC, value LIMIT {storage.placeholder}")
+    return list(storage.query(sql, (top_n,)))
+
+def top_authors(storage, top_n=15):
+    return top_counts(storage, "author", top_n)
+
+def top_journals(storage, top_n=15):
+    return top_counts(storage, "journal", top_n)
+
+def group_by_year_and_type(storage):
+    """
+    Misma salida que requerimiento2.group_by_year_and_type: {año (str):
+    Counter({tipo: cantidad})}, calculada con GROUP BY year, type.
+    """
+    grouped_data = collections.defaultdict(lambda: collections.Counter())
+    sql = "SELECT year, COALESCE(type, 'Unknown'), COUNT(*) FROM articles GROUP BY year, type"
+    for year, product_type, count in storage.query(sql):
+        grouped_data["Unknown" if year is None else str(year)][product_type] += count
+    return grouped_data
+
+def statistics(storage, top_n=15):
+    """Autores, journals y año × tipo en una llamada (como requerimiento2.accumulate_statistics, sin publishers)."""
+    return top_authors(storage, top_n), top_journals(storage, top_n), group_by_year_and_type(storage)
@@ -0,0 +1,161 @@
+import re
+import csv
+import sys
+import time
+import unicodedata
+import bibtexparser
+
+from deduplicacion import is_missing
+
+#############################################
+# CONVERSIÓN CSV -> BIBTEX EN STREAMING
+#############################################
+#
+# El CSV de integrate.save_csv se recorre fila a fila con csv.reader (memoria
+# constante, sin DataFrame ni una Series por fila) y las entradas se formatean
+# a texto y se escriben por lotes de `batch_size` con un solo write cada uno,
+# sobre un archivo con buffer de BUFFER_BYTES. Además:
+#   - los caracteres especiales de BibTeX/LaTeX se escapan en los campos de
+#     texto; doi y url se copian tal cual salvo las llaves (que romperían la entrada)
+#     y los espacios repetidos, y un DOI de relleno ("No DOI") se omite.
+#     bibtexparser carga los valores tal cual (con "\&"), así que los lectores
+#     del pipeline usan bibtex_parser(), que deshace el escape al cargar: la base
+#     de datos, los conteos y la deduplicación ven "&". Las llaves escapadas
+#     (\{ \}) se conservan: son sintaxis BibTeX y los .bib se reescriben sin escapar;
+#   - las claves de cita son ASCII (primer token de los autores + año) y
+#     únicas dentro del archivo: las repetidas reciben sufijos a, b, c, ...
+#     (el conjunto de claves emitidas es lo único que crece con el archivo,
+#     unas decenas de bytes por entrada).
+
+DEFAULT_BATCH_SIZE = 1000
+BUFFER_BYTES = 1024 * 1024
+
+# (campo BibTeX, columna del CSV); los opcionales se omiten si están vacíos
+REQUIRED_FIELDS = [("author", "Authors"), ("title", "Article title"), ("year", "Volume year")]
+OPTIONAL_FIELDS = [("journal", "Journal title"), ("doi", "DOI"), ("url", "URL")]
+VERBATIM_FIELDS = {"doi", "url"}
+DEFAULTS = {"Authors": "Unknown", "Article title": "Unknown", "Volume year": "UnknownYear"}
+
+_LATEX_SPECIALS = {
+    "\\": r"\textbackslash{}", "{": r"\{", "}": r"\}", "&": r"\&", "%": r"\%", "$": r"\$",
+    "#": r"\#", "_": r"\_", "~": r"\textasciitilde{}", "^": r"\textasciicircum{}",
+}
+_LATEX_PATTERN = re.compile(r"[\\{}&%$#_~^]")
+_KEY_PATTERN = re.compile(r"[^A-Za-z0-9]+")
+_UNESCAPES = {r"\textbackslash{}": "\\", r"\textasciitilde{}": "~", r"\textasciicircum{}": "^",
+              r"\&": "&", r"\%": "%", r"\$": "$", r"\#": "#", r"\_": "_"}
+_UNESCAPE_PATTERN = re.compile(r"\\(?:textbackslash|textasciitilde|textasciicircum)\{\}|\\[&%$#_]")
+
+def escape_bibtex(value):
+    """Escapa los caracteres especiales de LaTeX y deja el valor en una sola línea."""
+    value = " ".join(value.split())
+    return _LATEX_PATTERN.sub(lambda match: _LATEX_SPECIALS[match.group()], value)
+
+def escape_verbatim(value):
+    """doi/url: sin escapar (los consumidores los usan literalmente), salvo las llaves; espacios simples."""
+    return " ".join(value.split()).replace("{", "%7B").replace("}", "%7D")
+
+def unescape_bibtex(value):
+    """Inverso de escape_bibtex salvo las llaves (\\{ y \\} se conservan)."""
+    return _UNESCAPE_PATTERN.sub(lambda match: _UNESCAPES[match.group()], value)
+
+def unescape_entry(entry):
+    """Customización de BibTexParser: unescape_bibtex en los campos de texto de la entrada."""
+    for name, value in entry.items():
+        if name not in VERBATIM_FIELDS and name not in ("ID", "ENTRYTYPE") and isinstance(value, str):
+            entry[name] = unescape_bibtex(value)
+    return entry
+
+def bibtex_parser():
+    """Parser para bibtexparser.load que deshace el escape de escape_bibtex (uno nuevo por archivo)."""
+    return bibtexparser.bparser.BibTexParser(customization=unescape_entry)
+
+class CitationKeys:
+    """Genera claves de cita únicas: Smith2020, Smith2020a, Smith2020b, ..."""
+
+    def __init__(self):
+        self.used = set()
+        # Próximo sufijo a probar por base: evita recorrer de nuevo a, b, c, ... en cada repetición
+        self.next_suffix = {}
+
+    @staticmethod
+    def base(authors, year):
+        first = authors.split(" ")[0] if authors else "Unknown"
+        text = unicodedata.normalize("NFKD", f"{first}{year}").encode("ascii", "ignore").decode("ascii")
+        return _KEY_PATTERN.sub("", text) or "Unknown"
+
+    def new(self, authors, year):
+        base = self.base(authors, year)
+        key, suffix = base, self.next_suffix.get(base, 0)
+        while key in self.used:
+            key = base + _suffix(suffix)
+            suffix += 1
+        self.next_suffix[base] = suffix
+        self.used.add(key)
+        return key
+
+def _suffix(n):
+    """0 -> a, 25 -> z, 26 -> aa, ..."""
+    letters = ""
+    n += 1
+    while n:
+        n, remainder = divmod(n - 1, 26)
+        letters = chr(ord("a") + remainder) + letters
+    return letters
+
+def format_entry(key, fields):
+    """Entrada @article con los campos [(nombre, valor sin escapar)] en orden."""
+    lines = [f"@article{{{key},\n"]
+    for name, value in fields:
+        escaped = escape_verbatim(value) if name in VERBATIM_FIELDS else escape_bibtex(value)
+        lines.append(f"  {name} = {{{escaped}}},\n")
+    lines.append("}\n\n")
+    return "".join(lines)
+
+def iter_entries(rows, header, keys=None):
+    """Produce el texto BibTeX de cada fila de un csv.reader cuyo encabezado es `header`."""
+    keys = keys if keys is not None else CitationKeys()
+    positions = {column: index for index, column in enumerate(header)}
+    required = [(name, positions.get(column), DEFAULTS[column]) for name, column in REQUIRED_FIELDS]
+    optional = [(name, positions[column]) for name, column in OPTIONAL_FIELDS if column in positions]
+    for row in rows:
+        if not row:
+            continue
+        fields = []
+        for name, index, default in required:
+            value = row[index].strip() if index is not None and index < len(row) else ""
+            fields.append((name, value or default))
+        for name, index in optional:
+            value = row[index].strip() if index < len(row) else ""
+            if name == "doi" and is_missing(value):
+                continue
+            if value:
+                fields.append((name, value))
+        yield format_entry(keys.new(fields[0][1], fields[2][1]), fields)
+
+def csv_to_bibtex(csv_file_path, bibtex_file_path, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Convierte el CSV de artículos a BibTeX en streaming.
+    Retorna {"entries", "seconds", "entries_per_s"}.
+    """
+    # Los abstracts pueden superar el límite por campo de csv (128 KiB)
+    csv.field_size_limit(min(sys.maxsize, 2 ** 31 - 1))
+    entries = 0
+    start = time.perf_counter()
+    with open(csv_file_path, newline="", encoding="utf-8-sig") as csv_file, \
+            open(bibtex_file_path, "w", encoding="utf-8", buffering=BUFFER_BYTES) as bib_file:
+        reader = csv.reader(csv_file)
+        header = next(reader, None)
+        if header is not None:
+            batch = []
+            for entry in iter_entries(reader, header):
+                batch.append(entry)
+                if len(batch) >= batch_size:
+                    bib_file.write("".join(batch))
+                    entries += len(batch)
+                    batch = []
+            bib_file.write("".join(batch))
+            entries += len(batch)
+    seconds = time.perf_counter() - start
+    return {"entries": entries, "seconds": seconds,
+            "entries_per_s": entries / seconds if seconds > 0 else float("inf")}
@@ -0,0 +1,287 @@
+import re
+import json
+import unicodedata
+from functools import lru_cache
+import numpy as np
+
+#############################################
+# DETECCIÓN DE CASI DUPLICADOS (MINHASH + LSH)
+#############################################
+#
+# El mismo artículo obtenido de dos bases de datos suele traer el título con
+# otra puntuación, mayúsculas o acentos y los autores en otro formato
+# ("Smith, J." / "John Smith"), por lo que la clave exacta de
+# integrate.separate_duplicates no lo detecta. Comparar todos los pares sería
+# O(n²); en su lugar:
+#   1. cada título normalizado se reduce a sus shingles (k-gramas de caracteres)
+#      y a una firma MinHash de num_perm valores, calculada con numpy por bloques;
+#   2. la firma se divide en bandas (LSH): solo los artículos que coinciden en
+#      alguna banda completa son candidatos (buckets por ordenamiento de las
+#      claves de cada banda), lo que deja el costo casi lineal;
+#   3. cada candidato se verifica con la similitud exacta: Jaccard de los
+#      shingles del título >= title_threshold y solapamiento de apellidos/nombres
+#      >= author_threshold (si ambos tienen autores). Dos DOIs distintos y
+#      conocidos nunca se consideran el mismo artículo.
+# Los pares verificados se agrupan (union-find) en clusters; en cada cluster se
+# conserva la primera aparición, como en la deduplicación exacta. Cada cluster
+# lleva el DOI conocido de sus miembros: dos clusters con DOIs distintos no se
+# unen aunque un miembro sin DOI se parezca a ambos.
+
+SHINGLE_SIZE = 4
+DEFAULT_NUM_PERM = 128
+DEFAULT_TITLE_THRESHOLD = 0.8
+DEFAULT_AUTHOR_THRESHOLD = 0.5
+# Candidatos verificados por bucket: acota el costo de títulos muy repetidos ("Editorial")
+MAX_BUCKET_CANDIDATES = 64
+SIGNATURE_CHUNK = 1000
+# Peso de los falsos negativos al elegir bandas × filas (ver lsh_parameters)
+FALSE_NEGATIVE_WEIGHT = 0.8
+
+_SEED = 20240901
+MISSING_VALUES = {"", "unknown", "no doi", "n/a"}
+# Los mismos valores sin espacios: "NoDOI" (p. ej. de un .bib que perdió los espacios) también es relleno
+_MISSING_COMPACT = {value.replace(" ", "") for value in MISSING_VALUES}
+
+def is_missing(value):
+    """True si el valor falta o es de relleno ("No DOI", " unknown ", "NoDOI", ...)."""
+    return value is None or "".join(str(value).split()).lower() in _MISSING_COMPACT
+
+def normalize_text(text):
+    """Minúsculas, sin acentos, llaves BibTeX ni puntuación y con espacios simples (ASCII)."""
+    text = str(text or "")
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text)
+        text = "".join(char for char in text if not unicodedata.combining(char))
+    text = text.lower()
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", text).split())
+
+def title_shingles(title, size=SHINGLE_SIZE, normalized=False):
+    """Conjunto de k-gramas de caracteres del título normalizado."""
+    text = title if normalized else normalize_text(title)
+    if text in MISSING_VALUES:
+        return frozenset()
+    if len(text) <= size:
+        return frozenset([text])
+    return frozenset(text[i:i + size] for i in range(len(text) - size + 1))
+
+def author_tokens(authors):
+    """Nombres y apellidos (sin iniciales ni "and"), independientes del formato de la lista."""
+    text = normalize_text(authors)
+    if text in MISSING_VALUES:
+        return frozenset()
+    return frozenset(token for token in text.split() if len(token) > 2 and token != "and")
+
+def exact_key(entry):
+    """
+    Clave de la deduplicación exacta: el DOI o, si falta o es de relleno
+    ("No DOI", "Unknown", ...), título + autores.
+    """
+    doi = entry.get("doi")
+    if not is_missing(doi):
+        return doi
+    return entry.get("title", "") + entry.get("author", "")
+
+def _doi(entry):
+    if is_missing(entry.get("doi")):
+        return None
+    return normalize_text(entry.get("doi")) or None
+
+#############################################
+# FIRMAS MINHASH Y PARÁMETROS LSH
+#############################################
+
+@lru_cache(maxsize=None)
+def _permutations(num_perm):
+    generator = np.random.RandomState(_SEED)
+    a = generator.randint(1, 1 << 62, size=num_perm, dtype=np.int64).astype(np.uint64) | np.uint64(1)
+    b = generator.randint(0, 1 << 62, size=num_perm, dtype=np.int64).astype(np.uint64)
+    return a[:, None], b[:, None]
+
+def _shingle_codes(texts):
+    """
+    Shingles de SHINGLE_SIZE (= 4) bytes de cada texto normalizado (ASCII)
+    empaquetados como enteros de 32 bits, calculados con numpy sobre la
+    concatenación de los textos; retorna (códigos, posición del primero de cada texto).
+    """
+    padded = [text.ljust(SHINGLE_SIZE) for text in texts]
+    data = np.frombuffer("".join(padded).encode("ascii"), dtype=np.uint8).astype(np.uint32)
+    lengths = np.array([len(text) for text in padded])
+    ends = np.cumsum(lengths)
+    codes = data[:-3] << 24 | data[1:-2] << 16 | data[2:-1] << 8 | data[3:]
+    # Se descartan los shingles que cruzan de un texto al siguiente
+    valid = np.ones(len(codes), dtype=bool)
+    for offset in range(1, SHINGLE_SIZE):
+        boundary = ends[:-1] - offset
+        valid[boundary[boundary >= 0]] = False
+    counts = lengths - SHINGLE_SIZE + 1
+    return codes[valid], np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+def minhash_signatures(texts, num_perm=DEFAULT_NUM_PERM):
+    """
+    Matriz (len(texts), num_perm) de firmas MinHash de los shingles de
+    `texts` (normalizados y no vacíos), con hashes multiply-shift
+    (a·x + b) >> 32 sobre enteros de 64 bits. Se procesa por bloques de
+    SIGNATURE_CHUNK textos con np.minimum.reduceat.
+    """
+    a, b = _permutations(num_perm)
+    signatures = np.empty((len(texts), num_perm), dtype=np.uint32)
+    for start in range(0, len(texts), SIGNATURE_CHUNK):
+        chunk = texts[start:start + SIGNATURE_CHUNK]
+        codes, offsets = _shingle_codes(chunk)
+        hashed = (a * codes.astype(np.uint64) + b) >> np.uint64(32)
+        signatures[start:start + len(chunk)] = np.minimum.reduceat(hashed, offsets, axis=1).T
+    return signatures
+
+@lru_cache(maxsize=None)
+def lsh_parameters(threshold, num_perm=DEFAULT_NUM_PERM, false_negative_weight=FALSE_NEGATIVE_WEIGHT):
+    """
+    (bandas, filas) con bandas × filas <= num_perm que minimizan el error
+    ponderado de la curva 1 - (1 - s^filas)^bandas: falsos positivos
+    (similitud < threshold) y falsos negativos (>= threshold), estos con peso
+    false_negative_weight porque un candidato de más solo cuesta una verificación.
+    """
+    steps = 200
+    similarities = [(i + 0.5) / steps for i in range(steps)]
+    best = None
+    for bands in range(1, num_perm + 1):
+        rows = num_perm // bands
+        error = 0.0
+        for s in similarities:
+            candidate = 1 - (1 - s ** rows) ** bands
+            error += (1 - false_negative_weight) * candidate if s < threshold else false_negative_weight * (1 - candidate)
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    return best[1], best[2]
+
+def band_keys(signatures, bands, rows):
+    """Matriz (n, bands) con una clave de 64 bits por banda de cada firma."""
+    multipliers = _permutations(rows)[0][:, 0]
+    return np.stack([(signatures[:, band * rows:(band + 1) * rows].astype(np.uint64) * multipliers).sum(axis=1)
+                     for band in range(bands)], axis=1)
+
+def candidate_pairs(signatures, bands, rows):
+    """
+    Pares (i, j), i < j, que coinciden en todas las filas de alguna banda.
+    Los buckets de cada banda salen de ordenar sus claves (band_keys); en
+    buckets grandes cada miembro se compara con los primeros MAX_BUCKET_CANDIDATES.
+    """
+    pairs = set()
+    for keys in band_keys(signatures, bands, rows).T:
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        starts = np.flatnonzero(np.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1])))
+        sizes = np.diff(np.append(starts, len(keys)))
+        for start, size in zip(starts[sizes > 1].tolist(), sizes[sizes > 1].tolist()):
+            members = order[start:start + size].tolist()
+            for k in range(1, size):
+                pairs.update((members[m], members[k]) for m in range(min(k, MAX_BUCKET_CANDIDATES)))
+    return pairs
+
+#############################################
+# CLUSTERS DE CASI DUPLICADOS
+#############################################
+
+def jaccard(first, second):
+    return len(first & second) / len(first | second) if first and second else 0.0
+
+def overlap(first, second):
+    return len(first & second) / min(len(first), len(second)) if first and second else 0.0
+
+def entry_features(entry, normalized_title=None):
+    """(shingles del título, nombres de los autores, DOI o None) de una entrada."""
+    title = normalized_title if normalized_title is not None else normalize_text(entry.get("title"))
+    return title_shingles(title, normalized=True), author_tokens(entry.get("author")), _doi(entry)
+
+def is_near_duplicate(first, second, title_threshold=DEFAULT_TITLE_THRESHOLD,
+                      author_threshold=DEFAULT_AUTHOR_THRESHOLD):
+    """Verificación exacta de dos candidatos a partir de sus entry_features."""
+    shingles_i, authors_i, doi_i = first
+    shingles_j, authors_j, doi_j = second
+    if doi_i and doi_j and doi_i != doi_j:
+        return False
+    if authors_i and authors_j and overlap(authors_i, authors_j) < author_threshold:
+        return False
+    return jaccard(shingles_i, shingles_j) >= title_threshold
+
+def _find(parent, i):
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+def find_near_duplicates(entries, title_threshold=DEFAULT_TITLE_THRESHOLD,
+                         author_threshold=DEFAULT_AUTHOR_THRESHOLD, num_perm=DEFAULT_NUM_PERM):
+    """
+    Agrupa las entradas (dicts BibTeX con title/author/doi) que son casi
+    duplicadas. Retorna {índice del representante: [(índice, similitud del
+    título con el representante), ...]}, con representante = primera aparición.
+    """
+    titles = [normalize_text(entry.get("title")) for entry in entries]
+    indexed = [i for i, title in enumerate(titles) if title not in MISSING_VALUES]
+    if not indexed:
+        return {}
+    signatures = minhash_signatures([titles[i] for i in indexed], num_perm)
+    bands, rows = lsh_parameters(title_threshold, num_perm)
+
+    # Shingles y autores solo de las entradas que llegan a verificarse
+    @lru_cache(maxsize=None)
+    def features(i):
+        return entry_features(entries[i], titles[i])
+
+    parent = list(range(len(entries)))
+    # DOI conocido de cada cluster (por representante)
+    dois = {}
+
+    def cluster_doi(root):
+        if root not in dois:
+            dois[root] = _doi(entries[root])
+        return dois[root]
+
+    for first, second in sorted(candidate_pairs(signatures, bands, rows)):
+        i, j = indexed[first], indexed[second]
+        root_i, root_j = _find(parent, i), _find(parent, j)
+        if root_i == root_j:
+            continue
+        doi_i, doi_j = cluster_doi(root_i), cluster_doi(root_j)
+        if doi_i and doi_j and doi_i != doi_j:
+            continue
+        if is_near_duplicate(features(i), features(j), title_threshold, author_threshold):
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+            dois[min(root_i, root_j)] = doi_i or doi_j
+
+    clusters = {}
+    for i in indexed:
+        root = _find(parent, i)
+        if root != i:
+            similarity = jaccard(features(root)[0], features(i)[0])
+            clusters.setdefault(root, []).append((i, round(similarity, 3)))
+    return clusters
+
+def separate_near_duplicates(entries, **options):
+    """
+    (únicas, duplicadas, clusters) a partir de find_near_duplicates; las
+    listas conservan el orden de `entries`.
+    """
+    clusters = find_near_duplicates(entries, **options)
+    duplicated = {i for members in clusters.values() for i, _ in members}
+    unique_entries = [entry for i, entry in enumerate(entries) if i not in duplicated]
+    duplicate_entries = [entry for i, entry in enumerate(entries) if i in duplicated]
+    return unique_entries, duplicate_entries, clusters
+
+#############################################
+# REPORTE DE CLUSTERS
+#############################################
+
+def _summary(entry):
+    return {"ID": entry.get("ID"), "title": entry.get("title"), "author": entry.get("author"), "doi": entry.get("doi")}
+
+def cluster_record(kept, members):
+    """Cluster serializable: la entrada conservada y sus duplicadas [(entrada, "exact"|"near", similitud)]."""
+    return {"kept": _summary(kept),
+            "duplicates": [dict(_summary(entry), match=match, similarity=similarity)
+                           for entry, match, similarity in members]}
+
+def write_clusters(path, records):
+    """Escribe los clusters en JSON (uno por entrada conservada que tiene duplicadas)."""
+    with open(path, "w", encoding="utf-8") as output_file:
+        json.dump(records, output_file, ensure_ascii=False, indent=2)
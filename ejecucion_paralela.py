@@ -0,0 +1,126 @@
+import os
+import multiprocessing
+from multiprocessing import shared_memory
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+
+#############################################
+# EJECUCIÓN PARALELA DE LA MATRIZ DE BENCHMARKS
+#############################################
+#
+# Cada celda (variable, backend, algoritmo) se ejecuta en un worker de un
+# ProcessPoolExecutor. Los datos de cada variable se publican una sola vez en
+# memoria compartida (multiprocessing.shared_memory) y los workers los leen
+# sin que se serialicen con pickle en cada tarea. Opcionalmente cada worker se
+# fija a una CPU (os.sched_setaffinity) para que las mediciones no compitan
+# por el mismo núcleo.
+
+def physical_core_cpus():
+    """
+    Retorna una CPU lógica por cada núcleo físico (Linux, vía sysfs). Si la
+    topología no está disponible, retorna todas las CPU utilizables.
+    """
+    available = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else list(range(os.cpu_count() or 1))
+    seen = set()
+    cpus = []
+    for cpu in available:
+        topology = f"/sys/devices/system/cpu/cpu{cpu}/topology"
+        try:
+            with open(os.path.join(topology, "physical_package_id")) as f:
+                package = f.read().strip()
+            with open(os.path.join(topology, "core_id")) as f:
+                core = f.read().strip()
+        except OSError:
+            return available
+        if (package, core) not in seen:
+            seen.add((package, core))
+            cpus.append(cpu)
+    return cpus or available
+
+def _publish(array):
+    """Copia un arreglo a un bloque de memoria compartida y retorna (bloque, descriptor)."""
+    array = np.ascontiguousarray(array)
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+    view[:] = array
+    return block, (block.name, array.shape, array.dtype.str)
+
+#############################################
+# LADO DEL WORKER
+#############################################
+
+_attached = {}
+
+def _init_worker(cpu_queue):
+    """Inicializador de cada worker: toma una CPU libre de la cola y se fija a ella."""
+    if cpu_queue is None:
+        return
+    cpu = cpu_queue.get()
+    try:
+        os.sched_setaffinity(0, {cpu})
+    except (AttributeError, OSError) as e:
+        print(f"[Paralelo] No se pudo fijar el worker a la CPU {cpu}: {e}")
+
+def _attach(descriptor):
+    name, shape, dtype = descriptor
+    if name not in _attached:
+        block = shared_memory.SharedMemory(name=name)
+        _attached[name] = (block, np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf))
+    return _attached[name][1]
+
+def _run_cell(cell_function, descriptor, cell, kwargs):
+    array = _attach(descriptor)
+    return cell, cell_function(*cell, array, **kwargs)
+
+#############################################
+# PLANIFICADOR
+#############################################
+
+def run_matrix(cell_function, arrays, cells, workers=None, one_per_core=False, pin_cpus=True, **kwargs):
+    """
+    Ejecuta cell_function(variable, backend, algoritmo, arreglo, **kwargs) para
+    cada celda de `cells` en un pool de procesos y retorna los resultados en el
+    mismo orden de `cells`, imprimiendo cada uno a medida que termina.
+
+    arrays: {variable: np.ndarray} con los datos de entrada de cada variable.
+    workers: número de procesos (por defecto, uno por CPU disponible).
+    one_per_core: usa a lo sumo un worker por núcleo físico, para que dos
+        mediciones nunca compartan núcleo por hyper-threading.
+    pin_cpus: fija cada worker a una CPU distinta (solo Linux).
+    cell_function debe ser una función de nivel de módulo (se envía por referencia).
+    """
+    cpus = physical_core_cpus() if one_per_core else (
+        sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else list(range(os.cpu_count() or 1)))
+    if workers is None:
+        workers = len(cpus)
+    if one_per_core:
+        workers = min(workers, len(cpus))
+    workers = max(1, workers)
+
+    context = multiprocessing.get_context()
+    cpu_queue = None
+    if pin_cpus and hasattr(os, "sched_setaffinity"):
+        cpu_queue = context.Queue()
+        for i in range(workers):
+            cpu_queue.put(cpus[i % len(cpus)])
+
+    blocks = []
+    descriptors = {}
+    try:
+        for variable, array in arrays.items():
+            block, descriptors[variable] = _publish(array)
+            blocks.append(block)
+
+        results = {}
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                 initializer=_init_worker, initargs=(cpu_queue,)) as executor:
+            futures = [executor.submit(_run_cell, cell_function, descriptors[cell[0]], cell, kwargs) for cell in cells]
+            for done, future in enumerate(as_completed(futures), start=1):
+                cell, result = future.result()
+                results[cell] = result
+                print(f"[Paralelo] {done}/{len(cells)} completada: {cell[0]} / {cell[2]} ({cell[1]})")
+        return [results[cell] for cell in cells]
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
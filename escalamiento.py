@@ -0,0 +1,148 @@
+import os
+import math
+import random
+import numpy as np
+
+from medicion import benchmark
+from renderizado import new_figure, save_figure
+
+#############################################
+# BARRIDO DE TAMAÑOS Y AJUSTE DE COMPLEJIDAD EMPÍRICA
+#############################################
+#
+# Cada algoritmo se mide sobre entradas de tamaño geométrico (1e2 ... 1e6),
+# remuestreadas de los valores reales de la variable. El exponente empírico
+# es la pendiente de la regresión log(tiempo) ~ log(n), y se compara con la
+# pendiente que tendría la complejidad esperada sobre ese mismo rango de n.
+
+DEFAULT_SIZES = [100, 316, 1000, 3162, 10000, 31623, 100000, 316228, 1000000]
+
+# Complejidad esperada (caso promedio) de cada algoritmo de ordenamientoDos
+EXPECTED_COMPLEXITY = {
+    'TimSort': 'n log n',
+    'Comb Sort': 'n log n',
+    'Selection Sort': 'n^2',
+    'Tree Sort': 'n log n',
+    'Pigeonhole Sort': 'n + k',
+    'Bucket Sort': 'n + k',
+    'Quick Sort': 'n log n',
+    'Heap Sort': 'n log n',
+    'Bitonic Sort': 'n log^2 n',
+    'Gnome Sort': 'n^2',
+    'Binary Insertion Sort': 'n^2',
+    'Radix Sort': 'n + k',
+    'Bubble Sort': 'n^2',
+    'Bidirectional Bubble Sort': 'n^2',
+    'Busrbu Sort': 'n^2',
+    'Parallel Merge Sort': 'n log n'
+}
+
+COMPLEXITY_FUNCTIONS = {
+    'n + k': lambda n: n,
+    'n log n': lambda n: n * math.log2(n),
+    'n log^2 n': lambda n: n * math.log2(n) ** 2,
+    'n^2': lambda n: n ** 2,
+}
+
+# Tamaño máximo por clase de complejidad (los cuadráticos en Python puro no pasan de 1e4)
+SIZE_CAPS = {
+    'n + k': 1000000,
+    'n log n': 1000000,
+    'n log^2 n': 100000,
+    'n^2': 10000,
+}
+
+# Diferencia de exponente a partir de la cual se marca el algoritmo
+EXPONENT_TOLERANCE = 0.25
+
+def resample(values, size, seed=0):
+    """Genera una entrada de `size` elementos remuestreando (con reemplazo) los valores reales."""
+    rng = random.Random(seed)
+    return [rng.choice(values) for _ in range(size)]
+
+def fit_exponent(sizes, times_ms):
+    """Pendiente de la regresión lineal log(t) ~ log(n). Requiere al menos dos puntos."""
+    if len(sizes) < 2:
+        return math.nan
+    slope, _ = np.polyfit(np.log(sizes), np.log(times_ms), 1)
+    return float(slope)
+
+def expected_exponent(complexity, sizes):
+    """Pendiente log-log de la complejidad esperada evaluada en los mismos tamaños."""
+    function = COMPLEXITY_FUNCTIONS[complexity]
+    return fit_exponent(sizes, [function(n) for n in sizes])
+
+def scaling_sweep(algorithms, values, sizes=None, repeat=3, warmup=1, timeout_s=5.0, variable=""):
+    """
+    Mide cada algoritmo de `algorithms` ({nombre: función}) en los tamaños dados
+    (limitados por SIZE_CAPS). Si un tamaño termina en timeout o error, no se
+    prueban tamaños mayores para ese algoritmo.
+
+    Retorna {nombre: {"points": [(n, mediana_ms)], "measured": exp, "expected": exp,
+    "complexity": str, "flagged": bool, "status": último estado}}.
+    """
+    sizes = DEFAULT_SIZES if sizes is None else sizes
+    inputs = {}
+    summary = {}
+    for name, function in algorithms.items():
+        complexity = EXPECTED_COMPLEXITY.get(name, 'n log n')
+        points = []
+        status = "ok"
+        for n in sizes:
+            if n > SIZE_CAPS[complexity]:
+                break
+            if n not in inputs:
+                inputs[n] = resample(values, n)
+            result = benchmark(function, inputs[n], name=name, repeat=repeat, warmup=warmup, timeout_s=timeout_s)
+            status = result["status"]
+            if status != "ok":
+                print(f"[Escalamiento] {variable} / {name}: {status} en n={n}, se detiene el barrido")
+                break
+            points.append((n, result["median_ms"]))
+            print(f"[Escalamiento] {variable} / {name}: n={n} mediana {result['median_ms']:.4f} ms")
+
+        # El punto más pequeño suele estar dominado por costos fijos: se excluye si hay suficientes
+        fit_points = points[1:] if len(points) >= 4 else points
+        fit_sizes = [n for n, _ in fit_points]
+        measured = fit_exponent(fit_sizes, [max(t, 1e-6) for _, t in fit_points])
+        expected = expected_exponent(complexity, fit_sizes) if len(fit_sizes) >= 2 else math.nan
+        flagged = not math.isnan(measured) and abs(measured - expected) > EXPONENT_TOLERANCE
+        summary[name] = {
+            "points": points,
+            "measured": measured,
+            "expected": expected,
+            "complexity": complexity,
+            "flagged": flagged,
+            "status": status,
+        }
+        if flagged:
+            print(f"[Escalamiento] AVISO {variable} / {name}: exponente medido {measured:.2f}, "
+                  f"esperado {expected:.2f} para O({complexity})")
+    return summary
+
+def scaling_figure(summary, variable, type_label):
+    """Curvas tiempo-vs-n en escala log-log, una por algoritmo; los marcados se dibujan con línea discontinua."""
+    figure = new_figure((10, 6))
+    ax = figure.add_subplot()
+    for name, info in summary.items():
+        if not info["points"]:
+            continue
+        sizes, times = zip(*info["points"])
+        label = f"{name} (~n^{info['measured']:.2f}, O({info['complexity']}))" if not math.isnan(info["measured"]) else name
+        ax.plot(sizes, times, marker='o', linestyle='--' if info["flagged"] else '-', label=label)
+    ax.set_xscale('log')
+    ax.set_yscale('log')
+    ax.set_xlabel('Tamaño de la entrada (n)')
+    ax.set_ylabel('Tiempo de ejecución (ms, mediana)')
+    ax.set_title(f'Escalamiento de tiempos para {variable} ({type_label})')
+    ax.legend(fontsize=7, loc='upper left')
+    ax.grid(True, which='both', linestyle='--', alpha=0.4)
+    figure.tight_layout()
+    return figure
+
+def plot_scaling(summary, variable, type_label, results_folder):
+    """Guarda scaling_figure en results_folder/<variable>_escalamiento.png y retorna la ruta."""
+    filepath = save_figure(scaling_figure(summary, variable, type_label),
+                           os.path.join(results_folder, f"{variable.replace(' ', '_')}_escalamiento.png"))
+    print(f"Gráfico guardado en: {filepath}")
+    return filepath
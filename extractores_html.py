@@ -0,0 +1,181 @@
+from bs4 import BeautifulSoup
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:
+    etree = None
+
+#############################################
+# EXTRACCIÓN DE ARTÍCULOS DE LAS PÁGINAS DE RESULTADOS
+#############################################
+#
+# Las reglas de extracción de cada base de datos se declaran una sola vez
+# (RULES) y se compilan para cada backend:
+#   - "selectolax": selectores CSS sobre el parser Lexbor (el más rápido);
+#   - "lxml": expresiones XPath precompiladas con etree.XPath;
+#   - "bs4": BeautifulSoup con html.parser (la implementación original, de referencia).
+# Por defecto se usa el más rápido disponible. Los tres producen los mismos
+# diccionarios que el get_articles original.
+
+# (columna, etiqueta, clase CSS, modo) por campo; modo "text" toma el texto del
+# primer elemento, "href" su atributo href y "doi" el href del primer enlace a doi.org.
+RULES = {
+    "IEEE": {
+        "item": "List-results-item",
+        "fields": [
+            ("Article title", "a", None, "text"),
+            ("Authors", "p", "author", "text"),
+            ("Volume year", "div", "publisher-info-container", "text"),
+            ("DOI", "a", None, "doi"),
+            ("URL", "a", None, "href"),
+        ],
+    },
+    "ScienceDirect": {
+        "item": "ResultItem",
+        "fields": [
+            ("Article title", "h2", None, "text"),
+            ("Authors", "span", "Authors", "text"),
+            ("Volume year", "span", "PublicationDate", "text"),
+            ("URL", "a", None, "href"),
+        ],
+    },
+    "Nature": {
+        "item": "app-article-item",
+        "fields": [
+            ("Article title", "h3", None, "text"),
+            ("Authors", "ul", "app-article-authors", "text"),
+            ("Volume year", "div", "app-article-meta", "text"),
+            ("URL", "a", None, "href"),
+        ],
+    },
+}
+
+# Orden de las columnas de cada artículo, como en el CSV original
+COLUMNS = ["Article title", "Authors", "Volume year", "DOI", "URL", "Abstract", "Journal title"]
+DEFAULTS = {"Article title": "Unknown", "Authors": "Unknown", "Volume year": "Unknown",
+            "DOI": "No DOI", "URL": "No URL", "Abstract": "N/A"}
+
+def _article(database, values):
+    return {column: values.get(column, DEFAULTS.get(column, database)) for column in COLUMNS}
+
+#############################################
+# BACKEND BS4 (REFERENCIA)
+#############################################
+
+def _has_doi(href):
+    return href and "doi.org" in href
+
+def _extract_bs4(database, html):
+    rules = RULES[database]
+    soup = BeautifulSoup(html, "html.parser")
+    articles = []
+    for result in soup.select("." + rules["item"]):
+        values = {}
+        for column, tag, css_class, mode in rules["fields"]:
+            if mode == "doi":
+                element = result.find("a", href=_has_doi)
+            elif css_class:
+                element = result.find(tag, class_=css_class)
+            else:
+                element = result.find(tag)
+            if element is not None:
+                values[column] = element.text.strip() if mode == "text" else element.get("href")
+        articles.append(_article(database, values))
+    return articles
+
+#############################################
+# BACKEND SELECTOLAX (CSS)
+#############################################
+
+def _css(tag, css_class, mode):
+    if mode == "doi":
+        return 'a[href*="doi.org"]'
+    return f"{tag}.{css_class}" if css_class else tag
+
+_SELECTOLAX_RULES = {
+    database: ("." + rules["item"], [(column, _css(tag, css_class, mode), mode)
+                                     for column, tag, css_class, mode in rules["fields"]])
+    for database, rules in RULES.items()
+}
+
+def _extract_selectolax(database, html):
+    item_selector, fields = _SELECTOLAX_RULES[database]
+    articles = []
+    for result in HTMLParser(html).css(item_selector):
+        values = {}
+        for column, selector, mode in fields:
+            element = result.css_first(selector)
+            if element is not None:
+                values[column] = element.text().strip() if mode == "text" else element.attributes.get("href")
+        articles.append(_article(database, values))
+    return articles
+
+#############################################
+# BACKEND LXML (XPATH PRECOMPILADO)
+#############################################
+
+def _has_class(css_class):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {css_class} ')"
+
+def _xpath(tag, css_class, mode):
+    if mode == "doi":
+        return "(.//a[contains(@href, 'doi.org')])[1]"
+    return f"(.//{tag}[{_has_class(css_class)}])[1]" if css_class else f"(.//{tag})[1]"
+
+_LXML_RULES = {
+    database: (etree.XPath(f"//*[{_has_class(rules['item'])}]"),
+               [(column, etree.XPath(_xpath(tag, css_class, mode)), mode)
+                for column, tag, css_class, mode in rules["fields"]])
+    for database, rules in RULES.items()
+} if etree is not None else {}
+
+def _extract_lxml(database, html):
+    items, fields = _LXML_RULES[database]
+    if not html.strip():
+        return []
+    articles = []
+    for result in items(lxml.html.fromstring(html)):
+        values = {}
+        for column, xpath, mode in fields:
+            found = xpath(result)
+            if found:
+                values[column] = found[0].text_content().strip() if mode == "text" else found[0].get("href")
+        articles.append(_article(database, values))
+    return articles
+
+#############################################
+# SELECCIÓN DEL BACKEND
+#############################################
+
+BACKENDS = {"bs4": _extract_bs4}
+if etree is not None:
+    BACKENDS["lxml"] = _extract_lxml
+if HTMLParser is not None:
+    BACKENDS["selectolax"] = _extract_selectolax
+
+DEFAULT_BACKEND = next(name for name in ("selectolax", "lxml", "bs4") if name in BACKENDS)
+
+# Versión de RULES y de los extractores: se incrementa al cambiar cualquier
+# selector o la forma de los artículos, para invalidar los resultados guardados
+# por cache_http (ver parser_key)
+PARSER_VERSION = 1
+
+def parser_key(backend=None):
+    """Identifica al extractor (backend y PARSER_VERSION) con que se obtuvo un resultado."""
+    return f"{backend or DEFAULT_BACKEND}:v{PARSER_VERSION}"
+
+def extract_articles(database, html, backend=None):
+    """
+    Extrae los artículos de una página de resultados de `database` con el
+    backend indicado ("selectolax", "lxml" o "bs4"; por defecto DEFAULT_BACKEND).
+    """
+    backend = backend or DEFAULT_BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(f"Backend de extracción no disponible: {backend} (disponibles: {', '.join(BACKENDS)})")
+    return BACKENDS[backend](database, html)
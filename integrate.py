@@ -1,12 +1,22 @@
 import os
-import time
+import asyncio
+import sqlite3
 import requests
 import csv
-import pandas as pd
 import bibtexparser
 import mysql.connector
 import matplotlib.pyplot as plt
-from bs4 import BeautifulSoup
+
+from ordenamiento_externo import external_sort
+from scraper_async import AsyncScraper
+from cache_http import HttpCache
+from extractores_html import extract_articles, parser_key
+from carga_masiva import DEFAULT_BATCH_SIZE, article_row, insert_statement
+from almacenamiento import open_storage
+import consultas
+from conversion_bibtex import bibtex_parser, csv_to_bibtex as convert_csv_to_bibtex
+from deduplicacion import cluster_record, exact_key, find_near_duplicates, write_clusters
+from unificacion_incremental import INDEX_FILENAME, OUTPUT_FILENAMES, IncrementalUnifier
 
 #####################################
 # CONFIGURACIÓN Y CONSTANTES
@@ -18,136 +28,116 @@ BASE_URLS = {
     "ScienceDirect": "https://www.sciencedirect.com/search?qs=",
     "Nature": "https://www.nature.com/search?q="
 }
+# Parámetro de paginación de cada base de datos (página 2 en adelante)
+PAGINATION = {
+    "IEEE": lambda page: f"&pageNumber={page}",
+    "ScienceDirect": lambda page: f"&offset={(page - 1) * 25}",
+    "Nature": lambda page: f"&page={page}"
+}
 # Términos a buscar:
 SEARCH_TERMS = ["Computational Thinking", "Abstraction"]
+# Páginas de resultados que se recorren por búsqueda
+MAX_PAGES = 3
+# Detección de casi duplicados (MinHash + LSH, ver deduplicacion) al unificar los BibTeX
+NEAR_DUPLICATES = True
+# Unificación incremental: solo se parsean los .bib nuevos o modificados (ver unificacion_incremental)
+INCREMENTAL_UNIFY = True
+# Backend de extracción HTML ("selectolax", "lxml", "bs4"; None = el más rápido disponible)
+PARSER_BACKEND = None
 
 # Carpeta para almacenar archivos CSV y BibTeX
 DATA_FOLDER = os.path.join(os.getcwd(), "data")
 if not os.path.exists(DATA_FOLDER):
     os.makedirs(DATA_FOLDER)
 
+# Conexión a MySQL (ver connect_to_db)
+DB_CONFIG = {
+    "host": "localhost",
+    "user": "root",
+    "password": "root",
+    "database": "articles_db"
+}
+
+# Backend de almacenamiento: "mysql" (DB_CONFIG) o "sqlite" (archivo local en modo WAL)
+STORAGE_BACKEND = os.environ.get("ARTICLES_STORAGE", "mysql")
+SQLITE_PATH = os.path.join(DATA_FOLDER, "articles.db")
+DB_ERRORS = (mysql.connector.Error, sqlite3.Error)
+
 # Session global para Requests (para preservar cookies, etc.)
 session = requests.Session()
+# Caché de páginas de resultados (revalidación con ETag/Last-Modified, ver cache_http)
+http_cache = HttpCache()
 
 #####################################
 # STEP 1: SCRAPING
 #####################################
 
-def get_articles(database, search_term):
-    """
-    Realiza la búsqueda en la base de datos indicada para el término dado y
-    extrae información relevante. Retorna una lista de diccionarios.
-    """
-    url = BASE_URLS[database] + search_term.replace(" ", "+")
-    # Headers para simular un navegador real
-    headers = {
+def build_search_url(database, search_term, page=1, base_urls=BASE_URLS):
+    """URL de la página `page` (desde 1) de resultados de `search_term` en `database`."""
+    url = base_urls[database] + search_term.replace(" ", "+")
+    if page > 1:
+        url += PAGINATION[database](page)
+    return url
+
+def request_headers(url):
+    """Headers para simular un navegador real."""
+    return {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
                       "AppleWebKit/537.36 (KHTML, like Gecko) "
                       "Chrome/115.0.0.0 Safari/537.36",
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
         "Referer": url
     }
-    
+
+def get_articles(database, search_term, page=1):
+    """
+    Realiza la búsqueda en la base de datos indicada para el término dado y
+    extrae información relevante. Retorna una lista de diccionarios.
+    """
+    url = build_search_url(database, search_term, page)
     print(f"[Scraping] Accediendo a: {url}")
-    response = session.get(url, headers=headers)
+    response = http_cache.get(session, url, headers=request_headers(url))
     
     if response.status_code != 200:
         print(f"Error accediendo a {database} para el término '{search_term}': {response.status_code}")
         return []
-    
-    soup = BeautifulSoup(response.text, "html.parser")
-    articles = []
-    
-    if database == "IEEE":
-        results = soup.select(".List-results-item")
-        for result in results:
-            title_tag = result.find("a")
-            title = title_tag.text.strip() if title_tag else "Unknown"
-            authors_tag = result.find("p", class_="author")
-            authors = authors_tag.text.strip() if authors_tag else "Unknown"
-            year_tag = result.find("div", class_="publisher-info-container")
-            year = year_tag.text.strip() if year_tag else "Unknown"
-            doi_tag = result.find("a", href=lambda href: href and "doi.org" in href)
-            doi = doi_tag.get("href") if doi_tag else "No DOI"
-            url_tag = result.find("a")
-            url_result = url_tag.get("href") if url_tag else "No URL"
-            abstract = "N/A"
-            articles.append({
-                "Article title": title,
-                "Authors": authors,
-                "Volume year": year,
-                "DOI": doi,
-                "URL": url_result,
-                "Abstract": abstract,
-                "Journal title": "IEEE"
-            })
-    
-    elif database == "ScienceDirect":
-        results = soup.select(".ResultItem")
-        for result in results:
-            title_tag = result.find("h2")
-            title = title_tag.text.strip() if title_tag else "Unknown"
-            authors_tag = result.find("span", class_="Authors")
-            authors = authors_tag.text.strip() if authors_tag else "Unknown"
-            year_tag = result.find("span", class_="PublicationDate")
-            year = year_tag.text.strip() if year_tag else "Unknown"
-            doi = "No DOI"  # ScienceDirect a veces no muestra el DOI directamente.
-            url_tag = result.find("a")
-            url_result = url_tag.get("href") if url_tag else "No URL"
-            abstract = "N/A"
-            articles.append({
-                "Article title": title,
-                "Authors": authors,
-                "Volume year": year,
-                "DOI": doi,
-                "URL": url_result,
-                "Abstract": abstract,
-                "Journal title": "ScienceDirect"
-            })
-    
-    elif database == "Nature":
-        results = soup.select(".app-article-item")
-        for result in results:
-            title_tag = result.find("h3")
-            title = title_tag.text.strip() if title_tag else "Unknown"
-            authors_tag = result.find("ul", class_="app-article-authors")
-            authors = authors_tag.text.strip() if authors_tag else "Unknown"
-            meta_tag = result.find("div", class_="app-article-meta")
-            year = meta_tag.text.strip() if meta_tag else "Unknown"
-            doi = "No DOI"
-            url_tag = result.find("a")
-            url_result = url_tag.get("href") if url_tag else "No URL"
-            abstract = "N/A"
-            articles.append({
-                "Article title": title,
-                "Authors": authors,
-                "Volume year": year,
-                "DOI": doi,
-                "URL": url_result,
-                "Abstract": abstract,
-                "Journal title": "Nature"
-            })
-    
-    return articles
+    return http_cache.parse(url, response, lambda html: parse_results(database, html), parser_key(PARSER_BACKEND))
 
-def run_scraper():
+def parse_results(database, html, backend=None):
+    """
+    Extrae los artículos de una página de resultados de `database` con el
+    backend de extractores_html indicado (por defecto PARSER_BACKEND).
+    """
+    return extract_articles(database, html, backend or PARSER_BACKEND)
+
+def run_scraper(base_urls=BASE_URLS, search_terms=SEARCH_TERMS, max_pages=MAX_PAGES, **options):
     """
     Ejecuta el proceso de scraping en las tres bases de datos para los términos
     designados y retorna la lista completa de artículos.
+
+    Las búsquedas se hacen de forma concurrente (ver scraper_async): un token
+    bucket por host reemplaza la pausa fija entre peticiones, los errores
+    transitorios se reintentan con backoff y se recorren hasta max_pages
+    páginas por búsqueda. `options` se pasa a AsyncScraper (rate, retries, ...);
+    por defecto se usa la caché http_cache (cache=None la desactiva).
     """
-    all_articles = []
-    for database in BASE_URLS.keys():
-        for term in SEARCH_TERMS:
-            print(f"[Scraping] Buscando en {database} con el término '{term}'...")
-            articles = get_articles(database, term)
-            all_articles.extend(articles)
-            time.sleep(2)  # Pausa para evitar saturar el servidor
+    options.setdefault("cache", http_cache)
+    options.setdefault("parser_key", parser_key(PARSER_BACKEND))
+    scraper = AsyncScraper(
+        page_url=lambda database, term, page: build_search_url(database, term, page, base_urls),
+        parse=parse_results,
+        headers=request_headers,
+        **options
+    )
+    all_articles = asyncio.run(scraper.scrape_all(list(base_urls.keys()), search_terms, max_pages))
     print(f"[Scraping] Se encontraron un total de {len(all_articles)} artículos.")
     return all_articles
 
-def save_csv(data, filename="scraped_articles.csv"):
+def save_csv(data, filename="scraped_articles.csv", sort_key=None):
     """
     Guarda la información extraída en un archivo CSV.
+    Con sort_key ("year", "author", "title", "doi", ...) el archivo se ordena
+    por ese campo con ordenamiento externo, sin cargarlo completo en memoria.
     """
     if not data:
         print("No hay datos para guardar en CSV.")
@@ -159,6 +149,9 @@ def save_csv(data, filename="scraped_articles.csv"):
         dict_writer.writeheader()
         dict_writer.writerows(data)
     print(f"[CSV] Datos guardados en: {csv_path}")
+    if sort_key:
+        stats = external_sort(csv_path, csv_path, key=sort_key)
+        print(f"[CSV] {stats['records']} registros ordenados por '{sort_key}' ({stats['runs']} corridas)")
     return csv_path
 
 #####################################
@@ -166,55 +159,80 @@ def save_csv(data, filename="scraped_articles.csv"):
 #####################################
 
 def csv_to_bibtex(csv_file_path, bibtex_file_path):
-    df = pd.read_csv(csv_file_path)
-    with open(bibtex_file_path, mode="w", encoding="utf-8") as bib_file:
-        for index, row in df.iterrows():
-            authors = row["Authors"] if isinstance(row["Authors"], str) else "Unknown"
-            year = row["Volume year"] if not pd.isna(row["Volume year"]) else "UnknownYear"
-            bib_key = f"{authors.split(' ')[0]}{year}".replace(" ", "") if isinstance(authors, str) else f"Unknown{year}"
-            bib_file.write(f"@article{{{bib_key},\n")
-            bib_file.write(f"  author = {{{authors}}},\n")
-            bib_file.write(f"  title = {{{row['Article title']}}},\n")
-            bib_file.write(f"  year = {{{year}}},\n")
-            if "Journal title" in row and pd.notna(row["Journal title"]):
-                bib_file.write(f"  journal = {{{row['Journal title']}}},\n")
-            if "DOI" in row and pd.notna(row["DOI"]):
-                bib_file.write(f"  doi = {{{row['DOI']}}},\n")
-            if "URL" in row and pd.notna(row["URL"]):
-                bib_file.write(f"  url = {{{row['URL']}}},\n")
-            bib_file.write("}\n\n")
-    print(f"[Convert] Archivo BibTeX generado: {bibtex_file_path}")
+    """Convierte el CSV de artículos a BibTeX en streaming (ver conversion_bibtex)."""
+    stats = convert_csv_to_bibtex(csv_file_path, bibtex_file_path)
+    print(f"[Convert] Archivo BibTeX generado: {bibtex_file_path} ({stats['entries']} entradas)")
 
 #####################################
 # STEP 3: UNIFICACIÓN Y DUPLICADOS
 #####################################
 
 def load_bibtex_file(file_path):
+    """Entradas del .bib, sin el escape LaTeX de csv_to_bibtex (ver conversion_bibtex.bibtex_parser)."""
     with open(file_path, encoding="utf-8") as bibtex_file:
-        bib_database = bibtexparser.load(bibtex_file)
+        bib_database = bibtexparser.load(bibtex_file, parser=bibtex_parser())
     return bib_database.entries
 
-def separate_duplicates(entries):
+def separate_duplicates(entries, near_duplicates=NEAR_DUPLICATES, return_clusters=False, **options):
+    """
+    Separa las entradas únicas de las duplicadas: primero por clave exacta
+    (deduplicacion.exact_key: doi o, sin DOI conocido, title+author) y, con
+    near_duplicates, por similitud de título y autores
+    (deduplicacion.find_near_duplicates, con sus umbrales en `options`).
+    Con return_clusters también retorna los clusters (ver deduplicacion.cluster_record).
+    """
     unique_entries = {}
     duplicate_entries = []
+    exact_groups = {}
     for entry in entries:
-        key = entry.get("doi", entry.get("title", "") + entry.get("author", ""))
+        key = exact_key(entry)
         if key in unique_entries:
             duplicate_entries.append(entry)
+            exact_groups[key].append(entry)
         else:
             unique_entries[key] = entry
-    return list(unique_entries.values()), duplicate_entries
+            exact_groups[key] = []
+    kept = list(unique_entries.values())
+    groups = list(exact_groups.values())
+    near_clusters = find_near_duplicates(kept, **options) if near_duplicates else {}
+    near_duplicated = {i for members in near_clusters.values() for i, _ in members}
+    duplicate_entries.extend(kept[i] for i in sorted(near_duplicated))
+    if not return_clusters:
+        return [entry for i, entry in enumerate(kept) if i not in near_duplicated], duplicate_entries
+    clusters = []
+    for i, entry in enumerate(kept):
+        if i in near_duplicated:
+            continue
+        members = [(duplicate, "exact", 1.0) for duplicate in groups[i]]
+        for j, similarity in near_clusters.get(i, []):
+            members.append((kept[j], "near", similarity))
+            members.extend((duplicate, "exact", similarity) for duplicate in groups[j])
+        if members:
+            clusters.append(cluster_record(entry, members))
+    return [entry for i, entry in enumerate(kept) if i not in near_duplicated], duplicate_entries, clusters
 
-def unify_bibtex_files(data_folder):
+def unify_bibtex_files(data_folder, incremental=INCREMENTAL_UNIFY):
+    if incremental:
+        stats = IncrementalUnifier(data_folder, near_duplicates=NEAR_DUPLICATES).run()
+        output_unique_path = os.path.join(data_folder, "unified_references.bib")
+        print(f"[Unify] {stats['parsed_files']} de {stats['files']} archivos BibTeX nuevos o modificados"
+              f"{' (índice reconstruido)' if stats['rebuilt'] else ''}: {stats['unique']} entradas agregadas, "
+              f"{stats['duplicates']} duplicadas, "
+              f"{stats['known']} ya unificadas ({stats['seconds']:.2f} s)")
+        print(f"[Unify] Unificación completada. Archivo generado: {output_unique_path}")
+        return output_unique_path
+    # Reconstrucción completa: el índice incremental deja de corresponder a la salida
+    if os.path.exists(os.path.join(data_folder, INDEX_FILENAME)):
+        os.remove(os.path.join(data_folder, INDEX_FILENAME))
     all_entries = []
-    for filename in os.listdir(data_folder):
-        if filename.endswith(".bib"):
+    for filename in sorted(os.listdir(data_folder)):
+        if filename.endswith(".bib") and filename not in OUTPUT_FILENAMES:
             file_path = os.path.join(data_folder, filename)
             print(f"[Unify] Cargando archivo BibTeX: {filename}")
             entries = load_bibtex_file(file_path)
             all_entries.extend(entries)
     print("[Unify] Identificando duplicados...")
-    unique_entries, duplicate_entries = separate_duplicates(all_entries)
+    unique_entries, duplicate_entries, clusters = separate_duplicates(all_entries, return_clusters=True)
     bib_db_unique = bibtexparser.bibdatabase.BibDatabase()
     bib_db_unique.entries = unique_entries
     output_unique_path = os.path.join(data_folder, "unified_references.bib")
@@ -229,6 +247,9 @@ def unify_bibtex_files(data_folder):
         with open(output_duplicates_path, "w", encoding="utf-8") as output_file:
             output_file.write(writer.write(bib_db_duplicates))
         print(f"[Unify] Archivo con duplicados generado: {output_duplicates_path}")
+        output_clusters_path = os.path.join(data_folder, "duplicate_clusters.json")
+        write_clusters(output_clusters_path, clusters)
+        print(f"[Unify] {len(clusters)} clusters de duplicados en: {output_clusters_path}")
     else:
         print("[Unify] No se encontraron artículos duplicados.")
     
@@ -239,81 +260,80 @@ def unify_bibtex_files(data_folder):
 # STEP 4: INSERTAR BIBTEX EN LA BASE DE DATOS
 #####################################
 
+_storage = None
+
+def get_storage():
+    """Backend de almacenamiento configurado en STORAGE_BACKEND (ver almacenamiento)."""
+    global _storage
+    if _storage is None:
+        _storage = open_storage(STORAGE_BACKEND, mysql_config=DB_CONFIG, sqlite_path=SQLITE_PATH)
+    return _storage
+
 def connect_to_db():
+    """
+    Conexión al backend configurado: del pool de MySQL (conn.close() la
+    devuelve al pool) o al archivo SQLite.
+    """
     try:
-        conn = mysql.connector.connect(
-            host="localhost",
-            user="root",
-            password="root",
-            database="articles_db"
-        )
-        return conn
-    except mysql.connector.Error as err:
+        return get_storage().connect()
+    except DB_ERRORS as err:
         print("Error en la conexión a la base de datos:", err)
         return None
 
 def insert_article(cursor, article):
-    sql = """INSERT INTO articles 
-    (abstract, author, doi, issn, journal, keywords, month, note, number, pages, title, type, url, volume, year) 
-    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"""
-    values = (
-        article.get("abstract", "Unknown"),
-        article.get("author", "Unknown"),
-        article.get("doi", "Unknown"),
-        article.get("issn", "Unknown"),
-        article.get("journal", "Unknown"),
-        article.get("keywords", "Unknown"),
-        article.get("month", "Unknown"),
-        article.get("note", "Unknown"),
-        article.get("number", "Unknown"),
-        article.get("pages", "Unknown"),
-        article.get("title", "Unknown"),
-        article.get("type", "Unknown"),
-        article.get("url", "Unknown"),
-        article.get("volume", "Unknown"),
-        int(article.get("year", "0")) if str(article.get("year", "0")).isdigit() else 0
-    )
-    cursor.execute(sql, values)
-
-def insert_bibtex_to_db(bibtex_file_path):
-    with open(bibtex_file_path, encoding="utf-8") as bibtex_file:
-        bib_db = bibtexparser.load(bibtex_file)
-    conn = connect_to_db()
-    if not conn:
-        print("[Insert] No se pudo conectar a la base de datos.")
+    sql = insert_statement(get_storage().dialect)
+    cursor.execute(sql, article_row(article))
+
+def insert_bibtex_to_db(bibtex_file_path, batch_size=DEFAULT_BATCH_SIZE, upsert=True):
+    """
+    Carga las entradas BibTeX en lotes de batch_size filas (ver carga_masiva).
+    Con upsert=True una nueva ejecución actualiza los artículos por DOI (o por
+    título y primer autor si no tienen DOI) en lugar de duplicarlos.
+    """
+    entries = load_bibtex_file(bibtex_file_path)
+    try:
+        stats = get_storage().insert_articles(entries, batch_size=batch_size, upsert=upsert)
+    except DB_ERRORS as err:
+        print("[Insert] Error de base de datos al almacenar los artículos:", err)
         return
-    cursor = conn.cursor()
-    for entry in bib_db.entries:
-        insert_article(cursor, entry)
-    conn.commit()
-    cursor.close()
-    conn.close()
-    print("[Insert] Artículos almacenados en la base de datos.")
+    print(f"[Insert] {stats['rows']} artículos almacenados en la base de datos "
+          f"({stats['batches']} lotes, {stats['rows_per_s']:.0f} filas/s).")
+    return stats
 
 #####################################
 # STEP 5: ANÁLISIS Y VISUALIZACIONES
 #####################################
 
-def analyze_data():
-    conn = connect_to_db()
-    if not conn:
-        print("[Analyze] No se pudo conectar a la base de datos para análisis.")
+def analyze_data(top_n=10):
+    """
+    Histograma de años y autores/journals más frecuentes. Los conteos se
+    calculan con GROUP BY en la base de datos: solo se traen filas agregadas.
+    """
+    storage = get_storage()
+    try:
+        histogram = consultas.year_histogram(storage)
+        top_authors = consultas.top_authors(storage, top_n)
+        top_journals = consultas.top_journals(storage, top_n)
+    except DB_ERRORS as err:
+        print("[Analyze] Error de base de datos durante el análisis:", err)
         return
-    cursor = conn.cursor(dictionary=True)
-    cursor.execute("SELECT * FROM articles")
-    articles_data = cursor.fetchall()
-    cursor.close()
-    conn.close()
     
-    if not articles_data:
+    if not histogram:
         print("[Analyze] No se encontraron artículos para analizar.")
         return
 
+    for label, top in (("autores", top_authors), ("journals", top_journals)):
+        print(f"[Analyze] Top {top_n} {label}:")
+        for value, count in top:
+            print(f"    {count:>6}  {value}")
+
     try:
-        years = [int(article["year"]) for article in articles_data if str(article["year"]).isdigit()]
+        years = [year for year, _ in histogram]
+        counts = [count for _, count in histogram]
         if years:
             plt.figure(figsize=(10,6))
-            plt.hist(years, bins=range(min(years), max(years)+2), color="skyblue", edgecolor="black")
+            # Un valor por año con su conteo como peso: mismo gráfico que el histograma de todas las filas
+            plt.hist(years, bins=range(min(years), max(years)+2), weights=counts, color="skyblue", edgecolor="black")
             plt.xlabel("Año de publicación")
             plt.ylabel("Número de artículos")
             plt.title("Distribución de artículos por año")
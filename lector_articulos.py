@@ -0,0 +1,150 @@
+import json
+import codecs
+
+#############################################
+# LECTURA INCREMENTAL (STREAMING) DE ARTÍCULOS
+#############################################
+#
+# Permite recorrer processed_articles.json sin cargarlo completo en memoria:
+# el arreglo JSON se decodifica objeto por objeto a partir de bloques leídos del
+# archivo, y la lectura se detiene en cuanto se alcanza `limit`. También se
+# admite la variante JSON Lines (un artículo por línea, extensión .jsonl).
+
+CHUNK_SIZE = 64 * 1024
+_WHITESPACE = " \t\n\r"
+
+def _open_text(source):
+    """
+    Retorna (lector_de_texto, debe_cerrarse). `source` puede ser una ruta o un
+    objeto tipo archivo en modo texto o binario (por ejemplo, un archivo subido en Streamlit).
+    """
+    if isinstance(source, (str, bytes)) or hasattr(source, "__fspath__"):
+        return open(source, "r", encoding="utf-8"), True
+    return source, False
+
+def _read_chunks(reader, chunk_size):
+    decoder = None
+    while True:
+        raw = reader.read(chunk_size)
+        chunk = raw
+        if isinstance(raw, bytes):
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder("utf-8-sig")()
+            # Un carácter multibyte puede quedar partido entre bloques: el decodificador lo retiene
+            chunk = decoder.decode(raw, final=not raw)
+        if not raw:
+            if chunk:
+                yield chunk
+            return
+        if chunk:
+            yield chunk
+
+def _iter_json_array(reader, chunk_size):
+    """Decodifica uno a uno los elementos de un arreglo JSON de nivel superior."""
+    decoder = json.JSONDecoder()
+    chunks = _read_chunks(reader, chunk_size)
+    buffer = ""
+    pos = 0
+    eof = False
+
+    def fill():
+        nonlocal buffer, pos, eof
+        chunk = next(chunks, None)
+        if chunk is None:
+            eof = True
+            return False
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        return True
+
+    def skip_whitespace():
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buffer) or not fill():
+                return
+
+    skip_whitespace()
+    if pos < len(buffer) and buffer[pos] == "\ufeff":
+        pos += 1
+        skip_whitespace()
+    if pos >= len(buffer) or buffer[pos] != "[":
+        raise ValueError("Se esperaba un arreglo JSON de artículos.")
+    pos += 1
+
+    expect_value = True
+    while True:
+        skip_whitespace()
+        if pos >= len(buffer):
+            raise ValueError("Arreglo JSON incompleto.")
+        if buffer[pos] == "]":
+            return
+        if not expect_value:
+            if buffer[pos] != ",":
+                raise ValueError(f"Se esperaba ',' entre artículos, se encontró {buffer[pos]!r}.")
+            pos += 1
+            skip_whitespace()
+        while True:
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+                # Un número podría continuar en el siguiente bloque
+                if end < len(buffer) or eof:
+                    break
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            fill()
+        pos = end
+        expect_value = False
+        yield item
+
+def _iter_json_lines(reader):
+    for line in reader:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+def iter_articles(source, limit=None, offset=0, fields=None, chunk_size=CHUNK_SIZE):
+    """
+    Generador de artículos leídos de forma incremental.
+
+    source: ruta o archivo abierto con un arreglo JSON o JSON Lines (.jsonl).
+    limit/offset: ventana de artículos a producir; la lectura termina al completar `limit`.
+    fields: si se indica, cada artículo solo conserva esas claves (proyección).
+    """
+    reader, should_close = _open_text(source)
+    try:
+        name = str(getattr(reader, "name", source))
+        if name.endswith(".jsonl"):
+            items = _iter_json_lines(reader)
+        else:
+            items = _iter_json_array(reader, chunk_size)
+
+        if limit is not None and limit <= 0:
+            return
+        produced = 0
+        for index, article in enumerate(items):
+            if index < offset:
+                continue
+            if fields is not None:
+                article = {field: article[field] for field in fields if field in article}
+            yield article
+            produced += 1
+            if limit is not None and produced >= limit:
+                break
+    finally:
+        if should_close:
+            reader.close()
+
+def write_jsonl(articles, jsonl_path):
+    """Escribe los artículos (cualquier iterable) como JSON Lines, uno por línea."""
+    count = 0
+    with open(jsonl_path, "w", encoding="utf-8") as f:
+        for article in articles:
+            f.write(json.dumps(article, ensure_ascii=False))
+            f.write("\n")
+            count += 1
+    return count
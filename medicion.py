@@ -0,0 +1,166 @@
+import gc
+import os
+import csv
+import json
+import math
+import time
+import signal
+import platform
+import statistics
+import subprocess
+import threading
+from datetime import datetime, timezone
+
+#############################################
+# ARNÉS DE MEDICIÓN DE TIEMPOS (BENCHMARK)
+#############################################
+#
+# Cada medición sigue el mismo protocolo:
+#   1. Copia de los datos fuera de la región medida.
+#   2. Ejecuciones de calentamiento (no se registran).
+#   3. `repeat` ensayos con perf_counter_ns y el recolector de basura desactivado.
+#   4. Resumen con mínimo, mediana, cuartiles e IQR.
+# Un ensayo que supera `timeout_s` o que lanza una excepción se reporta como
+# "timeout" o "error" (tiempo NaN), nunca como 0 ms.
+
+STATUS_OK = "ok"
+STATUS_TIMEOUT = "timeout"
+STATUS_ERROR = "error"
+
+class TrialTimeout(Exception):
+    """Un ensayo superó el tiempo máximo permitido."""
+
+def _can_use_alarm():
+    return hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+
+def _raise_timeout(signum, frame):
+    raise TrialTimeout()
+
+def _copy(data):
+    return data.copy() if hasattr(data, "copy") else list(data)
+
+def run_trial(algorithm, data, timeout_s=None, disable_gc=True):
+    """
+    Ejecuta una vez algorithm(copia de data) y retorna el tiempo en nanosegundos.
+    En Unix (hilo principal) el ensayo se interrumpe con SIGALRM al superar
+    timeout_s; en otras plataformas se detecta al terminar.
+    """
+    working = _copy(data)
+    use_alarm = timeout_s is not None and _can_use_alarm()
+    gc_was_enabled = gc.isenabled()
+    if use_alarm:
+        previous_handler = signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout_s)
+    if disable_gc:
+        gc.collect()
+        gc.disable()
+    try:
+        start = time.perf_counter_ns()
+        algorithm(working)
+        elapsed = time.perf_counter_ns() - start
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+        if disable_gc and gc_was_enabled:
+            gc.enable()
+    if timeout_s is not None and elapsed > timeout_s * 1e9:
+        raise TrialTimeout()
+    return elapsed
+
+def summarize(trials_ns):
+    """Resumen en milisegundos: mínimo, mediana, cuartiles, IQR y media."""
+    trials_ms = sorted(t / 1e6 for t in trials_ns)
+    if len(trials_ms) >= 2:
+        q1, _, q3 = statistics.quantiles(trials_ms, n=4, method="inclusive")
+    else:
+        q1 = q3 = trials_ms[0]
+    return {
+        "min_ms": trials_ms[0],
+        "median_ms": statistics.median(trials_ms),
+        "q1_ms": q1,
+        "q3_ms": q3,
+        "iqr_ms": q3 - q1,
+        "mean_ms": statistics.fmean(trials_ms),
+        "trials_ms": trials_ms,
+    }
+
+def benchmark(algorithm, data, name=None, repeat=5, warmup=1, timeout_s=5.0, disable_gc=True):
+    """
+    Mide `algorithm` sobre `data` y retorna un dict con el estado ("ok",
+    "timeout" o "error") y las estadísticas en ms (NaN si no terminó).
+    Si un ensayo (incluido el calentamiento) excede timeout_s, no se ejecutan
+    más ensayos de ese algoritmo.
+    """
+    result = {
+        "algorithm": name or getattr(algorithm, "__name__", str(algorithm)),
+        "n": len(data),
+        "repeat": repeat,
+        "warmup": warmup,
+        "status": STATUS_OK,
+        "error": None,
+    }
+    trials = []
+    try:
+        for _ in range(warmup):
+            run_trial(algorithm, data, timeout_s, disable_gc)
+        for _ in range(repeat):
+            trials.append(run_trial(algorithm, data, timeout_s, disable_gc))
+    except TrialTimeout:
+        result["status"] = STATUS_TIMEOUT
+        result["error"] = f"Superó {timeout_s} s"
+    except Exception as e:
+        result["status"] = STATUS_ERROR
+        result["error"] = f"{type(e).__name__}: {e}"
+
+    if result["status"] == STATUS_OK and trials:
+        result.update(summarize(trials))
+    else:
+        result.update({key: math.nan for key in ("min_ms", "median_ms", "q1_ms", "q3_ms", "iqr_ms", "mean_ms")})
+        result["trials_ms"] = [t / 1e6 for t in trials]
+    return result
+
+#############################################
+# PERSISTENCIA DE RESULTADOS
+#############################################
+
+CSV_COLUMNS = ["variable", "algorithm", "backend", "n", "status", "min_ms", "median_ms",
+               "q1_ms", "q3_ms", "iqr_ms", "mean_ms", "repeat", "warmup", "error"]
+
+def run_metadata():
+    """Datos del entorno para comparar corridas entre commits."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)), timeout=10).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ""
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit or "unknown",
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+def save_results(results, output_dir, prefix="benchmark", metadata=None):
+    """
+    Guarda los resultados como JSON (con metadatos y ensayos individuales) y
+    como CSV (una fila por medición). Retorna (ruta_json, ruta_csv).
+    """
+    metadata = metadata or run_metadata()
+    os.makedirs(output_dir, exist_ok=True)
+    stamp = metadata["timestamp"].replace(":", "").replace("-", "").split("+")[0]
+    base = os.path.join(output_dir, f"{prefix}-{metadata['commit']}-{stamp}")
+
+    json_path = base + ".json"
+    with open(json_path, "w", encoding="utf-8") as f:
+        # NaN no es JSON válido: se guarda como null
+        clean = [{k: (None if isinstance(v, float) and math.isnan(v) else v) for k, v in r.items()} for r in results]
+        json.dump({"metadata": metadata, "results": clean}, f, ensure_ascii=False, indent=2)
+
+    csv_path = base + ".csv"
+    with open(csv_path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, CSV_COLUMNS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(results)
+    return json_path, csv_path
@@ -1,7 +1,19 @@
 import os
-import time
-import json
-import matplotlib.pyplot as plt
+import math
+import bisect
+import functools
+from almacen_articulos import load_store
+from renderizado import new_figure, save_figure
+from medicion import benchmark, save_results
+from ordenamiento_paralelo import parallel_merge_sort, PARALLEL_MERGE_SORT_NAME
+
+# Backend vectorizado opcional: si NumPy no está disponible solo se mide la versión en Python puro
+try:
+    import numpy as np
+    from ordenamiento_vectorizado import NUMPY_ALGORITHMS
+except ImportError:
+    np = None
+    NUMPY_ALGORITHMS = {}
 
 #############################################
 # FUNCIÓN PARA LEER DATOS LOCALES (JSON)
@@ -19,20 +31,19 @@ def read_articles_local():
         print(f"El archivo {json_filepath} no existe. Verifica el proceso de inserción.")
         return []
     
-    with open(json_filepath, "r", encoding="utf-8") as f:
-        articles = json.load(f)
-    return articles
+    return load_store(json_filepath).records()
 
 #############################################
 # FUNCIONES PARA CONVERTIR LOS DATOS
 #############################################
 
-def process_attribute_data(data):
+def process_attribute_data(data, keep_strings=False):
     """
     Intenta convertir cada elemento a float.
     Si todos pueden convertirse, se utilizarán esos valores (etiqueta "Original");
     de lo contrario, se transforma cada elemento en la suma de los códigos ASCII de sus caracteres
-    (etiqueta "SumaASCII").
+    (etiqueta "SumaASCII"), o bien, con keep_strings=True, se conservan las cadenas
+    tal cual (etiqueta "Texto") para que los algoritmos comparen texto real.
 
     Esto permite analizar cualquier tipo de información (texto, numérico, etc.).
     Retorna: (lista_procesada, etiqueta)
@@ -48,6 +59,8 @@ def process_attribute_data(data):
             break
     if is_numeric:
         return [float(x) for x in data], "Original"
+    elif keep_strings:
+        return [str(x) for x in data], "Texto"
     else:
         return [sum(ord(c) for c in str(x)) for x in data], "SumaASCII"
 
@@ -55,29 +68,140 @@ def process_attribute_data(data):
 # FUNCIÓN PARA MEDIR EL TIEMPO DE EJECUCIÓN DE LOS ALGORITMOS
 #############################################
 
-def measure_time(algorithm, data):
+def measure_time(algorithm, data, repeat=5, warmup=1, timeout_s=5.0):
     """
-    Mide el tiempo de ejecución de un algoritmo de ordenamiento aplicado a los datos.
-    Retorna el tiempo en milisegundos.
+    Mide el tiempo de ejecución de un algoritmo de ordenamiento aplicado a los datos
+    con el arnés de medicion.benchmark (copia fuera de la región medida,
+    calentamiento, varios ensayos, GC desactivado y tiempo máximo por ensayo).
+    Retorna la mediana en milisegundos, o NaN si el algoritmo falló o superó el tiempo.
     """
-    try:
-        start_time = time.time()
-        _ = algorithm(data.copy())
-        end_time = time.time()
-        return (end_time - start_time) * 1000  # Tiempo en ms
-    except Exception as e:
-        print(f"Error al ejecutar {algorithm.__name__}: {e}")
-        return 0
+    result = benchmark(algorithm, data, repeat=repeat, warmup=warmup, timeout_s=timeout_s)
+    if result["status"] != "ok":
+        print(f"Error al ejecutar {result['algorithm']} ({result['status']}): {result['error']}")
+    return result["median_ms"]
+
+#############################################
+# API CON CLAVE (key=) PARA CADENAS, TUPLAS Y REGISTROS
+#############################################
+#
+# Todos los algoritmos aceptan `key=`. Los algoritmos por comparación ordenan
+# tuplas decoradas (clave, posición, elemento): la posición hace el resultado
+# estable y evita comparar los elementos (por ejemplo, dicts de artículos).
+# Las claves str se pre-codifican a bytes UTF-8 una sola vez; el orden de
+# bytes UTF-8 coincide con el orden de puntos de código de str, y comparar
+# bytes evita repetir comparaciones Unicode. Los algoritmos de distribución
+# (pigeonhole, bucket, radix) tienen rutas propias para claves no numéricas.
+
+def _encode_key(value):
+    return value.encode("utf-8") if isinstance(value, str) else value
+
+def _identity(value):
+    return value
+
+def _is_plain_number_list(arr):
+    """True si arr contiene solo números (int/float), el caso de la ruta original."""
+    return all(isinstance(x, (int, float)) and not isinstance(x, bool) for x in arr)
+
+def _sort_decorated(algorithm, arr, key):
+    """Ordena arr según key(x) usando `algorithm` sobre tuplas (clave codificada, posición, elemento)."""
+    decorated = [(_encode_key(key(x)), i, x) for i, x in enumerate(arr)]
+    result = algorithm(decorated)
+    arr[:] = [x for _, _, x in result]
+    return arr
+
+def _insertion_sort_pairs(pairs, lo, hi):
+    """Inserción estable sobre pares (clave, elemento) en pairs[lo:hi]."""
+    for i in range(lo + 1, hi):
+        item = pairs[i]
+        j = i - 1
+        while j >= lo and pairs[j][0] > item[0]:
+            pairs[j + 1] = pairs[j]
+            j -= 1
+        pairs[j + 1] = item
+
+def _msd_radix_bytes(pairs, cutoff=32):
+    """
+    Radix MSD estable e iterativo sobre pares (clave_bytes, elemento). En cada
+    nivel se distribuye por el byte en la posición `depth` (0 = la clave ya
+    terminó, 1..256 = byte + 1); los rangos pequeños se terminan por inserción.
+    """
+    stack = [(0, len(pairs), 0)]
+    while stack:
+        lo, hi, depth = stack.pop()
+        if hi - lo <= cutoff:
+            _insertion_sort_pairs(pairs, lo, hi)
+            continue
+        buckets = [[] for _ in range(257)]
+        for pair in pairs[lo:hi]:
+            k = pair[0]
+            buckets[k[depth] + 1 if depth < len(k) else 0].append(pair)
+        position = lo
+        for byte, bucket in enumerate(buckets):
+            if not bucket:
+                continue
+            pairs[position:position + len(bucket)] = bucket
+            # Las claves agotadas (byte 0) ya son iguales entre sí: no se subdividen
+            if byte and len(bucket) > 1:
+                stack.append((position, position + len(bucket), depth + 1))
+            position += len(bucket)
+    return pairs
+
+def _lsd_radix_ints(pairs):
+    """Radix LSD estable en base 10 sobre pares (clave_entera, elemento); admite negativos."""
+    if not pairs:
+        return pairs
+    offset = min(k for k, _ in pairs)
+    shifted = [(k - offset, item) for k, item in pairs]
+    max_val = max(k for k, _ in shifted)
+    exp = 1
+    while max_val // exp > 0:
+        buckets = [[] for _ in range(10)]
+        for pair in shifted:
+            buckets[(pair[0] // exp) % 10].append(pair)
+        shifted = [pair for bucket in buckets for pair in bucket]
+        exp *= 10
+    return [(k + offset, item) for k, item in shifted]
+
+def _radix_pairs(pairs):
+    """Radix por tipo de clave: enteros (LSD), str/bytes (MSD) o tuplas (LSD por componente)."""
+    if not pairs:
+        return pairs
+    sample = pairs[0][0]
+    if isinstance(sample, tuple):
+        # Cada componente es un "dígito": de la última a la primera, con pasadas estables
+        width = max(len(k) for k, _ in pairs)
+        for position in range(width - 1, -1, -1):
+            # Las tuplas más cortas van antes (como en la comparación de tuplas): se marcan con (0,)
+            component = [((1, k[position]) if position < len(k) else (0,), (k, item)) for k, item in pairs]
+            present = [pair for pair in component if pair[0][0] == 1]
+            absent = [pair for pair in component if pair[0][0] == 0]
+            ordered = _radix_pairs([(c[1], rest) for c, rest in present])
+            pairs = [rest for _, rest in absent] + [rest for _, rest in ordered]
+        return pairs
+    if isinstance(sample, (str, bytes)):
+        encoded = [(_encode_key(k), (k, item)) for k, item in pairs]
+        return [rest for _, rest in _msd_radix_bytes(encoded)]
+    if all(isinstance(k, int) for k, _ in pairs):
+        return _lsd_radix_ints(pairs)
+    raise TypeError(f"Radix sort requiere claves enteras, de texto o tuplas de ellas, no {type(sample).__name__}")
+
+def _sample_splitters(keys, bucket_count):
+    """Elige bucket_count - 1 separadores a partir de una muestra ordenada de las claves (sample sort)."""
+    step = max(1, len(keys) // (bucket_count * 4))
+    sample = sorted(keys[::step])
+    return [sample[(i * len(sample)) // bucket_count] for i in range(1, bucket_count)]
 
 #############################################
 # IMPLEMENTACIÓN DE ALGORITMOS DE ORDENAMIENTO
 # (Se conservan los 13 originales y se añaden 2 nuevos, totalizando 15)
 #############################################
 
-def tim_sort(arr):
-    return sorted(arr)
+def tim_sort(arr, key=None):
+    return sorted(arr, key=None if key is None else (lambda x: _encode_key(key(x))))
 
-def comb_sort(arr):
+def comb_sort(arr, key=None):
+    if key is not None:
+        return _sort_decorated(comb_sort, arr, key)
     gap = len(arr)
     shrink = 1.3
     sorted_flag = False
@@ -94,7 +218,9 @@ def comb_sort(arr):
             i += 1
     return arr
 
-def selection_sort(arr):
+def selection_sort(arr, key=None):
+    if key is not None:
+        return _sort_decorated(selection_sort, arr, key)
     for i in range(len(arr)):
         min_idx = i
         for j in range(i+1, len(arr)):
@@ -103,7 +229,9 @@ def selection_sort(arr):
         arr[i], arr[min_idx] = arr[min_idx], arr[i]
     return arr
 
-def tree_sort(arr):
+def tree_sort(arr, key=None):
+    if key is not None:
+        return _sort_decorated(tree_sort, arr, key)
     class Node:
         def __init__(self, value):
             self.left = None
@@ -140,7 +268,29 @@ def tree_sort(arr):
     inorder_traversal(root, sorted_arr)
     return sorted_arr
 
-def pigeonhole_sort(arr):
+def pigeonhole_sort(arr, key=None):
+    """
+    Pigeonhole sort. Con números y sin key se usa la versión original (un
+    casillero por entero del rango). Con key, o con claves no numéricas, cada
+    casillero guarda los elementos completos: para claves enteras hay un
+    casillero por valor del rango; para otras claves (texto, tuplas), uno por
+    clave distinta, recorridos en orden.
+    """
+    if key is not None or not _is_plain_number_list(arr):
+        key = key or _identity
+        keys = [_encode_key(key(x)) for x in arr]
+        if keys and all(isinstance(k, int) and not isinstance(k, bool) for k in keys):
+            min_val = min(keys)
+            holes = [[] for _ in range(max(keys) - min_val + 1)]
+            for k, x in zip(keys, arr):
+                holes[k - min_val].append(x)
+            arr[:] = [x for hole in holes for x in hole]
+            return arr
+        holes = {}
+        for k, x in zip(keys, arr):
+            holes.setdefault(k, []).append(x)
+        arr[:] = [x for k in sorted(holes) for x in holes[k]]
+        return arr
     min_val = min(arr)
     max_val = max(arr)
     size = int(max_val - min_val + 1)
@@ -154,7 +304,34 @@ def pigeonhole_sort(arr):
             holes[count] -= 1
     return sorted_arr
 
-def bucket_sort(arr):
+def bucket_sort(arr, key=None):
+    """
+    Bucket sort. Con números y sin key se usa la versión original (cubetas por
+    interpolación lineal). Con key numérica se interpola sobre la clave; con
+    claves de texto o tuplas las cubetas se delimitan con separadores tomados
+    de una muestra de las claves (sample sort) y se ubican con bisect.
+    """
+    if key is not None or not _is_plain_number_list(arr):
+        key = key or _identity
+        pairs = [(_encode_key(key(x)), x) for x in arr]
+        if not pairs:
+            return arr
+        bucket_count = len(pairs)
+        keys = [k for k, _ in pairs]
+        if all(isinstance(k, (int, float)) and not isinstance(k, bool) for k in keys):
+            min_val, max_val = min(keys), max(keys)
+            index = lambda k: int(bucket_count * (k - min_val) / (max_val - min_val + 1))
+        else:
+            bucket_count = max(1, min(bucket_count, 256))
+            splitters = _sample_splitters(keys, bucket_count)
+            index = lambda k: bisect.bisect_right(splitters, k)
+        buckets = [[] for _ in range(bucket_count)]
+        for pair in pairs:
+            buckets[index(pair[0])].append(pair)
+        for bucket in buckets:
+            bucket.sort(key=lambda pair: pair[0])
+        arr[:] = [x for bucket in buckets for _, x in bucket]
+        return arr
     min_val = min(arr)
     max_val = max(arr)
     bucket_count = len(arr)
@@ -169,7 +346,9 @@ def bucket_sort(arr):
         sorted_arr.extend(bucket)
     return sorted_arr
 
-def quicksort(arr):
+def quicksort(arr, key=None):
+    if key is not None:
+        return _sort_decorated(quicksort, arr, key)
     if len(arr) <= 1:
         return arr
     pivot = arr[len(arr)//2]
@@ -178,7 +357,9 @@ def quicksort(arr):
     right = [x for x in arr if x > pivot]
     return quicksort(left) + middle + quicksort(right)
 
-def heapsort(arr):
+def heapsort(arr, key=None):
+    if key is not None:
+        return _sort_decorated(heapsort, arr, key)
     def heapify(arr, n, i):
         largest = i
         l = 2*i + 1
@@ -198,7 +379,9 @@ def heapsort(arr):
         heapify(arr, i, 0)
     return arr
 
-def bitonic_sort(arr, up=True):
+def bitonic_sort(arr, up=True, key=None):
+    if key is not None:
+        return _sort_decorated(lambda a: bitonic_sort(a, up), arr, key)
     def bitonic_merge(A, up):
         if len(A) <= 1:
             return A
@@ -217,7 +400,9 @@ def bitonic_sort(arr, up=True):
         second = bitonic_sort(arr[mid:], False)
         return bitonic_merge(first + second, up)
 
-def gnome_sort(arr):
+def gnome_sort(arr, key=None):
+    if key is not None:
+        return _sort_decorated(gnome_sort, arr, key)
     index = 0
     while index < len(arr):
         if index == 0 or arr[index] >= arr[index-1]:
@@ -227,7 +412,9 @@ def gnome_sort(arr):
             index -= 1
     return arr
 
-def binary_insertion_sort(arr):
+def binary_insertion_sort(arr, key=None):
+    if key is not None:
+        return _sort_decorated(binary_insertion_sort, arr, key)
     for i in range(1, len(arr)):
         key = arr[i]
         left, right = 0, i-1
@@ -242,7 +429,17 @@ def binary_insertion_sort(arr):
         arr[left] = key
     return arr
 
-def radix_sort(arr):
+def radix_sort(arr, key=None):
+    """
+    Radix sort. Con números y sin key se usa la versión original (LSD en base
+    10). Con key, o con elementos no numéricos, se usa la ruta por tipo de
+    clave: LSD para enteros (incluidos negativos), MSD sobre los bytes UTF-8
+    para texto y LSD por componente para tuplas.
+    """
+    if key is not None or not _is_plain_number_list(arr):
+        key = key or _identity
+        arr[:] = [x for _, x in _radix_pairs([(key(x), x) for x in arr])]
+        return arr
     max_val = max(arr)
     exp = 1
     while max_val // exp > 0:
@@ -250,7 +447,14 @@ def radix_sort(arr):
         exp *= 10
     return arr
 
-def count_sort(arr, exp):
+def count_sort(arr, exp, key=None):
+    """Pasada estable de counting sort por el dígito (valor // exp) % 10 del elemento o de key(elemento)."""
+    if key is not None:
+        buckets = [[] for _ in range(10)]
+        for x in arr:
+            buckets[int((key(x) // exp) % 10)].append(x)
+        arr[:] = [x for bucket in buckets for x in bucket]
+        return
     n = len(arr)
     output = [0] * n
     count = [0] * 10
@@ -266,7 +470,9 @@ def count_sort(arr, exp):
     for i in range(n):
         arr[i] = output[i]
 
-def bubble_sort(arr):
+def bubble_sort(arr, key=None):
+    if key is not None:
+        return _sort_decorated(bubble_sort, arr, key)
     n = len(arr)
     for i in range(n):
         for j in range(0, n-i-1):
@@ -276,10 +482,12 @@ def bubble_sort(arr):
 
 # NUEVOS ALGORITMOS
 
-def bidirectional_bubble_sort(arr):
+def bidirectional_bubble_sort(arr, key=None):
     """
     Burbuja de doble dirección: ordena la lista en ambas direcciones en cada pasada.
     """
+    if key is not None:
+        return _sort_decorated(bidirectional_bubble_sort, arr, key)
     left = 0
     right = len(arr) - 1
     swapped = True
@@ -297,10 +505,12 @@ def bidirectional_bubble_sort(arr):
         left += 1
     return arr
 
-def busrbu_sort(arr):
+def busrbu_sort(arr, key=None):
     """
     Algoritmo de ordenamiento basado en burbuja con variación por pasos de 2 (intercambios en bloques).
     """
+    if key is not None:
+        return _sort_decorated(busrbu_sort, arr, key)
     n = len(arr)
     for i in range(n):
         for j in range(0, n - i - 1, 2):  # Intercambia cada 2 elementos
@@ -309,35 +519,354 @@ def busrbu_sort(arr):
     return arr
 
 #############################################
-# GENERACIÓN DE GRÁFICOS
+# VARIANTES ITERATIVAS (SEGURAS ANTE ENTRADAS ORDENADAS O CON DUPLICADOS)
 #############################################
 
-def plot_times(algorithms, times, variable, type_label):
-    plt.figure(figsize=(10, 6))
-    plt.bar(algorithms, times, color='skyblue')
-    plt.xlabel('Algoritmos de Ordenamiento')
-    plt.ylabel('Tiempo de ejecución (ms)')
-    plt.title(f'Comparación de tiempos para {variable} ({type_label})')
-    plt.xticks(rotation=45)
-    plt.tight_layout()
+class _AVLNode:
+    __slots__ = ("value", "items", "left", "right", "height")
+
+    def __init__(self, value):
+        self.value = value
+        self.items = [value]
+        self.left = None
+        self.right = None
+        self.height = 1
+
+def _avl_height(node):
+    return node.height if node else 0
+
+def _avl_update(node):
+    node.height = 1 + max(_avl_height(node.left), _avl_height(node.right))
+
+def _avl_rotate_right(node):
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    _avl_update(node)
+    _avl_update(pivot)
+    return pivot
+
+def _avl_rotate_left(node):
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    _avl_update(node)
+    _avl_update(pivot)
+    return pivot
+
+def _avl_rebalance(node):
+    _avl_update(node)
+    balance = _avl_height(node.left) - _avl_height(node.right)
+    if balance > 1:
+        if _avl_height(node.left.left) < _avl_height(node.left.right):
+            node.left = _avl_rotate_left(node.left)
+        return _avl_rotate_right(node)
+    if balance < -1:
+        if _avl_height(node.right.right) < _avl_height(node.right.left):
+            node.right = _avl_rotate_right(node.right)
+        return _avl_rotate_left(node)
+    return node
+
+def tree_sort_iterative(arr, key=None):
+    """
+    Tree sort sobre un árbol AVL con nodos __slots__. La inserción y el
+    recorrido inorden son iterativos (pila explícita) y los duplicados se
+    acumulan en la lista del nodo (en orden de llegada), así que la altura es O(log n) incluso con
+    entradas ordenadas o con pocos valores distintos (como 'Año').
+    """
+    if key is not None:
+        return _sort_decorated(tree_sort_iterative, arr, key)
+    root = None
+    for value in arr:
+        if root is None:
+            root = _AVLNode(value)
+            continue
+        path = []
+        node = root
+        while True:
+            if value == node.value:
+                node.items.append(value)
+                path = None  # La forma del árbol no cambia
+                break
+            path.append(node)
+            child = node.left if value < node.value else node.right
+            if child is None:
+                if value < node.value:
+                    node.left = _AVLNode(value)
+                else:
+                    node.right = _AVLNode(value)
+                break
+            node = child
+        if path is None:
+            continue
+        # Rebalanceo de abajo hacia arriba; se detiene cuando la altura del subárbol no cambia
+        for depth in range(len(path) - 1, -1, -1):
+            node = path[depth]
+            old_height = node.height
+            balanced = _avl_rebalance(node)
+            if balanced is node:
+                if node.height == old_height:
+                    break
+                continue
+            if depth == 0:
+                root = balanced
+            elif path[depth - 1].left is node:
+                path[depth - 1].left = balanced
+            else:
+                path[depth - 1].right = balanced
+            # Tras una rotación por inserción el subárbol recupera su altura previa
+            break
+
+    sorted_arr = []
+    stack = []
+    node = root
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        sorted_arr.extend(node.items)
+        node = node.right
+    return sorted_arr
 
+def _insertion_sort_range(arr, lo, hi):
+    for i in range(lo + 1, hi + 1):
+        key = arr[i]
+        j = i - 1
+        while j >= lo and arr[j] > key:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = key
+
+def _heapsort_range(arr, lo, hi):
+    """Heapsort in-place del rango arr[lo..hi] (sift-down iterativo)."""
+    n = hi - lo + 1
+
+    def sift_down(start, end):
+        root = start
+        while True:
+            child = 2 * root + 1
+            if child >= end:
+                return
+            if child + 1 < end and arr[lo + child] < arr[lo + child + 1]:
+                child += 1
+            if arr[lo + root] < arr[lo + child]:
+                arr[lo + root], arr[lo + child] = arr[lo + child], arr[lo + root]
+                root = child
+            else:
+                return
+
+    for start in range(n // 2 - 1, -1, -1):
+        sift_down(start, n)
+    for end in range(n - 1, 0, -1):
+        arr[lo], arr[lo + end] = arr[lo + end], arr[lo]
+        sift_down(0, end)
+
+def quicksort_introsort(arr, small=16, key=None):
+    """
+    Introsort in-place e iterativo: pivote mediana de tres, partición de Hoare
+    (los iguales al pivote se reparten entre ambos lados, así que los
+    duplicados no degradan la recursión), inserción para rangos pequeños y heapsort si la profundidad supera 2·log2(n). La pila
+    explícita procesa primero la partición más pequeña, así que ocupa O(log n).
+    """
+    if key is not None:
+        return _sort_decorated(lambda a: quicksort_introsort(a, small), arr, key)
+    n = len(arr)
+    if n < 2:
+        return arr
+    max_depth = 2 * n.bit_length()
+    stack = [(0, n - 1, 0)]
+    while stack:
+        lo, hi, depth = stack.pop()
+        while hi - lo + 1 > small:
+            if depth > max_depth:
+                _heapsort_range(arr, lo, hi)
+                break
+            depth += 1
+            mid = (lo + hi) // 2
+            a, b, c = arr[lo], arr[mid], arr[hi]
+            if a < b:
+                pivot = b if b < c else (c if a < c else a)
+            else:
+                pivot = a if a < c else (c if b < c else b)
+            # Partición de Hoare: al terminar, arr[lo..j] <= pivote <= arr[i..hi]
+            i, j = lo, hi
+            while i <= j:
+                while arr[i] < pivot:
+                    i += 1
+                while pivot < arr[j]:
+                    j -= 1
+                if i <= j:
+                    arr[i], arr[j] = arr[j], arr[i]
+                    i += 1
+                    j -= 1
+            if j - lo < hi - i:
+                stack.append((i, hi, depth))
+                hi = j
+            else:
+                stack.append((lo, j, depth))
+                lo = i
+        else:
+            _insertion_sort_range(arr, lo, hi)
+    return arr
+
+def bitonic_sort_inplace(arr, up=True, key=None):
+    """
+    Red bitónica iterativa e in-place. Si la longitud no es potencia de dos se
+    rellena con copias del máximo (que terminan al final y se recortan), así
+    que funciona para cualquier tamaño y cualquier tipo comparable.
+    """
+    if key is not None:
+        return _sort_decorated(lambda a: bitonic_sort_inplace(a, up), arr, key)
+    n = len(arr)
+    if n <= 1:
+        return arr
+    size = 1 << (n - 1).bit_length()
+    if size > n:
+        arr.extend([max(arr)] * (size - n))
+    k = 2
+    while k <= size:
+        j = k // 2
+        while j > 0:
+            for i in range(size):
+                partner = i ^ j
+                if partner > i:
+                    ascending = (i & k) == 0
+                    if (arr[i] > arr[partner]) == ascending:
+                        arr[i], arr[partner] = arr[partner], arr[i]
+            j //= 2
+        k *= 2
+    del arr[n:]
+    if not up:
+        arr.reverse()
+    return arr
+
+#############################################
+# REGISTRO DE ALGORITMOS
+#############################################
+
+# Procesos usados por 'Parallel Merge Sort' (None = todas las CPU)
+PARALLEL_SORT_WORKERS = None
+
+# Lista de algoritmos (16 en total: 13 originales + 2 nuevos + merge sort paralelo)
+algorithms_list = [
+    'TimSort',
+    'Comb Sort',
+    'Selection Sort',
+    'Tree Sort',
+    'Pigeonhole Sort',
+    'Bucket Sort',
+    'Quick Sort',
+    'Heap Sort',
+    'Bitonic Sort',
+    'Gnome Sort',
+    'Binary Insertion Sort',
+    'Radix Sort',
+    'Bubble Sort',
+    'Bidirectional Bubble Sort',
+    'Busrbu Sort',
+    PARALLEL_MERGE_SORT_NAME
+]
+
+# Mapeo de nombres a funciones
+algorithms_funcs = {
+    'TimSort': tim_sort,
+    'Comb Sort': comb_sort,
+    'Selection Sort': selection_sort,
+    'Tree Sort': tree_sort,
+    'Pigeonhole Sort': pigeonhole_sort,
+    'Bucket Sort': bucket_sort,
+    'Quick Sort': quicksort,
+    'Heap Sort': heapsort,
+    'Bitonic Sort': bitonic_sort,
+    'Gnome Sort': gnome_sort,
+    'Binary Insertion Sort': binary_insertion_sort,
+    'Radix Sort': radix_sort,
+    'Bubble Sort': bubble_sort,
+    'Bidirectional Bubble Sort': bidirectional_bubble_sort,
+    'Busrbu Sort': busrbu_sort,
+    PARALLEL_MERGE_SORT_NAME: functools.partial(parallel_merge_sort, workers=PARALLEL_SORT_WORKERS)
+}
+
+def benchmark_cell(variable, backend, algo_name, data, repeat=5, warmup=1, timeout_s=5.0):
+    """
+    Mide una celda de la matriz de benchmarks. Para el backend "python" los
+    datos se convierten a lista; para "numpy" se usa una copia del arreglo.
+    """
+    if backend == "numpy":
+        function = NUMPY_ALGORITHMS[algo_name]
+        data = np.array(data)
+    else:
+        function = algorithms_funcs[algo_name]
+        data = data.tolist() if hasattr(data, "tolist") else list(data)
+    result = benchmark(function, data, name=algo_name, repeat=repeat, warmup=warmup, timeout_s=timeout_s)
+    result.update({"variable": variable, "backend": backend})
+    return result
+
+#############################################
+# GENERACIÓN DE GRÁFICOS
+#############################################
+
+def times_figure(algorithms, times, variable, type_label, vectorized_times=None):
+    """
+    Gráfico de barras de tiempos por algoritmo. Si se pasan vectorized_times,
+    se dibujan lado a lado "Python puro" y "NumPy vectorizado" para cada algoritmo.
+    """
+    figure = new_figure((10, 6))
+    ax = figure.add_subplot()
+    if vectorized_times is None:
+        ax.bar(algorithms, times, color='skyblue')
+    else:
+        positions = range(len(algorithms))
+        width = 0.4
+        ax.bar([p - width / 2 for p in positions], times, width, color='skyblue', label='Python puro')
+        ax.bar([p + width / 2 for p in positions], vectorized_times, width, color='orange', label='NumPy vectorizado')
+        ax.set_xticks(list(positions), algorithms)
+        ax.set_yscale('log')
+        ax.legend()
+    # Los algoritmos sin tiempo (NaN por error o timeout) se marcan explícitamente en lugar de mostrar 0 ms
+    for position, value in enumerate(times):
+        if value is None or math.isnan(value):
+            ax.annotate('sin dato', (position, 0), xycoords=('data', 'axes fraction'),
+                        ha='center', va='bottom', rotation=90, color='red', fontsize=8)
+    ax.set_xlabel('Algoritmos de Ordenamiento')
+    ax.set_ylabel('Tiempo de ejecución (ms)')
+    ax.set_title(f'Comparación de tiempos para {variable} ({type_label})')
+    ax.tick_params(axis='x', labelrotation=45)
+    figure.tight_layout()
+    return figure
+
+def plot_times(algorithms, times, variable, type_label, vectorized_times=None):
+    """Guarda times_figure en resultados/<variable>.png y retorna la ruta."""
     script_dir = os.path.dirname(os.path.abspath(__file__))
     results_folder = os.path.join(script_dir, "resultados")
-    if not os.path.exists(results_folder):
-        os.makedirs(results_folder)
     filename = f"{variable.replace(' ', '_')}.png"
-    filepath = os.path.join(results_folder, filename)
-    plt.savefig(filepath)
+    filepath = save_figure(times_figure(algorithms, times, variable, type_label, vectorized_times),
+                           os.path.join(results_folder, filename))
     print(f"Gráfico guardado en: {filepath}")
-    
-    # Se ha removido plt.show() para evitar que la visualización bloquee la ejecución.
-    plt.close()
+    return filepath
 
 #############################################
 # PROCESO PRINCIPAL
 #############################################
 
-def main():
+def main(compare_vectorized=True, repeat=5, warmup=1, timeout_s=5.0, parallel=False, workers=None, one_per_core=False,
+         scaling=False, scaling_sizes=None, string_keys=False, sort_workers=None):
+    """
+    Ejecuta el benchmark de los 16 algoritmos sobre cada variable del JSON.
+    Con parallel=True cada celda (variable, backend, algoritmo) se ejecuta en un
+    pool de procesos (ver ejecucion_paralela.run_matrix); workers y one_per_core
+    controlan cuántos procesos se usan y si se limita a uno por núcleo físico.
+    Con scaling=True además se barre el tamaño de la entrada y se ajusta el
+    exponente de complejidad de cada algoritmo (ver escalamiento.scaling_sweep).
+    Con string_keys=True los atributos de texto (Author, Título, Journal, ...)
+    se ordenan como cadenas reales en lugar de sumas ASCII.
+    sort_workers fija cuántos procesos usa 'Parallel Merge Sort' (por defecto
+    PARALLEL_SORT_WORKERS, es decir, todas las CPU).
+    """
+    if sort_workers is not None:
+        algorithms_funcs[PARALLEL_MERGE_SORT_NAME] = functools.partial(parallel_merge_sort, workers=sort_workers)
+
     # Leer el JSON desde la raíz del proyecto
     script_dir = os.path.dirname(os.path.abspath(__file__))
     json_filepath = os.path.join(script_dir, "processed_articles.json")
@@ -346,79 +875,93 @@ def main():
         print("No se encontraron datos en el archivo processed_articles.json. Verifica el proceso de inserción.")
         return
     
-    with open(json_filepath, "r", encoding="utf-8") as f:
-        articles_data = json.load(f)
+    store = load_store(json_filepath)
     
-    print("Datos extraídos localmente:", len(articles_data))
-    if len(articles_data) == 0:
+    print("Datos extraídos localmente:", len(store))
+    if len(store) == 0:
         print("El archivo processed_articles.json está vacío.")
         return
 
-    # Extracción de variables (excluyendo "abstract" para este script)
+    # Extracción de variables desde las columnas del almacén (excluyendo "abstract" para este script)
     variables = {
-        'Año': [int(article.get("year", 0)) if str(article.get("year", "0")).isdigit() else 0 for article in articles_data],
-        'Author': [article.get("author", "Unknown") for article in articles_data],
-        'DOI': [article.get("doi", "Unknown") for article in articles_data],
-        'Journal': [article.get("journal", "Unknown") for article in articles_data],
-        'Mes': [article.get("month", "Unknown") for article in articles_data],
-        'Tipo': [article.get("type", "Unknown") for article in articles_data],
-        'Título': [article.get("title", "Unknown") for article in articles_data]
-    }
-
-    # Lista de algoritmos (15 en total: 13 originales + 2 nuevos)
-    algorithms_list = [
-        'TimSort',
-        'Comb Sort',
-        'Selection Sort',
-        'Tree Sort',
-        'Pigeonhole Sort',
-        'Bucket Sort',
-        'Quick Sort',
-        'Heap Sort',
-        'Bitonic Sort',
-        'Gnome Sort',
-        'Binary Insertion Sort',
-        'Radix Sort',
-        'Bubble Sort',
-        'Bidirectional Bubble Sort',
-        'Busrbu Sort'
-    ]
-
-    # Mapeo de nombres a funciones
-    algorithms_funcs = {
-        'TimSort': tim_sort,
-        'Comb Sort': comb_sort,
-        'Selection Sort': selection_sort,
-        'Tree Sort': tree_sort,
-        'Pigeonhole Sort': pigeonhole_sort,
-        'Bucket Sort': bucket_sort,
-        'Quick Sort': quicksort,
-        'Heap Sort': heapsort,
-        'Bitonic Sort': bitonic_sort,
-        'Gnome Sort': gnome_sort,
-        'Binary Insertion Sort': binary_insertion_sort,
-        'Radix Sort': radix_sort,
-        'Bubble Sort': bubble_sort,
-        'Bidirectional Bubble Sort': bidirectional_bubble_sort,
-        'Busrbu Sort': busrbu_sort
+        'Año': store.years().tolist(),
+        'Author': store.column("author", "Unknown"),
+        'DOI': store.column("doi", "Unknown"),
+        'Journal': store.column("journal", "Unknown"),
+        'Mes': store.column("month", "Unknown"),
+        'Tipo': store.column("type", "Unknown"),
+        'Título': store.column("title", "Unknown")
     }
 
+    processed = {}
     for variable, data in variables.items():
         print(f"\nAnalizando variable: {variable} con {len(data)} elementos")
         # Se utiliza la lista completa extraída del JSON para cada atributo
         working_data = data
-        processed_data, type_label = process_attribute_data(working_data)
+        processed_data, type_label = process_attribute_data(working_data, keep_strings=string_keys)
         print(f"Procesado para {variable} ({type_label}): {len(processed_data)} elementos")
-        times = []
-        for algo_name in algorithms_list:
-            function = algorithms_funcs[algo_name]
-            time_taken = measure_time(function, processed_data)
-            times.append(time_taken)
-            print(f"Tiempo de {algo_name} para {variable}: {time_taken:.4f} ms")
-        plot_times(algorithms_list, times, variable, type_label)
+        processed[variable] = (processed_data, type_label)
+
+    backends = ["python"]
+    if compare_vectorized and NUMPY_ALGORITHMS:
+        backends.append("numpy")
+    # Los algoritmos de NUMPY_ALGORITHMS operan sobre arreglos numéricos: las columnas "Texto"
+    # (string_keys) solo se miden con el backend de Python
+    variable_backends = {variable: [b for b in backends if b == "python" or type_label != "Texto"]
+                         for variable, (_, type_label) in processed.items()}
+    cells = [(variable, backend, algo_name) for variable in processed for backend in variable_backends[variable]
+             for algo_name in algorithms_list]
+    options = {"repeat": repeat, "warmup": warmup, "timeout_s": timeout_s}
+
+    if parallel and np is not None:
+        from ejecucion_paralela import run_matrix
+        arrays = {variable: np.asarray(processed_data) for variable, (processed_data, _) in processed.items()}
+        all_results = run_matrix(benchmark_cell, arrays, cells, workers=workers, one_per_core=one_per_core, **options)
+    else:
+        all_results = [benchmark_cell(*cell, processed[cell[0]][0], **options) for cell in cells]
 
+    for result in all_results:
+        label = f"{result['algorithm']} (NumPy)" if result["backend"] == "numpy" else result["algorithm"]
+        if result["status"] == "ok":
+            print(f"Tiempo de {label} para {result['variable']}: mediana {result['median_ms']:.4f} ms "
+                  f"(mín {result['min_ms']:.4f}, IQR {result['iqr_ms']:.4f})")
+        else:
+            print(f"Tiempo de {label} para {result['variable']}: {result['status']} ({result['error']})")
+
+    for variable, (_, type_label) in processed.items():
+        times_by_backend = {
+            backend: [r["median_ms"] for r in all_results if r["variable"] == variable and r["backend"] == backend]
+            for backend in variable_backends[variable]
+        }
+        plot_times(algorithms_list, times_by_backend["python"], variable, type_label, times_by_backend.get("numpy"))
+
+    if scaling:
+        from escalamiento import scaling_sweep, plot_scaling
+        for variable, (processed_data, type_label) in processed.items():
+            summary = scaling_sweep({name: algorithms_funcs[name] for name in algorithms_list}, processed_data,
+                                    sizes=scaling_sizes, timeout_s=timeout_s, variable=variable)
+            plot_scaling(summary, variable, type_label, os.path.join(script_dir, "resultados"))
+            for name, info in summary.items():
+                all_results.append({"variable": variable, "algorithm": name, "backend": "scaling",
+                                    "n": info["points"][-1][0] if info["points"] else 0, "status": info["status"],
+                                    "measured_exponent": info["measured"], "expected_exponent": info["expected"],
+                                    "expected_complexity": info["complexity"], "flagged": info["flagged"],
+                                    "points": info["points"]})
+
+    json_path, csv_path = save_results(all_results, os.path.join(script_dir, "resultados", "benchmarks"), prefix="ordenamiento")
+    print(f"Resultados guardados en: {json_path} y {csv_path}")
     print("Proceso completado.")
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    parser = argparse.ArgumentParser(description="Benchmark de algoritmos de ordenamiento sobre processed_articles.json")
+    parser.add_argument("--parallel", action="store_true", help="Ejecuta cada celda en un pool de procesos")
+    parser.add_argument("--workers", type=int, default=None, help="Número de procesos del pool")
+    parser.add_argument("--one-per-core", action="store_true", help="A lo sumo un worker por núcleo físico")
+    parser.add_argument("--scaling", action="store_true", help="Barre tamaños 1e2..1e6 y ajusta la complejidad empírica")
+    parser.add_argument("--sort-workers", type=int, default=None, help="Procesos que usa 'Parallel Merge Sort'")
+    parser.add_argument("--string-keys", action="store_true", help="Ordena los atributos de texto como cadenas, no como sumas ASCII")
+    args = parser.parse_args()
+    main(parallel=args.parallel, workers=args.workers, one_per_core=args.one_per_core, scaling=args.scaling,
+         string_keys=args.string_keys, sort_workers=args.sort_workers)
 
@@ -0,0 +1,270 @@
+import io
+import os
+import re
+import csv
+import sys
+import gzip
+import json
+import heapq
+import argparse
+import tempfile
+
+from lector_articulos import iter_articles
+
+#############################################
+# ORDENAMIENTO EXTERNO (OUT-OF-CORE) DE EXPORTACIONES DE ARTÍCULOS
+#############################################
+#
+# Para archivos que no caben en memoria:
+#   1. Se leen los registros en streaming (JSON Lines, arreglo JSON o CSV).
+#   2. Se acumulan hasta `max_run_mb`, se ordenan en memoria y se escriben a
+#      disco como una "corrida" (opcionalmente comprimida con gzip).
+#   3. Las corridas se mezclan con heapq.merge leyendo cada una con un buffer
+#      de `buffer_kb`; si hay más de `fan_in` corridas se mezclan por pasadas.
+# Cada línea de una corrida es "<clave JSON>\t<registro JSON>": en la mezcla
+# solo se decodifica la clave, y el registro se copia tal cual a la salida
+# cuando esta es JSON Lines. El orden es estable (los empates conservan el
+# orden de entrada).
+
+# Nombres de cada campo en processed_articles.json y en el CSV de integrate.save_csv
+FIELD_ALIASES = {
+    "year": ("year", "Volume year"),
+    "author": ("author", "Authors"),
+    "title": ("title", "Article title"),
+    "doi": ("doi", "DOI"),
+    "journal": ("journal", "Journal title"),
+    "url": ("url", "URL"),
+    "abstract": ("abstract", "Abstract"),
+}
+
+DEFAULT_MAX_RUN_MB = 64
+DEFAULT_BUFFER_KB = 256
+DEFAULT_FAN_IN = 64
+
+_YEAR_PATTERN = re.compile(r"\b(\d{4})\b")
+
+def _field_value(record, field):
+    for name in FIELD_ALIASES.get(field, (field,)):
+        value = record.get(name)
+        if value is not None:
+            return value
+    return None
+
+def article_key(field):
+    """
+    Función clave para ordenar por un campo del esquema de artículos.
+    "year" se compara como entero (primer año de 4 dígitos del texto, 0 si no
+    hay, como en ordenamientoDos); el resto de campos como cadenas ("" si falta).
+    """
+    if field == "year":
+        def key(record):
+            match = _YEAR_PATTERN.search(str(_field_value(record, field) or ""))
+            return int(match.group(1)) if match else 0
+    else:
+        def key(record):
+            value = _field_value(record, field)
+            return "" if value is None else str(value)
+    return key
+
+#############################################
+# LECTURA Y ESCRITURA DE REGISTROS
+#############################################
+
+def _is_csv(path):
+    return str(path).lower().endswith(".csv")
+
+def _iter_csv(path):
+    csv.field_size_limit(sys.maxsize)
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        yield from csv.DictReader(f)
+
+def iter_records(path):
+    """Registros (dict) de un archivo CSV, JSON Lines o arreglo JSON, en streaming."""
+    if _is_csv(path):
+        return _iter_csv(path)
+    return iter_articles(path)
+
+def _open_run(path, mode, compress, buffer_bytes):
+    """Abre una corrida en modo texto con un buffer de `buffer_bytes`."""
+    if compress:
+        # compresslevel=1: las corridas son temporales, prima la velocidad
+        raw = gzip.GzipFile(path, mode + "b", compresslevel=1)
+    else:
+        raw = open(path, mode + "b", buffering=0)
+    buffered = io.BufferedReader(raw, buffer_bytes) if mode == "r" else io.BufferedWriter(raw, buffer_bytes)
+    return io.TextIOWrapper(buffered, encoding="utf-8", newline="\n")
+
+def _write_entries(f, entries):
+    for key, serialized in entries:
+        f.write(json.dumps(key, ensure_ascii=False))
+        f.write("\t")
+        f.write(serialized)
+        f.write("\n")
+
+def _read_run(path, compress, buffer_bytes):
+    with _open_run(path, "r", compress, buffer_bytes) as f:
+        for line in f:
+            key, record = line.rstrip("\n").split("\t", 1)
+            yield json.loads(key), record
+
+class _RecordWriter:
+    """Escribe registros serializados (JSON) como JSON Lines o como CSV."""
+
+    def __init__(self, path, columns, buffer_bytes):
+        self.file = open(path, "w", encoding="utf-8", newline="", buffering=buffer_bytes)
+        self.writer = None
+        if _is_csv(path):
+            self.writer = csv.DictWriter(self.file, columns, extrasaction="ignore", restval="")
+            self.writer.writeheader()
+
+    def write(self, serialized):
+        if self.writer is None:
+            self.file.write(serialized)
+            self.file.write("\n")
+        else:
+            self.writer.writerow(json.loads(serialized))
+
+    def close(self):
+        self.file.close()
+
+#############################################
+# FASES: CORRIDAS ORDENADAS Y MEZCLA K-VÍAS
+#############################################
+
+def _write_run(entries, run_dir, index, compress, buffer_bytes, reverse):
+    entries.sort(key=lambda entry: entry[0], reverse=reverse)
+    path = os.path.join(run_dir, f"run-{index:05d}.jsonl" + (".gz" if compress else ""))
+    with _open_run(path, "w", compress, buffer_bytes) as f:
+        _write_entries(f, entries)
+    return path
+
+def create_runs(records, key, run_dir, max_run_mb=DEFAULT_MAX_RUN_MB, compress=False,
+                buffer_kb=DEFAULT_BUFFER_KB, reverse=False, columns=None):
+    """
+    Divide `records` en corridas ordenadas de a lo sumo `max_run_mb` (medido
+    sobre el JSON de cada registro) y retorna (rutas, número_de_registros).
+    Si se pasa `columns` (lista), se le agregan las claves nuevas en orden de aparición.
+    """
+    budget = max_run_mb * 1024 * 1024
+    buffer_bytes = buffer_kb * 1024
+    seen = set(columns or [])
+    runs = []
+    entries = []
+    size = 0
+    count = 0
+    for record in records:
+        if columns is not None:
+            for name in record:
+                if name not in seen and name is not None:
+                    seen.add(name)
+                    columns.append(name)
+        serialized = json.dumps(record, ensure_ascii=False)
+        entries.append((key(record), serialized))
+        size += len(serialized)
+        count += 1
+        if size >= budget:
+            runs.append(_write_run(entries, run_dir, len(runs), compress, buffer_bytes, reverse))
+            entries = []
+            size = 0
+    if entries or not runs:
+        runs.append(_write_run(entries, run_dir, len(runs), compress, buffer_bytes, reverse))
+    return runs, count
+
+def _merge_runs(paths, compress, buffer_bytes, reverse):
+    streams = [_read_run(path, compress, buffer_bytes) for path in paths]
+    return heapq.merge(*streams, key=lambda entry: entry[0], reverse=reverse)
+
+def merge_runs(runs, run_dir, fan_in=DEFAULT_FAN_IN, compress=False, buffer_kb=DEFAULT_BUFFER_KB, reverse=False):
+    """
+    Reduce las corridas por pasadas de a lo sumo `fan_in` archivos abiertos
+    (grupos consecutivos, para conservar la estabilidad) y retorna
+    (iterador de (clave, registro_json) de la pasada final, número_de_pasadas).
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in debe ser al menos 2.")
+    buffer_bytes = buffer_kb * 1024
+    passes = 1
+    generation = 0
+    while len(runs) > fan_in:
+        merged = []
+        for start in range(0, len(runs), fan_in):
+            group = runs[start:start + fan_in]
+            path = os.path.join(run_dir, f"merge-{generation}-{len(merged):05d}.jsonl" + (".gz" if compress else ""))
+            with _open_run(path, "w", compress, buffer_bytes) as f:
+                _write_entries(f, _merge_runs(group, compress, buffer_bytes, reverse))
+            for old in group:
+                os.remove(old)
+            merged.append(path)
+        runs = merged
+        generation += 1
+        passes += 1
+    return _merge_runs(runs, compress, buffer_bytes, reverse), passes
+
+def external_sort(input_path, output_path, key="year", reverse=False, max_run_mb=DEFAULT_MAX_RUN_MB,
+                  buffer_kb=DEFAULT_BUFFER_KB, fan_in=DEFAULT_FAN_IN, compress=False, tmp_dir=None):
+    """
+    Ordena un archivo de artículos (CSV, JSON Lines o arreglo JSON) sin cargarlo
+    completo en memoria y escribe el resultado en `output_path` (CSV si termina
+    en .csv; si no, JSON Lines). `output_path` puede ser el mismo archivo de entrada.
+
+    key: nombre de campo ("year", "author", "title", "doi", ...) o función clave.
+    max_run_mb: memoria aproximada de cada corrida ordenada en RAM.
+    buffer_kb / fan_in: la mezcla usa a lo sumo fan_in buffers de buffer_kb.
+    compress: comprime las corridas temporales con gzip.
+    Retorna {"records", "runs", "merge_passes"}.
+    """
+    key_function = article_key(key) if isinstance(key, str) else key
+    output_dir = os.path.dirname(os.path.abspath(output_path))
+    columns = []
+    with tempfile.TemporaryDirectory(prefix="ordenamiento-externo-", dir=tmp_dir) as run_dir:
+        records = iter_records(input_path)
+        runs, count = create_runs(records, key_function, run_dir, max_run_mb, compress, buffer_kb, reverse, columns)
+        run_count = len(runs)
+        merged, passes = merge_runs(runs, run_dir, fan_in, compress, buffer_kb, reverse)
+
+        # Se escribe en un temporal junto al destino y se publica con os.replace
+        fd, partial_path = tempfile.mkstemp(suffix=os.path.splitext(output_path)[1], dir=output_dir)
+        os.close(fd)
+        try:
+            writer = _RecordWriter(partial_path, columns, buffer_kb * 1024)
+            try:
+                for _, serialized in merged:
+                    writer.write(serialized)
+            finally:
+                writer.close()
+            os.replace(partial_path, output_path)
+        except BaseException:
+            os.remove(partial_path)
+            raise
+    return {"records": count, "runs": run_count, "merge_passes": passes}
+
+def sort_scraped_csv(csv_path=None, key="year", output_path=None, **kwargs):
+    """
+    Ordena el CSV generado por integrate.save_csv (por defecto
+    data/scraped_articles.csv) y retorna la ruta del archivo ordenado
+    (<nombre>_sorted_by_<key>.csv si no se indica output_path).
+    """
+    csv_path = csv_path or os.path.join(os.getcwd(), "data", "scraped_articles.csv")
+    if output_path is None:
+        base, extension = os.path.splitext(csv_path)
+        output_path = f"{base}_sorted_by_{key}{extension}"
+    stats = external_sort(csv_path, output_path, key=key, **kwargs)
+    print(f"[Ordenamiento externo] {stats['records']} registros, {stats['runs']} corridas, "
+          f"{stats['merge_passes']} pasada(s) de mezcla -> {output_path}")
+    return output_path
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ordenamiento externo de exportaciones de artículos (CSV/JSONL/JSON).")
+    parser.add_argument("input", help="Archivo de entrada (.csv, .jsonl o arreglo .json)")
+    parser.add_argument("output", help="Archivo de salida (.csv o .jsonl)")
+    parser.add_argument("--key", default="year", help="Campo por el que se ordena (year, author, title, doi, ...)")
+    parser.add_argument("--reverse", action="store_true", help="Orden descendente")
+    parser.add_argument("--max-run-mb", type=float, default=DEFAULT_MAX_RUN_MB, help="Memoria de cada corrida en RAM")
+    parser.add_argument("--buffer-kb", type=int, default=DEFAULT_BUFFER_KB, help="Buffer de lectura/escritura por corrida")
+    parser.add_argument("--fan-in", type=int, default=DEFAULT_FAN_IN, help="Corridas abiertas a la vez durante la mezcla")
+    parser.add_argument("--compress", action="store_true", help="Comprime las corridas temporales con gzip")
+    args = parser.parse_args()
+    stats = external_sort(args.input, args.output, key=args.key, reverse=args.reverse, max_run_mb=args.max_run_mb,
+                          buffer_kb=args.buffer_kb, fan_in=args.fan_in, compress=args.compress)
+    print(f"[Ordenamiento externo] {stats['records']} registros, {stats['runs']} corridas, "
+          f"{stats['merge_passes']} pasada(s) de mezcla -> {args.output}")
@@ -0,0 +1,129 @@
+import os
+import heapq
+import atexit
+from multiprocessing import shared_memory, resource_tracker
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+#############################################
+# MERGE SORT PARALELO POR FRAGMENTOS (SHARDED)
+#############################################
+#
+# La columna se divide en fragmentos, cada fragmento se ordena en un proceso
+# del pool con un algoritmo "interno" de ordenamientoDos (elegido por nombre)
+# y los fragmentos ordenados se combinan con una mezcla k-vías:
+#   - listas de Python: heapq.merge (admite key=);
+#   - np.ndarray numéricos: los fragmentos se ordenan en memoria compartida,
+#     sin copiarlos por pickle, y se mezclan por pares con np.searchsorted.
+
+PARALLEL_MERGE_SORT_NAME = 'Parallel Merge Sort'
+
+# Por debajo de este tamaño el costo de repartir el trabajo supera la ganancia
+MIN_PARALLEL_SIZE = 50000
+CHUNKS_PER_WORKER = 2
+
+_pools = {}
+
+def _get_pool(workers):
+    """Pool reutilizable por número de workers (crear procesos en cada llamada domina en entradas medianas)."""
+    if workers not in _pools:
+        # Los workers deben heredar el resource_tracker del padre; si no, cada uno
+        # lanza el suyo y reporta como "fugados" los bloques que solo abrió.
+        resource_tracker.ensure_running()
+        _pools[workers] = ProcessPoolExecutor(max_workers=workers)
+    return _pools[workers]
+
+@atexit.register
+def shutdown_pools():
+    for pool in _pools.values():
+        pool.shutdown(wait=False, cancel_futures=True)
+    _pools.clear()
+
+def _inner_function(inner):
+    from ordenamientoDos import algorithms_funcs
+    if inner not in algorithms_funcs or inner == PARALLEL_MERGE_SORT_NAME:
+        raise ValueError(f"Algoritmo interno no válido: {inner}")
+    return algorithms_funcs[inner]
+
+def _sort_chunk(chunk, inner, key):
+    """Ordena un fragmento (lista) con el algoritmo interno en el proceso worker."""
+    function = _inner_function(inner)
+    return function(chunk, key=key) if key is not None else function(chunk)
+
+def _sort_shared_slice(descriptor, start, stop, inner):
+    """Ordena in-place arr[start:stop] de un arreglo en memoria compartida."""
+    name, shape, dtype = descriptor
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        view = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+        view[start:stop] = _inner_function(inner)(view[start:stop].tolist())
+        del view
+    finally:
+        block.close()
+
+def merge_sorted_arrays(a, b):
+    """Mezcla estable de dos arreglos ordenados con np.searchsorted (los iguales de `a` van primero)."""
+    merged = np.empty(a.size + b.size, dtype=np.result_type(a, b))
+    positions = np.searchsorted(a, b, side="right") + np.arange(b.size)
+    mask = np.ones(merged.size, dtype=bool)
+    mask[positions] = False
+    merged[positions] = b
+    merged[mask] = a
+    return merged
+
+def _merge_arrays(runs):
+    """Mezcla k-vías por pares (árbol de log2(k) niveles) de arreglos ordenados."""
+    while len(runs) > 1:
+        runs = [merge_sorted_arrays(runs[i], runs[i + 1]) if i + 1 < len(runs) else runs[i]
+                for i in range(0, len(runs), 2)]
+    return runs[0]
+
+def _chunk_bounds(n, chunks):
+    size = -(-n // chunks)
+    return [(start, min(start + size, n)) for start in range(0, n, size)]
+
+def parallel_merge_sort(arr, workers=None, inner="TimSort", key=None, chunks=None, min_parallel_size=MIN_PARALLEL_SIZE):
+    """
+    Ordena `arr` dividiéndolo en fragmentos que se ordenan en paralelo con el
+    algoritmo `inner` de ordenamientoDos.algorithms_funcs y se combinan con una
+    mezcla k-vías.
+
+    workers: procesos del pool (por defecto, os.cpu_count()).
+    chunks: número de fragmentos (por defecto, CHUNKS_PER_WORKER por worker).
+    key: como en los demás algoritmos; debe poder enviarse a otro proceso
+        (una función de nivel de módulo, no una lambda).
+    Entradas menores que min_parallel_size se ordenan directamente con `inner`.
+    Retorna una lista nueva, o un np.ndarray si la entrada es un arreglo numérico.
+    """
+    workers = workers or os.cpu_count() or 1
+    n = len(arr)
+    is_array = isinstance(arr, np.ndarray) and key is None and arr.dtype.kind in "iuf"
+
+    if n < min_parallel_size or workers == 1:
+        if is_array:
+            return np.asarray(_sort_chunk(arr.tolist(), inner, None), dtype=arr.dtype)
+        return _sort_chunk(list(arr), inner, key)
+
+    bounds = _chunk_bounds(n, chunks or workers * CHUNKS_PER_WORKER)
+    pool = _get_pool(workers)
+
+    if is_array:
+        data = np.ascontiguousarray(arr)
+        block = shared_memory.SharedMemory(create=True, size=data.nbytes)
+        try:
+            view = np.ndarray(data.shape, dtype=data.dtype, buffer=block.buf)
+            view[:] = data
+            descriptor = (block.name, data.shape, data.dtype.str)
+            futures = [pool.submit(_sort_shared_slice, descriptor, start, stop, inner) for start, stop in bounds]
+            for future in futures:
+                future.result()
+            result = _merge_arrays([view[start:stop].copy() for start, stop in bounds])
+            del view
+        finally:
+            block.close()
+            block.unlink()
+        return result
+
+    futures = [pool.submit(_sort_chunk, list(arr[start:stop]), inner, key) for start, stop in bounds]
+    runs = [future.result() for future in futures]
+    return list(heapq.merge(*runs, key=key))
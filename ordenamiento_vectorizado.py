@@ -0,0 +1,201 @@
+import numpy as np
+
+from ordenamiento_paralelo import parallel_merge_sort, PARALLEL_MERGE_SORT_NAME
+
+#############################################
+# BACKEND VECTORIZADO (NUMPY) DE LOS ALGORITMOS DE ORDENAMIENTO
+#############################################
+#
+# Cada función recibe un np.ndarray 1-D y retorna un np.ndarray ordenado,
+# conservando la semántica de su contraparte en ordenamientoDos. Los bucles
+# internos se expresan como operaciones sobre arreglos; solo quedan en Python
+# los bucles externos propios de cada algoritmo (pasadas, dígitos, gaps).
+
+def _compare_exchange(arr, i, j):
+    """Intercambio simultáneo de los pares (i[k], j[k]) desordenados. Los pares deben ser disjuntos."""
+    a = arr[i]
+    b = arr[j]
+    swap = a > b
+    if swap.any():
+        arr[i[swap]] = b[swap]
+        arr[j[swap]] = a[swap]
+    return bool(swap.any())
+
+def tim_sort_np(arr):
+    return np.sort(arr, kind="stable")
+
+def quicksort_np(arr):
+    return np.sort(arr, kind="quicksort")
+
+def heapsort_np(arr):
+    return np.sort(arr, kind="heapsort")
+
+def comb_sort_np(arr):
+    """
+    Comb sort por gaps decrecientes (factor 1.3). Para cada gap, los pares
+    (i, i+gap) se agrupan en bloques disjuntos de 2·gap posiciones y cada grupo
+    se compara e intercambia de una sola vez. Con gap 1 se repite hasta que no
+    hay intercambios, igual que el algoritmo original.
+    """
+    arr = np.array(arr)
+    n = len(arr)
+    gap = n
+    sorted_flag = False
+    while not sorted_flag:
+        gap = int(gap / 1.3)
+        if gap <= 1:
+            gap = 1
+            sorted_flag = True
+        i = np.arange(n - gap)
+        phase = (i // gap) % 2
+        for p in (0, 1):
+            left = i[phase == p]
+            if _compare_exchange(arr, left, left + gap):
+                sorted_flag = False
+    return arr
+
+def selection_sort_np(arr):
+    """Selección: en cada posición se busca el mínimo del resto con argmin."""
+    arr = np.array(arr)
+    for i in range(len(arr) - 1):
+        min_idx = i + int(np.argmin(arr[i:]))
+        arr[i], arr[min_idx] = arr[min_idx], arr[i]
+    return arr
+
+def tree_sort_np(arr):
+    """
+    Equivalente del recorrido inorden de un BST con duplicados: valores
+    distintos ordenados, repetidos según su multiplicidad.
+    """
+    values, counts = np.unique(arr, return_counts=True)
+    return np.repeat(values, counts)
+
+def pigeonhole_sort_np(arr):
+    """Casilleros con np.bincount y reconstrucción con np.repeat."""
+    arr = np.asarray(arr)
+    if arr.size == 0:
+        return arr.copy()
+    min_val = arr.min()
+    holes = np.bincount((arr - min_val).astype(np.int64))
+    return np.repeat(np.arange(holes.size) + min_val, holes)
+
+def bucket_sort_np(arr):
+    """Índice de cubeta vectorizado; luego orden por (cubeta, valor) con lexsort."""
+    arr = np.asarray(arr)
+    if arr.size == 0:
+        return arr.copy()
+    min_val = arr.min()
+    max_val = arr.max()
+    bucket_count = arr.size
+    buckets = (bucket_count * (arr - min_val) / (max_val - min_val + 1)).astype(np.int64)
+    return arr[np.lexsort((arr, buckets))]
+
+def bitonic_sort_np(arr, up=True):
+    """
+    Red bitónica iterativa: se rellena con el valor máximo del tipo hasta la
+    siguiente potencia de dos y cada etapa (k, j) es una sola comparación-intercambio vectorizada.
+    """
+    arr = np.asarray(arr)
+    n = arr.size
+    if n <= 1:
+        return arr.copy()
+    size = 1 << (n - 1).bit_length()
+    # Relleno con el máximo representable: queda al final y se descarta
+    if np.issubdtype(arr.dtype, np.integer):
+        work = np.full(size, np.iinfo(arr.dtype).max, dtype=arr.dtype)
+    else:
+        work = np.full(size, np.inf, dtype=np.float64)
+    work[:n] = arr
+    idx = np.arange(size)
+    k = 2
+    while k <= size:
+        j = k // 2
+        while j > 0:
+            partner = idx ^ j
+            lower = idx[partner > idx]
+            upper = lower ^ j
+            ascending = (lower & k) == 0
+            a = work[lower]
+            b = work[upper]
+            swap = np.where(ascending, a > b, a < b)
+            work[lower[swap]] = b[swap]
+            work[upper[swap]] = a[swap]
+            j //= 2
+        k *= 2
+    result = work[:n].astype(arr.dtype, copy=False)
+    return result if up else result[::-1].copy()
+
+def odd_even_transposition_sort_np(arr):
+    """
+    Versión vectorizada de la familia de intercambios adyacentes (burbuja,
+    burbuja bidireccional, gnome): en cada fase se comparan a la vez todos los
+    pares adyacentes pares o impares, hasta que una ronda completa no intercambia.
+    """
+    arr = np.array(arr)
+    n = len(arr)
+    even = np.arange(0, n - 1, 2)
+    odd = np.arange(1, n - 1, 2)
+    swapped = True
+    while swapped:
+        swapped = _compare_exchange(arr, even, even + 1)
+        swapped = _compare_exchange(arr, odd, odd + 1) or swapped
+    return arr
+
+def busrbu_sort_np(arr):
+    """
+    Misma semántica que busrbu_sort: solo se comparan los pares (j, j+1) con j
+    par. Como esos pares son disjuntos, las pasadas posteriores a la primera no
+    cambian nada y basta una comparación-intercambio vectorizada.
+    """
+    arr = np.array(arr)
+    left = np.arange(0, len(arr) - 1, 2)
+    _compare_exchange(arr, left, left + 1)
+    return arr
+
+def binary_insertion_sort_np(arr):
+    """Inserción binaria: posición con searchsorted y desplazamiento del bloque con una copia de arreglo."""
+    arr = np.array(arr)
+    for i in range(1, len(arr)):
+        key = arr[i]
+        left = int(np.searchsorted(arr[:i], key, side="left"))
+        if left < i:
+            arr[left + 1:i + 1] = arr[left:i].copy()
+            arr[left] = key
+    return arr
+
+def count_sort_np(arr, exp):
+    """Pasada estable por el dígito (arr // exp) % 10 (argsort estable sobre 10 claves)."""
+    digits = ((arr // exp) % 10).astype(np.int64)
+    arr[:] = arr[np.argsort(digits, kind="stable")]
+
+def radix_sort_np(arr):
+    """Radix LSD en base 10: una pasada estable de count_sort_np por dígito."""
+    arr = np.array(arr)
+    if arr.size == 0:
+        return arr
+    max_val = arr.max()
+    exp = 1
+    while max_val // exp > 0:
+        count_sort_np(arr, exp)
+        exp *= 10
+    return arr
+
+# Contraparte vectorizada de cada algoritmo de ordenamientoDos.main
+NUMPY_ALGORITHMS = {
+    'TimSort': tim_sort_np,
+    'Comb Sort': comb_sort_np,
+    'Selection Sort': selection_sort_np,
+    'Tree Sort': tree_sort_np,
+    'Pigeonhole Sort': pigeonhole_sort_np,
+    'Bucket Sort': bucket_sort_np,
+    'Quick Sort': quicksort_np,
+    'Heap Sort': heapsort_np,
+    'Bitonic Sort': bitonic_sort_np,
+    'Gnome Sort': odd_even_transposition_sort_np,
+    'Binary Insertion Sort': binary_insertion_sort_np,
+    'Radix Sort': radix_sort_np,
+    'Bubble Sort': odd_even_transposition_sort_np,
+    'Bidirectional Bubble Sort': odd_even_transposition_sort_np,
+    'Busrbu Sort': busrbu_sort_np,
+    PARALLEL_MERGE_SORT_NAME: parallel_merge_sort
+}
@@ -0,0 +1,101 @@
+import os
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from renderizado import persist, to_png
+
+#############################################
+# RENDERIZADO PARALELO DE GRÁFICOS
+#############################################
+#
+# Un trabajo es (nombre de archivo, función, argumentos): la función construye
+# una matplotlib.figure.Figure (p. ej. requerimiento3.word_cloud_figure) y el
+# worker la convierte a PNG. Construir la figura (WordCloud.generate, el
+# layout del grafo) y rasterizarla son pasos de CPU, así que los trabajos se
+# reparten en un ProcessPoolExecutor cuyos workers usan el backend Agg (sin
+# pantalla). Las funciones deben ser de nivel de módulo: se envían por
+# referencia, como en ejecucion_paralela.run_matrix.
+#   - Rutas deterministas: cada trabajo se guarda en output_dir/<nombre>,
+#     independiente de qué worker lo renderice o en qué orden termine.
+#   - Concurrencia acotada: a lo sumo `workers` procesos y `max_pending`
+#     trabajos enviados a la vez (los argumentos no se serializan todos de golpe).
+#   - Tiempos por figura: construcción y PNG por separado (print_render_timings).
+
+def _init_worker():
+    """Inicializador de cada worker: backend Agg antes de que se importe pyplot."""
+    os.environ["MPLBACKEND"] = "Agg"
+    import matplotlib
+    matplotlib.use("Agg")
+
+def render_job(name, function, args, output_dir=None):
+    """
+    Ejecuta un trabajo y retorna un dict con name, build_s (construcción de la
+    figura), png_s (rasterizado), seconds (total), pid, y "path" (si se dio
+    output_dir) o "png" (los bytes).
+    """
+    start = time.perf_counter()
+    figure = function(*args)
+    built = time.perf_counter()
+    png = to_png(figure)
+    rendered = time.perf_counter()
+    result = {"name": name, "build_s": built - start, "png_s": rendered - built, "pid": os.getpid()}
+    if output_dir is None:
+        result["png"] = png
+    else:
+        result["path"] = persist(png, output_dir, name)
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+def available_cpus():
+    return len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+
+def render_jobs(jobs, output_dir=None, workers=None, max_pending=None):
+    """
+    Renderiza los trabajos (nombre, función, argumentos) y retorna sus
+    resultados (ver render_job) en el mismo orden de `jobs`.
+
+    output_dir: carpeta donde se guarda cada PNG como output_dir/<nombre>;
+        sin ella los PNG se retornan en memoria.
+    workers: número de procesos (por defecto, uno por CPU disponible, sin
+        superar la cantidad de trabajos). Con workers=1 todo se renderiza en
+        este proceso, sin pool.
+    max_pending: trabajos enviados al pool a la vez (por defecto 2 × workers).
+    """
+    jobs = list(jobs)
+    names = [name for name, _, _ in jobs]
+    if len(set(names)) != len(names):
+        raise ValueError("Los nombres de los trabajos deben ser únicos (cada uno es la ruta de su archivo).")
+    if not jobs:
+        return []
+
+    workers = max(1, min(workers or available_cpus(), len(jobs)))
+    if workers == 1:
+        return [render_job(name, function, args, output_dir) for name, function, args in jobs]
+
+    max_pending = max(workers, max_pending or 2 * workers)
+    results = [None] * len(jobs)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(),
+                             initializer=_init_worker) as executor:
+        pending = {}
+        next_job = 0
+        while next_job < len(jobs) or pending:
+            while next_job < len(jobs) and len(pending) < max_pending:
+                name, function, args = jobs[next_job]
+                pending[executor.submit(render_job, name, function, args, output_dir)] = next_job
+                next_job += 1
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[pending.pop(future)] = future.result()
+    return results
+
+def print_render_timings(results, limit=None):
+    """Imprime los tiempos por figura, de la más lenta a la más rápida."""
+    ordered = sorted(results, key=lambda result: result["seconds"], reverse=True)[:limit]
+    width = max([len("gráfico")] + [len(result["name"]) for result in ordered])
+    print(f"{'gráfico':<{width}} | {'figura':>9} | {'PNG':>9} | {'total':>9}")
+    for result in ordered:
+        print(f"{result['name']:<{width}} | {result['build_s'] * 1000:>6.0f} ms | "
+              f"{result['png_s'] * 1000:>6.0f} ms | {result['seconds'] * 1000:>6.0f} ms")
+    print(f"Suma de tiempos por figura: {sum(result['seconds'] for result in results):.2f} s "
+          f"en {len({result['pid'] for result in results})} proceso(s)")
@@ -0,0 +1,61 @@
+import io
+import os
+import hashlib
+import tempfile
+from matplotlib.figure import Figure
+
+#############################################
+# RENDERIZADO DE GRÁFICOS EN MEMORIA
+#############################################
+#
+# Los gráficos se construyen con la API orientada a objetos de matplotlib
+# (matplotlib.figure.Figure, sin pyplot): cada figura es independiente y no
+# usa el estado global de pyplot (figura "actual"), de modo que varias
+# sesiones de Streamlit (hilos) pueden dibujar al mismo tiempo sin pisarse.
+# Las figuras se convierten a PNG en memoria (to_png) y la app los muestra
+# directamente; guardarlos en disco es opcional:
+#   - persist(png, carpeta): nombre por contenido (sha256), así dos resultados
+#     distintos nunca comparten archivo y uno repetido no se reescribe;
+#   - persist(png, carpeta, nombre): nombre fijo (los scripts de línea de
+#     comandos que escriben en resultados/), con escritura atómica.
+
+DEFAULT_FIGSIZE = (12, 6)
+
+def new_figure(figsize=DEFAULT_FIGSIZE):
+    """Figura independiente de pyplot."""
+    return Figure(figsize=figsize)
+
+def to_png(figure, dpi=None):
+    """PNG de la figura en bytes (backend Agg)."""
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format="png", dpi=dpi)
+    return buffer.getvalue()
+
+def content_name(png, prefix=""):
+    """Nombre de archivo derivado del contenido: <prefijo><sha256[:16]>.png."""
+    return f"{prefix}{hashlib.sha256(png).hexdigest()[:16]}.png"
+
+def persist(png, directory, filename=None):
+    """
+    Guarda el PNG en directory (con filename, o con content_name si no se da)
+    y retorna la ruta. La escritura es atómica (archivo temporal + os.replace):
+    un lector nunca ve una imagen a medio escribir.
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, filename or content_name(png))
+    if filename is None and os.path.exists(path):
+        return path
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", suffix=".png", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(png)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return path
+
+def save_figure(figure, filename):
+    """Renderiza la figura y la guarda en filename (reemplazo de plt.savefig + plt.close)."""
+    return persist(to_png(figure), os.path.dirname(os.path.abspath(filename)), os.path.basename(filename))
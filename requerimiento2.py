@@ -1,7 +1,7 @@
-import os
-import matplotlib.pyplot as plt
 import collections
 
+from renderizado import new_figure, persist, save_figure, to_png
+
 def count_frequencies(data, key, top_n=15):
     counter = collections.Counter([item.get(key, "Unknown").split(",")[0] for item in data])
     return counter.most_common(top_n)
@@ -14,48 +14,75 @@ def group_by_year_and_type(data):
         grouped_data[year][product_type] += 1
     return grouped_data
 
-def plot_bar_chart(data, title, xlabel, ylabel, filename):
+def bar_chart_figure(data, title, xlabel, ylabel):
     labels, values = zip(*data)
-    plt.figure(figsize=(12, 6))
-    plt.barh(labels, values, color="skyblue")
-    plt.xlabel(xlabel)
-    plt.ylabel(ylabel)
-    plt.title(title, fontsize=14)
-    plt.grid(axis="x", linestyle="--", alpha=0.6)
-    plt.tight_layout()
-    plt.savefig(filename)
-    plt.close()
+    figure = new_figure((12, 6))
+    ax = figure.add_subplot()
+    ax.barh(labels, values, color="skyblue")
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.set_title(title, fontsize=14)
+    ax.grid(axis="x", linestyle="--", alpha=0.6)
+    figure.tight_layout()
+    return figure
 
-def plot_yearly_trends(grouped_data, filename):
-    plt.figure(figsize=(12, 6))
+def plot_bar_chart(data, title, xlabel, ylabel, filename):
+    save_figure(bar_chart_figure(data, title, xlabel, ylabel), filename)
+
+# Orden fijo de las series (con un set el orden, y por lo tanto los colores, cambiaba entre ejecuciones)
+PRODUCT_TYPES = ("article", "conference", "book", "chapter")
+
+def yearly_trends_figure(grouped_data):
+    figure = new_figure((12, 6))
+    ax = figure.add_subplot()
     years = [year for year in sorted(grouped_data.keys()) if year.isdigit() and 2010 <= int(year) <= 2025]
-    for product_type in {"article", "conference", "book", "chapter"}:
+    for product_type in PRODUCT_TYPES:
         counts = [grouped_data[year][product_type] for year in years]
-        plt.plot(years, counts, marker='o', label=product_type)
-    plt.xlabel("Año de publicación")
-    plt.ylabel("Cantidad de productos")
-    plt.title("Distribución de productos por año (2010-2025)")
-    plt.legend()
-    plt.grid(True, linestyle="--", alpha=0.6)
-    plt.tight_layout()
-    plt.savefig(filename)
-    plt.close()
+        ax.plot(years, counts, marker='o', label=product_type)
+    ax.set_xlabel("Año de publicación")
+    ax.set_ylabel("Cantidad de productos")
+    ax.set_title("Distribución de productos por año (2010-2025)")
+    ax.legend()
+    ax.grid(True, linestyle="--", alpha=0.6)
+    figure.tight_layout()
+    return figure
 
-def estadisticas_generales(data, output_dir="resultados"):
+def plot_yearly_trends(grouped_data, filename):
+    save_figure(yearly_trends_figure(grouped_data), filename)
+
+def accumulate_statistics(data, top_n=15):
     """
-    Recibe una lista de artículos JSON (data) y genera gráficos estadísticos.
+    Calcula en una sola pasada los conteos de autores, journals, publishers y
+    año/tipo, de modo que `data` puede ser un generador de artículos.
     """
-    if not isinstance(data, list):
-        raise TypeError("Se esperaba una lista de artículos JSON como entrada.")
+    counters = {key: collections.Counter() for key in ("author", "journal", "publisher")}
+    grouped_data = collections.defaultdict(lambda: collections.Counter())
+    for item in data:
+        for key, counter in counters.items():
+            counter[item.get(key, "Unknown").split(",")[0]] += 1
+        grouped_data[item.get("year", "Unknown")][item.get("type", "Unknown")] += 1
+    top = {key: counter.most_common(top_n) for key, counter in counters.items()}
+    return top["author"], top["journal"], top["publisher"], grouped_data
 
-    os.makedirs(output_dir, exist_ok=True)
+def render_statistics(data, top_n=15):
+    """
+    Genera los gráficos estadísticos en memoria: {nombre de archivo: PNG en bytes}.
+    `data` puede ser una lista o un generador de artículos.
+    """
+    top_authors, top_journals, top_publishers, yearly_product_data = accumulate_statistics(data, top_n)
+    return {
+        "2_yearly_trends.png": to_png(yearly_trends_figure(yearly_product_data)),
+        "2_top_authors.png": to_png(bar_chart_figure(top_authors, "Top 15 Autores con Más Publicaciones", "Cantidad de Publicaciones", "Autores")),
+        "2_top_journals.png": to_png(bar_chart_figure(top_journals, "Top 15 Journals con Más Publicaciones", "Cantidad de Publicaciones", "Journals")),
+        "2_top_publishers.png": to_png(bar_chart_figure(top_publishers, "Top 15 Publishers con Más Publicaciones", "Cantidad de Publicaciones", "Publishers")),
+    }
 
-    top_authors = count_frequencies(data, "author")
-    top_journals = count_frequencies(data, "journal")
-    top_publishers = count_frequencies(data, "publisher")
-    yearly_product_data = group_by_year_and_type(data)
+def estadisticas_generales(data, output_dir="resultados"):
+    """
+    Recibe los artículos JSON (data), como lista o como generador, y genera gráficos estadísticos
+    en output_dir. Retorna las rutas de los archivos generados.
+    """
+    if isinstance(data, (str, bytes, dict)) or not hasattr(data, "__iter__"):
+        raise TypeError("Se esperaba una lista o un generador de artículos JSON como entrada.")
 
-    plot_bar_chart(top_authors, "Top 15 Autores con Más Publicaciones", "Cantidad de Publicaciones", "Autores", os.path.join(output_dir, "2_top_authors.png"))
-    plot_bar_chart(top_journals, "Top 15 Journals con Más Publicaciones", "Cantidad de Publicaciones", "Journals", os.path.join(output_dir, "2_top_journals.png"))
-    plot_bar_chart(top_publishers, "Top 15 Publishers con Más Publicaciones", "Cantidad de Publicaciones", "Publishers", os.path.join(output_dir, "2_top_publishers.png"))
-    plot_yearly_trends(yearly_product_data, os.path.join(output_dir, "2_yearly_trends.png"))
+    return [persist(png, output_dir, name) for name, png in render_statistics(data).items()]
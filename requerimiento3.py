@@ -1,29 +1,71 @@
 import os
-import json
+import argparse
 import collections
-import matplotlib.pyplot as plt
 from wordcloud import WordCloud
 import networkx as nx
 
 # Cargar la definición de categorías y variables
 from categorias import CATEGORIAS
+from aho_corasick import AhoCorasick
+from almacen_articulos import load_store
+from renderizado import new_figure, save_figure, to_png
+from render_paralelo import render_jobs, print_render_timings
 
 #############################################
 # CARGAR ARCHIVO JSON
 #############################################
 
 def load_data(json_filepath):
-    """Carga los artículos desde el archivo JSON y limita a los primeros 1000."""
-    with open(json_filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    return data[:1000]  # Tomar solo los primeros 1000 artículos
+    """Carga los artículos desde el almacén columnar del JSON y limita a los primeros 1000."""
+    return load_store(json_filepath).records(limit=1000)  # Tomar solo los primeros 1000 artículos
 
 #############################################
 # FUNCIÓN PARA ANALIZAR FRECUENCIA DE VARIABLES
 #############################################
 
+def build_category_matcher(categorias=CATEGORIAS):
+    """
+    Compila un autómata Aho-Corasick con los sinónimos de todas las variables.
+
+    Cada variable se separa en sinónimos por "-" (igual que en el análisis
+    original) y todos sus sinónimos se etiquetan con el índice de la variable.
+    Retorna (matcher, targets), donde targets[i] es el par (categoría, variable)
+    de la etiqueta i, en el mismo orden en que se recorre CATEGORIAS.
+    """
+    targets = []
+    patterns = []
+    for category, variables in categorias.items():
+        for variable in variables:
+            label = len(targets)
+            targets.append((category, variable))
+            for syn in variable.split("-"):
+                patterns.append((syn.strip().lower(), label))
+    return AhoCorasick(patterns), targets
+
+# El autómata se construye una sola vez al importar el módulo
+CATEGORY_MATCHER, CATEGORY_TARGETS = build_category_matcher()
+
 def analyze_category_frequencies(data):
-    """Analiza la frecuencia de aparición de cada variable dentro de cada categoría en los abstracts."""
+    """
+    Analiza la frecuencia de aparición de cada variable dentro de cada categoría en los abstracts.
+    `data` se recorre una sola vez, por lo que puede ser un generador de artículos.
+    """
+    category_counts = {category: collections.Counter() for category in CATEGORIAS}
+
+    for item in data:
+        abstract = item.get("abstract", "").lower()
+        # Se recorren las etiquetas en orden para conservar el orden de inserción de los Counter
+        for label in sorted(CATEGORY_MATCHER.scan(abstract)):
+            category, variable = CATEGORY_TARGETS[label]
+            category_counts[category][variable] += 1
+
+    return category_counts
+
+def analyze_category_frequencies_naive(data):
+    """
+    Versión original del análisis (búsqueda de cada sinónimo por separado).
+    Se conserva como referencia para verificar resultados y para los benchmarks.
+    """
     category_counts = {category: collections.Counter() for category in CATEGORIAS}
 
     for item in data:
@@ -40,46 +82,59 @@ def analyze_category_frequencies(data):
 # FUNCIÓN PARA GENERAR GRÁFICO DE FRECUENCIA
 #############################################
 
-def plot_bar_chart(data, title, xlabel, ylabel, filename):
-    """Genera un gráfico de barras y lo guarda."""
+def bar_chart_figure(data, title, xlabel, ylabel):
+    """Gráfico de barras horizontales de un dict/Counter {variable: frecuencia}."""
     labels, values = zip(*data.items())
 
-    plt.figure(figsize=(12, 6))
-    plt.barh(labels, values, color="skyblue")
-    plt.xlabel(xlabel)
-    plt.ylabel(ylabel)
-    plt.title(title, fontsize=14)
-    plt.grid(axis="x", linestyle="--", alpha=0.6)
-    plt.tight_layout()
-    plt.savefig(filename)
+    figure = new_figure((12, 6))
+    ax = figure.add_subplot()
+    ax.barh(labels, values, color="skyblue")
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.set_title(title, fontsize=14)
+    ax.grid(axis="x", linestyle="--", alpha=0.6)
+    figure.tight_layout()
+    return figure
+
+def plot_bar_chart(data, title, xlabel, ylabel, filename):
+    """Genera un gráfico de barras y lo guarda."""
+    save_figure(bar_chart_figure(data, title, xlabel, ylabel), filename)
     print(f"Gráfico guardado: {filename}")
-    plt.close()
 
 #############################################
 # FUNCIÓN PARA GENERAR NUBE DE PALABRAS
 #############################################
 
-def generate_word_cloud(data, title, filename):
-    """Genera una nube de palabras y la guarda."""
+# Semillas fijas: la misma entrada produce la misma imagen (y el mismo nombre por contenido)
+WORDCLOUD_SEED = 42
+LAYOUT_SEED = 42
+
+def word_cloud_figure(data, title):
+    """Nube de palabras de un dict/Counter {palabra: frecuencia}."""
     word_freq = " ".join([word for word, count in data.items() for _ in range(count)])
 
-    wordcloud = WordCloud(width=800, height=400, background_color="white").generate(word_freq)
+    wordcloud = WordCloud(width=800, height=400, background_color="white",
+                          random_state=WORDCLOUD_SEED).generate(word_freq)
+
+    figure = new_figure((12, 6))
+    ax = figure.add_subplot()
+    ax.imshow(wordcloud, interpolation="bilinear")
+    ax.axis("off")
+    ax.set_title(title, fontsize=14)
+    figure.tight_layout()
+    return figure
 
-    plt.figure(figsize=(12, 6))
-    plt.imshow(wordcloud, interpolation="bilinear")
-    plt.axis("off")
-    plt.title(title, fontsize=14)
-    plt.tight_layout()
-    plt.savefig(filename)
+def generate_word_cloud(data, title, filename):
+    """Genera una nube de palabras y la guarda."""
+    save_figure(word_cloud_figure(data, title), filename)
     print(f"Nube de palabras guardada: {filename}")
-    plt.close()
 
 #############################################
 # FUNCIÓN PARA GENERAR CO-WORD NETWORK VISUALIZATION
 #############################################
 
-def generate_co_word_network(data, filename):
-    """Genera un gráfico de co-ocurrencia de palabras clave en los abstracts."""
+def co_word_network_figure(data):
+    """Gráfico de co-ocurrencia de palabras clave en los abstracts."""
     G = nx.Graph()
 
     # Agregar nodos y conexiones entre palabras que aparecen juntas
@@ -90,22 +145,62 @@ def generate_co_word_network(data, filename):
                 for j in range(i + 1, len(synonyms)):
                     G.add_edge(synonyms[i], synonyms[j], weight=1)
 
-    plt.figure(figsize=(12, 6))
-    pos = nx.spring_layout(G, k=0.5)
-    nx.draw(G, pos, with_labels=True, node_color="lightblue", edge_color="gray", font_size=10)
+    figure = new_figure((12, 6))
+    ax = figure.add_subplot()
+    pos = nx.spring_layout(G, k=0.5, seed=LAYOUT_SEED)
+    nx.draw(G, pos, ax=ax, with_labels=True, node_color="lightblue", edge_color="gray", font_size=10)
+
+    ax.set_title("Co-word Network Visualization", fontsize=14)
+    figure.tight_layout()
+    return figure
 
-    plt.title("Co-word Network Visualization", fontsize=14)
-    plt.tight_layout()
-    plt.savefig(filename)
+def generate_co_word_network(data, filename):
+    """Genera un gráfico de co-ocurrencia de palabras clave en los abstracts."""
+    save_figure(co_word_network_figure(data), filename)
     print(f"Gráfico de co-word network guardado: {filename}")
-    plt.close()
+
+#############################################
+# TODOS LOS GRÁFICOS EN MEMORIA
+#############################################
+
+def category_chart_jobs(category_counts):
+    """
+    Lista de trabajos (nombre de archivo, función, argumentos) con todos los
+    gráficos del análisis de categorías: barras y nube de palabras por
+    categoría (las que tienen apariciones), nube general y co-word network.
+    Cada trabajo es independiente y sus funciones son de nivel de módulo, así
+    render_paralelo puede enviarlos a procesos distintos.
+    """
+    jobs = []
+    for category, counts in category_counts.items():
+        if not counts:
+            continue
+        jobs.append((f"3_{category}_frecuencia.png", bar_chart_figure,
+                     (counts, f"Frecuencia de Variables en {category}", "Frecuencia", "Variables")))
+        jobs.append((f"3_{category}_wordcloud.png", word_cloud_figure, (counts, f"Nube de Palabras en {category}")))
+
+    all_words = collections.Counter()
+    for counts in category_counts.values():
+        all_words.update(counts)
+    if all_words:
+        jobs.append(("3_wordcloud_general.png", word_cloud_figure, (all_words, "Nube de Palabras General")))
+    jobs.append(("3_co_word_network.png", co_word_network_figure, (category_counts,)))
+    return jobs
+
+def render_category_charts(category_counts):
+    """Gráficos del análisis de categorías como {nombre de archivo: PNG en bytes}, en este proceso."""
+    return {name: to_png(function(*args)) for name, function, args in category_chart_jobs(category_counts)}
 
 #############################################
 # EJECUCIÓN DEL SCRIPT
 #############################################
 
-def main():
-    """Procesa los datos y genera los gráficos requeridos."""
+def main(workers=None):
+    """
+    Procesa los datos y genera los gráficos requeridos. Los gráficos se
+    renderizan en paralelo (render_paralelo) con a lo sumo `workers` procesos;
+    workers=1 los genera en este proceso.
+    """
     script_dir = os.path.dirname(os.path.abspath(__file__))
     json_filepath = os.path.join(script_dir, "processed_articles.json")
 
@@ -116,28 +211,20 @@ def main():
     results_folder = os.path.join(script_dir, "resultados")
     os.makedirs(results_folder, exist_ok=True)
 
-    # Cargar los datos
-    data = load_data(json_filepath)
-
-    # Analizar frecuencia de variables por categoría
-    category_counts = analyze_category_frequencies(data)
+    # Analizar frecuencia de variables por categoría (los abstracts se consumen como generador)
+    articles = load_store(json_filepath).iter_records(limit=1000, fields=["abstract"])
+    category_counts = analyze_category_frequencies(articles)
 
     # Generar gráficos
-    for category, counts in category_counts.items():
-        plot_bar_chart(counts, f"Frecuencia de Variables en {category}", "Frecuencia", "Variables", os.path.join(results_folder, f"3_{category}_frecuencia.png"))
-        generate_word_cloud(counts, f"Nube de Palabras en {category}", os.path.join(results_folder, f"3_{category}_wordcloud.png"))
-
-    # Generar nube de palabras general
-    all_words = collections.Counter()
-    for counts in category_counts.values():
-        all_words.update(counts)
-
-    generate_word_cloud(all_words, "Nube de Palabras General", os.path.join(results_folder, "3_wordcloud_general.png"))
-
-    # Generar co-word network visualization
-    generate_co_word_network(category_counts, os.path.join(results_folder, "3_co_word_network.png"))
+    results = render_jobs(category_chart_jobs(category_counts), output_dir=results_folder, workers=workers)
+    for result in results:
+        print(f"Gráfico guardado: {result['path']}")
+    print_render_timings(results)
 
     print("Proceso completado: estadísticas generadas y gráficos guardados.")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Análisis de categorías y sus gráficos.")
+    parser.add_argument("--workers", type=int, default=None, help="Procesos para renderizar los gráficos")
+    args = parser.parse_args()
+    main(workers=args.workers)
@@ -1,21 +1,18 @@
 import os
-import json
 import matplotlib.pyplot as plt
 import collections
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 import pandas as pd
 import streamlit as st
+from cache_similitud import cached_similarity
+from almacen_articulos import load_store
 
 #############################################
 # CARGAR ARCHIVO JSON
 #############################################
 
 def load_data(json_filepath):
-    """Carga los artículos desde el archivo JSON y limita a los primeros 1000."""
-    with open(json_filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    return data[:1000]  # Tomar solo los primeros 1000 artículos
+    """Carga los artículos desde el almacén columnar del JSON y limita a los primeros 1000."""
+    return load_store(json_filepath).records(limit=1000)  # Tomar solo los primeros 1000 artículos
 
 #############################################
 # FUNCIÓN PARA CONTAR FRECUENCIAS DE VARIABLES
@@ -85,33 +82,39 @@ def plot_yearly_trends(grouped_data, filename):
 # EJECUCIÓN DEL SCRIPT
 #############################################
 
-def calcular_similitud_entre_abstracts(data, top_n=5):
+def top_similar_abstracts(data, top_n=5, max_memory_mb=256):
+    """
+    Retorna (abstracts, pares) con los top_n pares (i, j, similitud) de
+    abstracts más similares (TF-IDF + coseno). La búsqueda se hace por bloques
+    sobre la matriz dispersa, con un pico de memoria acotado por max_memory_mb.
+    El modelo TF-IDF y los pares se guardan en caché en disco, de modo que un
+    corpus sin cambios no se recalcula.
+    """
     abstracts = [item.get("abstract", "") for item in data if item.get("abstract")]
+    if not abstracts:
+        return abstracts, []
+    _, _, results = cached_similarity(abstracts, top_n=top_n, max_memory_mb=max_memory_mb)
+    return abstracts, results
+
+def mostrar_similitudes(abstracts, results, top_n=5):
+    """Muestra en Streamlit los pares calculados por top_similar_abstracts."""
     if not abstracts:
         st.warning("No se encontraron abstracts en los datos.")
         return
 
-    vectorizer = TfidfVectorizer(stop_words='english')
-    X = vectorizer.fit_transform(abstracts)
-    similarity_matrix = cosine_similarity(X)
-
     # Mostrar pares más similares
     st.subheader(f"Top {top_n} pares de abstracts más similares")
-    results = []
-    for i in range(len(abstracts)):
-        for j in range(i + 1, len(abstracts)):
-            sim_score = similarity_matrix[i, j]
-            results.append((i, j, sim_score))
-
-    # Ordenar por similitud
-    results.sort(key=lambda x: x[2], reverse=True)
-
-    for i, j, score in results[:top_n]:
+    for i, j, score in results:
         st.markdown(f"**Abstract {i} vs Abstract {j}** - Similaridad: {score:.2f}")
         st.markdown(f"- {abstracts[i][:300]}...")
         st.markdown(f"- {abstracts[j][:300]}...")
         st.markdown("---")
 
+def calcular_similitud_entre_abstracts(data, top_n=5, max_memory_mb=256):
+    """Calcula (top_similar_abstracts) y muestra (mostrar_similitudes) los top_n pares más similares."""
+    abstracts, results = top_similar_abstracts(data, top_n, max_memory_mb)
+    mostrar_similitudes(abstracts, results, top_n)
+
 def main():
     """Procesa los datos y genera los gráficos solicitados."""
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -0,0 +1,184 @@
+import time
+import random
+import asyncio
+import threading
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor
+import requests
+
+#############################################
+# MOTOR DE SCRAPING ASÍNCRONO
+#############################################
+#
+# Las búsquedas (base de datos × término) se ejecutan de forma concurrente con
+# asyncio. Las peticiones HTTP se hacen con requests en un pool de hilos (una
+# Session por hilo), y cada host tiene su propio token bucket, de modo que la
+# espera entre peticiones a un mismo sitio ya no bloquea a los demás:
+#   - rate: peticiones por segundo por host (0.5 = la pausa de 2 s original).
+#   - retries: reintentos ante errores de red, 429 y 5xx, con backoff
+#     exponencial + jitter (se respeta Retry-After si el servidor lo envía).
+#   - max_pages: páginas de resultados por búsqueda; la paginación se detiene
+#     en la primera página vacía o que no aporta artículos nuevos.
+#   - cache: HttpCache opcional; las páginas frescas no consumen fichas ni red,
+#     las vencidas se revalidan con peticiones condicionales y los cuerpos sin
+#     cambios no se vuelven a parsear (ver cache_http).
+# La extracción de artículos también se ejecuta en el pool de hilos, fuera del
+# event loop, para que el parseo de una página no retrase las demás descargas.
+
+DEFAULT_RATE = 0.5
+DEFAULT_BURST = 1
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF_S = 1.0
+DEFAULT_TIMEOUT_S = 30.0
+DEFAULT_CONCURRENCY = 8
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+class TokenBucket:
+    """Limitador de tasa: `rate` fichas por segundo, hasta `capacity` acumuladas."""
+
+    def __init__(self, rate, capacity=DEFAULT_BURST):
+        if rate <= 0:
+            raise ValueError("rate debe ser positivo.")
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self):
+        # El lock hace que las corrutinas que esperan al mismo host se atiendan en orden
+        async with self._lock:
+            self._refill()
+            while self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+
+def _retry_after(response):
+    """Segundos indicados en Retry-After (solo la forma numérica), o None."""
+    value = response.headers.get("Retry-After") if response is not None else None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+class AsyncScraper:
+    """
+    page_url(database, término, página) -> URL de la página de resultados.
+    parse(database, html) -> lista de artículos de esa página.
+    headers(url) -> headers de la petición (opcional).
+    cache: HttpCache para reutilizar y revalidar las respuestas (opcional).
+    parser_key: identifica a `parse` en la caché (ver HttpCache.parse); si cambia, se vuelve a parsear.
+    host_rates: {host: peticiones por segundo} para sobrescribir `rate` en hosts concretos.
+    """
+
+    def __init__(self, page_url, parse, headers=None, rate=DEFAULT_RATE, burst=DEFAULT_BURST, host_rates=None,
+                 retries=DEFAULT_RETRIES, backoff_s=DEFAULT_BACKOFF_S, timeout_s=DEFAULT_TIMEOUT_S,
+                 concurrency=DEFAULT_CONCURRENCY, cache=None, parser_key=None):
+        self.page_url = page_url
+        self.parse = parse
+        self.headers = headers
+        self.rate = rate
+        self.burst = burst
+        self.host_rates = host_rates or {}
+        self.retries = retries
+        self.backoff_s = backoff_s
+        self.timeout_s = timeout_s
+        self.concurrency = concurrency
+        self.cache = cache
+        self.parser_key = parser_key
+        self._buckets = {}
+        self._local = threading.local()
+
+    def _bucket(self, url):
+        host = urlsplit(url).netloc
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(self.host_rates.get(host, self.rate), self.burst)
+        return self._buckets[host]
+
+    def _session(self):
+        # requests.Session no es seguro entre hilos: una por hilo del pool
+        if not hasattr(self._local, "session"):
+            self._local.session = requests.Session()
+        return self._local.session
+
+    def _get(self, url):
+        headers = self.headers(url) if self.headers else None
+        if self.cache is not None:
+            return self.cache.get(self._session(), url, headers=headers, timeout=self.timeout_s)
+        return self._session().get(url, headers=headers, timeout=self.timeout_s)
+
+    async def fetch(self, url, label=""):
+        """Descarga `url` respetando el límite del host; retorna la respuesta o None si falla."""
+        loop = asyncio.get_running_loop()
+        if self.cache is not None:
+            cached = await loop.run_in_executor(self._executor, self.cache.fresh, url)
+            if cached is not None:
+                return cached
+        bucket = self._bucket(url)
+        for attempt in range(self.retries + 1):
+            await bucket.acquire()
+            response = None
+            async with self._semaphore:
+                print(f"[Scraping] Accediendo a: {url}")
+                try:
+                    response = await loop.run_in_executor(self._executor, self._get, url)
+                except requests.RequestException as e:
+                    error = f"{type(e).__name__}: {e}"
+                else:
+                    if response.status_code == 200:
+                        return response
+                    error = response.status_code
+            if attempt == self.retries or (response is not None and response.status_code not in RETRY_STATUS):
+                print(f"Error accediendo a {label or url}: {error}")
+                return None
+            delay = _retry_after(response)
+            if delay is None:
+                delay = self.backoff_s * 2 ** attempt * (1 + random.random())
+            print(f"[Scraping] {label or url}: {error}, reintento {attempt + 1}/{self.retries} en {delay:.1f} s")
+            await asyncio.sleep(delay)
+
+    def _parse_page(self, database, url, response):
+        if self.cache is not None:
+            return self.cache.parse(url, response, lambda html: self.parse(database, html), self.parser_key)
+        return self.parse(database, response.text)
+
+    async def scrape_query(self, database, term, max_pages=1):
+        """Recorre hasta max_pages páginas de resultados de una búsqueda."""
+        print(f"[Scraping] Buscando en {database} con el término '{term}'...")
+        articles = []
+        seen = set()
+        for page in range(1, max_pages + 1):
+            url = self.page_url(database, term, page)
+            response = await self.fetch(url, f"{database} para el término '{term}'")
+            if response is None:
+                break
+            # El parseo (CPU) se hace en el pool de hilos para no bloquear el event loop
+            parsed = await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._parse_page, database, url, response)
+            found = [article for article in parsed
+                     if (article.get("Article title"), article.get("URL")) not in seen]
+            if not found:
+                break
+            seen.update((article.get("Article title"), article.get("URL")) for article in found)
+            articles.extend(found)
+        return articles
+
+    async def scrape_all(self, databases, terms, max_pages=1):
+        """
+        Ejecuta todas las búsquedas databases × terms de forma concurrente y
+        retorna los artículos en el mismo orden que el recorrido secuencial.
+        """
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._buckets = {}
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            self._executor = executor
+            results = await asyncio.gather(*(self.scrape_query(database, term, max_pages)
+                                             for database in databases for term in terms))
+        return [article for articles in results for article in articles]
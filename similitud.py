@@ -0,0 +1,68 @@
+import heapq
+import numpy as np
+from sklearn.preprocessing import normalize
+
+#############################################
+# BÚSQUEDA TOP-K DE PARES SIMILARES (SIN MATRIZ N×N)
+#############################################
+
+# Bytes estimados por celda de un bloque: producto disperso (valor + índice) más su copia densa
+BYTES_POR_CELDA = 20
+
+def block_rows_for_memory(n_rows, max_memory_mb):
+    """Calcula cuántas filas caben en un bloque sin superar el presupuesto de memoria."""
+    budget = int(max_memory_mb * 1024 * 1024)
+    return max(1, budget // (max(n_rows, 1) * BYTES_POR_CELDA))
+
+def top_k_similar_pairs(X, top_n=5, max_memory_mb=256):
+    """
+    Retorna los top_n pares (i, j, similitud) con i < j de mayor similitud coseno
+    entre las filas de X, ordenados de mayor a menor similitud.
+
+    X se mantiene dispersa: las similitudes se calculan por bloques de filas
+    (bloque · Xᵀ) cuyo tamaño se deriva de max_memory_mb, y de cada bloque solo
+    se conservan sus mejores candidatos (argpartition) en un heap acotado a
+    top_n elementos. Nunca se materializa la matriz completa n×n.
+
+    Los empates se resuelven a favor del par (i, j) menor, igual que el
+    ordenamiento estable de la implementación original.
+    """
+    n = X.shape[0]
+    if n < 2 or top_n <= 0:
+        return []
+
+    X = normalize(X, norm="l2", copy=True).tocsr()
+    XT = X.T.tocsc()
+    block_rows = block_rows_for_memory(n, max_memory_mb)
+
+    # Min-heap de (similitud, -i, -j): la raíz es siempre el peor candidato retenido
+    heap = []
+    for start in range(0, n - 1, block_rows):
+        end = min(start + block_rows, n)
+        # Solo interesan las columnas j > i, así que el bloque empieza en la columna start
+        block = (X[start:end] @ XT[:, start:]).toarray()
+        rows = np.arange(end - start)[:, None]
+        cols = np.arange(n - start)[None, :]
+        block[cols <= rows] = -np.inf
+
+        flat = block.ravel()
+        k = min(top_n, flat.size)
+        threshold = flat[np.argpartition(flat, flat.size - k)[flat.size - k:]].min()
+        # Entre los empates con el umbral se toman los primeros en orden fila-columna
+        above = np.flatnonzero(flat > threshold)
+        ties = np.flatnonzero(flat == threshold)[:k - above.size]
+        for idx in np.concatenate([above, ties]):
+            score = flat[idx]
+            if score == -np.inf:
+                continue
+            i = start + int(idx // block.shape[1])
+            j = start + int(idx % block.shape[1])
+            item = (float(score), -i, -j)
+            if len(heap) < top_n:
+                heapq.heappush(heap, item)
+            elif item > heap[0]:
+                heapq.heapreplace(heap, item)
+
+    pairs = [(-neg_i, -neg_j, score) for score, neg_i, neg_j in heap]
+    pairs.sort(key=lambda pair: (-pair[2], pair[0], pair[1]))
+    return pairs
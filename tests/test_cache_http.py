@@ -0,0 +1,31 @@
+from cache_http import HttpCache
+from extractores_html import parser_key
+
+class Session:
+    """requests.Session mínima: siempre responde 200 con el mismo cuerpo."""
+
+    class Response:
+        status_code = 200
+        text = "<html><body>resultados</body></html>"
+        headers = {"ETag": '"v1"'}
+
+    def get(self, url, headers=None, timeout=None):
+        return self.Response()
+
+def test_parsed_articles_are_reused_only_with_the_same_parser(tmp_path):
+    cache = HttpCache(cache_dir=str(tmp_path))
+    url = "https://example.org/search?q=abstraction"
+    response = cache.get(Session(), url)
+    calls = []
+
+    def parse(version):
+        def run(html):
+            calls.append(version)
+            return [{"Article title": f"parsed by {version}"}]
+        return run
+
+    assert cache.parse(url, response, parse("bs4"), parser_key("bs4"))[0]["Article title"] == "parsed by bs4"
+    assert cache.parse(url, response, parse("bs4"), parser_key("bs4"))[0]["Article title"] == "parsed by bs4"
+    # Otro backend (o una nueva PARSER_VERSION) no reutiliza lo extraído por el anterior
+    assert cache.parse(url, response, parse("lxml"), parser_key("lxml"))[0]["Article title"] == "parsed by lxml"
+    assert calls == ["bs4", "lxml"]
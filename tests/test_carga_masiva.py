@@ -0,0 +1,50 @@
+import sqlite3
+
+from carga_masiva import bulk_insert, ensure_schema, refresh_statistics
+
+class UnbufferedCursor(sqlite3.Cursor):
+    """
+    Como un cursor sin buffer de mysql.connector: ejecutar otra sentencia sin
+    haber leído el resultado anterior completo (fetchall o fetchone hasta None)
+    falla con "Unread result found".
+    """
+
+    unread = False
+
+    def _check(self):
+        if self.unread:
+            raise sqlite3.InterfaceError("Unread result found")
+
+    def execute(self, *args):
+        self._check()
+        super().execute(*args)
+        self.unread = self.description is not None
+        return self
+
+    def executemany(self, *args):
+        self._check()
+        return super().executemany(*args)
+
+    def fetchone(self):
+        row = super().fetchone()
+        if row is None:
+            self.unread = False
+        return row
+
+    def fetchall(self):
+        rows = super().fetchall()
+        self.unread = False
+        return rows
+
+class UnbufferedConnection(sqlite3.Connection):
+    def cursor(self, factory=UnbufferedCursor):
+        return super().cursor(factory)
+
+def test_schema_checks_read_their_whole_result():
+    conn = sqlite3.connect(":memory:", factory=UnbufferedConnection)
+    # La segunda ejecución encuentra todos los índices ya creados
+    for _ in range(2):
+        ensure_schema(conn)
+        bulk_insert(conn, [{"title": "Abstraction in early programming", "author": "Doe, Jane", "doi": "10.1/a"}])
+        refresh_statistics(conn)
+    assert conn.execute("SELECT COUNT(*) FROM articles").fetchone() == (1,)
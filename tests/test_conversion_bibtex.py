@@ -0,0 +1,52 @@
+import csv
+import sqlite3
+
+from carga_masiva import bulk_insert, ensure_schema
+from conversion_bibtex import csv_to_bibtex
+from deduplicacion import is_missing
+from unificacion_incremental import IncrementalUnifier, parse_bibtex_file
+
+def write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Article title", "Authors", "Volume year", "DOI", "URL", "Abstract", "Journal title"])
+        writer.writerows(rows)
+
+def test_escaped_fields_load_back_unescaped(tmp_path):
+    csv_path, bib_path = tmp_path / "articles.csv", tmp_path / "articles.bib"
+    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Authors", "Article title", "Volume year", "Journal title", "DOI"])
+        writer.writerow(["Doe, J.", "Scores of 100% with C# & snake_case", "2021", "IEEE Trans. Vis. & Comp.",
+                         "10.1/a_b"])
+    csv_to_bibtex(str(csv_path), str(bib_path))
+
+    assert r"Vis. \& Comp." in bib_path.read_text(encoding="utf-8")
+    [entry] = parse_bibtex_file(str(bib_path))
+    assert entry["title"] == "Scores of 100% with C# & snake_case"
+    assert entry["journal"] == "IEEE Trans. Vis. & Comp."
+    assert entry["doi"] == "10.1/a_b"
+
+def test_scraper_placeholder_dois_stay_distinct_articles(tmp_path):
+    # extractores_html usa "No DOI" / "No URL" cuando la página no los trae
+    titles = ["Tangible programming for kindergarten", "Measuring abstraction skills in secondary education",
+              "A survey of computational thinking assessments", "Unplugged activities and pattern recognition",
+              "Robotics kits in teacher training"]
+    write_csv(tmp_path / "articles.csv", [[title, "Doe, Jane", "2022", "No DOI", "No URL", "N/A", "Nature"]
+                                          for title in titles])
+    csv_to_bibtex(str(tmp_path / "articles.csv"), str(tmp_path / "articles.bib"))
+    entries = parse_bibtex_file(str(tmp_path / "articles.bib"))
+    assert all("doi" not in entry and entry["url"] == "No URL" for entry in entries)
+
+    stats = IncrementalUnifier(str(tmp_path), workers=1).run()
+    assert (stats["unique"], stats["duplicates"]) == (5, 0)
+
+    conn = sqlite3.connect(":memory:")
+    ensure_schema(conn)
+    for _ in range(2):
+        bulk_insert(conn, entries, upsert=True)
+    assert conn.execute("SELECT COUNT(*), COUNT(DISTINCT article_key) FROM articles").fetchone() == (5, 5)
+
+def test_placeholders_match_after_whitespace_normalization():
+    assert all(is_missing(value) for value in ["No DOI", " no  doi ", "NoDOI", "UNKNOWN", None, ""])
+    assert not is_missing("10.1/nodoi.2020")
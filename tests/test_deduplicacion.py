@@ -0,0 +1,31 @@
+import bibtexparser
+
+from deduplicacion import exact_key, separate_near_duplicates
+from unificacion_incremental import IncrementalUnifier
+
+def test_doi_less_entry_does_not_bridge_two_known_dois():
+    entries = [
+        {"ID": "a", "title": "Computational thinking in primary schools", "author": "Smith, John", "doi": "10.1/aaa"},
+        {"ID": "b", "title": "Computational thinking in primary school", "author": "Smith, John", "doi": "No DOI"},
+        {"ID": "c", "title": "Computational thinking in primary schools.", "author": "Smith, John",
+         "doi": "10.1/bbb"},
+    ]
+    unique, duplicates, _ = separate_near_duplicates(entries)
+    assert [entry["ID"] for entry in unique] == ["a", "c"]
+    assert [entry["ID"] for entry in duplicates] == ["b"]
+
+def test_placeholder_dois_fall_back_to_title_and_author(tmp_path):
+    entries = [{"ID": str(i), "title": title, "author": "Doe, Jane", "doi": "No DOI"}
+               for i, title in enumerate(["Tangible programming for kindergarten",
+                                          "Measuring abstraction skills in secondary education",
+                                          "A survey of computational thinking assessments",
+                                          "Unplugged activities and pattern recognition"])]
+    assert len({exact_key(entry) for entry in entries}) == 4
+    assert exact_key(dict(entries[0], doi="10.1/x")) == "10.1/x"
+
+    bib = tmp_path / "articles.bib"
+    database = bibtexparser.bibdatabase.BibDatabase()
+    database.entries = [dict(entry, ENTRYTYPE="article") for entry in entries]
+    bib.write_text(bibtexparser.bwriter.BibTexWriter().write(database), encoding="utf-8")
+    stats = IncrementalUnifier(str(tmp_path), workers=1).run()
+    assert (stats["unique"], stats["duplicates"]) == (4, 0)
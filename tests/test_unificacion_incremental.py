@@ -0,0 +1,55 @@
+import os
+import json
+
+import bibtexparser
+
+from unificacion_incremental import CLUSTERS_FILENAME, DUPLICATES_FILENAME, UNIFIED_FILENAME, IncrementalUnifier
+
+ENTRIES = [
+    {"ID": "a", "title": "Computational thinking in primary schools", "author": "Smith, John", "doi": "10.1/a"},
+    {"ID": "b", "title": "Abstraction as a core skill of programming", "author": "Garcia, Ana", "doi": "10.1/b"},
+    {"ID": "c", "title": "Assessing algorithmic reasoning with block languages", "author": "Chen, Li",
+     "doi": "No DOI"},
+]
+
+def write_bib(path, entries):
+    database = bibtexparser.bibdatabase.BibDatabase()
+    database.entries = [dict(entry, ENTRYTYPE="article") for entry in entries]
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(bibtexparser.bwriter.BibTexWriter().write(database))
+
+def unified_ids(folder):
+    with open(os.path.join(folder, UNIFIED_FILENAME), encoding="utf-8") as f:
+        return sorted(entry["ID"] for entry in bibtexparser.load(f).entries)
+
+def test_rewritten_source_is_not_a_duplicate_of_itself(tmp_path):
+    folder = str(tmp_path)
+    write_bib(os.path.join(folder, "articles.bib"), ENTRIES)
+    first = IncrementalUnifier(folder, workers=1).run()
+    assert (first["unique"], first["duplicates"], first["known"]) == (3, 0, 0)
+
+    # main_pipeline reescribe articles.bib en cada ejecución: mismo contenido más una entrada nueva
+    new_entry = {"ID": "d", "title": "Debugging strategies of novice programmers", "author": "Okafor, Ada",
+                 "doi": "10.1/d"}
+    write_bib(os.path.join(folder, "articles.bib"), list(reversed(ENTRIES)) + [new_entry])
+    second = IncrementalUnifier(folder, workers=1).run()
+    assert (second["parsed_files"], second["unique"], second["duplicates"], second["known"]) == (1, 1, 0, 3)
+    assert unified_ids(folder) == ["a", "b", "c", "d"]
+    assert not os.path.exists(os.path.join(folder, DUPLICATES_FILENAME))
+    assert not os.path.exists(os.path.join(folder, CLUSTERS_FILENAME))
+
+def test_copy_in_another_file_is_still_a_duplicate(tmp_path):
+    folder = str(tmp_path)
+    write_bib(os.path.join(folder, "articles.bib"), ENTRIES)
+    IncrementalUnifier(folder, workers=1).run()
+
+    write_bib(os.path.join(folder, "other.bib"), [dict(ENTRIES[0], ID="a2")])
+    stats = IncrementalUnifier(folder, workers=1).run()
+    assert (stats["unique"], stats["duplicates"]) == (0, 1)
+    # Reescribir el otro archivo no vuelve a reportar la misma copia
+    write_bib(os.path.join(folder, "other.bib"), [dict(ENTRIES[0], ID="a2"), dict(ENTRIES[1], ID="b")])
+    stats = IncrementalUnifier(folder, workers=1).run()
+    assert (stats["unique"], stats["duplicates"], stats["known"]) == (0, 1, 1)
+    with open(os.path.join(folder, CLUSTERS_FILENAME), encoding="utf-8") as f:
+        clusters = json.load(f)
+    assert sorted(duplicate["ID"] for record in clusters for duplicate in record["duplicates"]) == ["a2", "b"]
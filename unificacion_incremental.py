@@ -0,0 +1,337 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+import bibtexparser
+import numpy as np
+
+from conversion_bibtex import bibtex_parser
+from deduplicacion import (DEFAULT_AUTHOR_THRESHOLD, DEFAULT_NUM_PERM, DEFAULT_TITLE_THRESHOLD, MISSING_VALUES,
+                           band_keys, candidate_pairs, cluster_record, entry_features, exact_key, is_near_duplicate,
+                           lsh_parameters, minhash_signatures, normalize_text)
+
+#############################################
+# UNIFICACIÓN INCREMENTAL DE ARCHIVOS BIBTEX
+#############################################
+#
+# En lugar de volver a parsear todos los .bib de la carpeta y reescribir la
+# salida en cada ejecución, el estado se guarda en un índice SQLite
+# (.unify_index.db en la misma carpeta):
+#   - files: tamaño, mtime y sha256 de cada .bib ya procesado. Solo se parsean
+#     los archivos nuevos o cuyo contenido cambió (si solo cambió el mtime, el
+#     hash coincide y no se vuelve a parsear), en paralelo con un pool de procesos.
+#   - keys: (clave exacta, archivo de origen) de cada entrada vista -> entrada
+#     conservada (clave: deduplicacion.exact_key, como integrate.separate_duplicates):
+#     el duplicado exacto es una búsqueda. Al volver a parsear un .bib
+#     modificado, sus entradas ya registradas desde ese mismo archivo se omiten
+#     (no son duplicados de sí mismas).
+#   - entries / bands: título, autores y DOI de las entradas conservadas y las
+#     claves de sus bandas LSH (ver deduplicacion), para buscar casi duplicados
+#     contra todo lo ya unificado sin recalcularlo.
+# Las entradas nuevas y únicas se agregan al final de unified_references.bib y
+# las duplicadas al de duplicated_references.bib. El índice guarda el tamaño de
+# ambos archivos tras cada ejecución: si una ejecución se interrumpe después de
+# escribir, la siguiente descarta lo agregado; si los archivos se borraron o
+# editaron, se reconstruye todo. Las entradas que desaparecen de un .bib
+# modificado no se quitan de la salida (solo se agrega).
+
+UNIFIED_FILENAME = "unified_references.bib"
+DUPLICATES_FILENAME = "duplicated_references.bib"
+CLUSTERS_FILENAME = "duplicate_clusters.json"
+INDEX_FILENAME = ".unify_index.db"
+# Cambia cuando cambia INDEX_SCHEMA: un índice de otra versión se reconstruye
+INDEX_VERSION = 3
+OUTPUT_FILENAMES = {UNIFIED_FILENAME, DUPLICATES_FILENAME}
+
+INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (name TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, sha256 TEXT);
+CREATE TABLE IF NOT EXISTS keys (key TEXT, source TEXT, entry INTEGER, PRIMARY KEY (key, source));
+CREATE TABLE IF NOT EXISTS entries (id INTEGER PRIMARY KEY, bib_id TEXT, title TEXT, author TEXT, doi TEXT);
+CREATE TABLE IF NOT EXISTS bands (band INTEGER, bucket INTEGER, entry INTEGER);
+CREATE INDEX IF NOT EXISTS ix_bands_bucket ON bands (band, bucket);
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT);
+"""
+
+def file_sha256(path, chunk_size=1024 * 1024):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def parse_bibtex_file(path):
+    """Entradas de un .bib sin el escape LaTeX (se ejecuta en los procesos del pool)."""
+    with open(path, encoding="utf-8") as bibtex_file:
+        return bibtexparser.load(bibtex_file, parser=bibtex_parser()).entries
+
+def _append_entries(path, entries):
+    if not entries:
+        return
+    database = bibtexparser.bibdatabase.BibDatabase()
+    database.entries = entries
+    with open(path, "a", encoding="utf-8") as output_file:
+        output_file.write(bibtexparser.bwriter.BibTexWriter().write(database))
+        output_file.flush()
+        os.fsync(output_file.fileno())
+
+def _size(path):
+    return os.path.getsize(path) if os.path.exists(path) else 0
+
+class IncrementalUnifier:
+    """
+    Unifica los .bib de `data_folder` de forma incremental.
+    workers: procesos para parsear los archivos modificados (None = os.cpu_count()).
+    near_duplicates / title_threshold / author_threshold: como deduplicacion.find_near_duplicates.
+    """
+
+    def __init__(self, data_folder, workers=None, near_duplicates=True, title_threshold=DEFAULT_TITLE_THRESHOLD,
+                 author_threshold=DEFAULT_AUTHOR_THRESHOLD, num_perm=DEFAULT_NUM_PERM):
+        self.data_folder = data_folder
+        self.workers = workers
+        self.near_duplicates = near_duplicates
+        self.title_threshold = title_threshold
+        self.author_threshold = author_threshold
+        self.num_perm = num_perm
+        self.bands, self.rows = lsh_parameters(title_threshold, num_perm)
+        self.unified_path = os.path.join(data_folder, UNIFIED_FILENAME)
+        self.duplicates_path = os.path.join(data_folder, DUPLICATES_FILENAME)
+        self.clusters_path = os.path.join(data_folder, CLUSTERS_FILENAME)
+        self.index_path = os.path.join(data_folder, INDEX_FILENAME)
+
+    #############################################
+    # ÍNDICE Y CONSISTENCIA CON LA SALIDA
+    #############################################
+
+    def _connect(self):
+        conn = sqlite3.connect(self.index_path)
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(keys)")]
+        if columns and "source" not in columns:
+            # Índice de la versión 1 (claves sin archivo de origen): _settings no coincide y se reconstruye
+            conn.execute("DROP TABLE keys")
+        conn.executescript(INDEX_SCHEMA)
+        return conn
+
+    def _meta(self, conn, name):
+        row = conn.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def _settings(self):
+        return json.dumps([INDEX_VERSION, self.near_duplicates, self.title_threshold, self.author_threshold,
+                           self.num_perm])
+
+    def _reset(self, conn):
+        for table in ("files", "keys", "entries", "bands", "meta"):
+            conn.execute(f"DELETE FROM {table}")
+        conn.commit()
+        for path in (self.unified_path, self.duplicates_path, self.clusters_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _check_outputs(self, conn):
+        """
+        Retorna True si la salida coincide con el índice. Lo agregado por una
+        ejecución interrumpida (archivo más largo que lo registrado) se trunca;
+        si falta contenido o cambiaron los parámetros, hay que reconstruir.
+        """
+        if self._meta(conn, "settings") != self._settings():
+            return not conn.execute("SELECT 1 FROM files LIMIT 1").fetchone() and not os.path.exists(self.unified_path)
+        for path, name in ((self.unified_path, "unified_size"), (self.duplicates_path, "duplicates_size")):
+            expected = int(self._meta(conn, name) or 0)
+            if _size(path) < expected:
+                return False
+            if _size(path) > expected:
+                with open(path, "r+b") as f:
+                    f.truncate(expected)
+        return True
+
+    #############################################
+    # ARCHIVOS NUEVOS O MODIFICADOS
+    #############################################
+
+    def _changed_files(self, conn):
+        """[(nombre, tamaño, mtime_ns, sha256)] de los .bib que hay que parsear, en orden alfabético."""
+        known = {name: (size, mtime_ns, sha256) for name, size, mtime_ns, sha256 in
+                 conn.execute("SELECT name, size, mtime_ns, sha256 FROM files")}
+        changed = []
+        for name in sorted(os.listdir(self.data_folder)):
+            if not name.endswith(".bib") or name in OUTPUT_FILENAMES:
+                continue
+            stat = os.stat(os.path.join(self.data_folder, name))
+            previous = known.get(name)
+            if previous and previous[:2] == (stat.st_size, stat.st_mtime_ns):
+                continue
+            sha256 = file_sha256(os.path.join(self.data_folder, name))
+            if previous and previous[2] == sha256:
+                # Mismo contenido (p. ej. solo se tocó el archivo): se actualiza el mtime sin parsear
+                conn.execute("UPDATE files SET size = ?, mtime_ns = ? WHERE name = ?",
+                             (stat.st_size, stat.st_mtime_ns, name))
+                continue
+            changed.append((name, stat.st_size, stat.st_mtime_ns, sha256))
+        return changed
+
+    def _parse(self, names):
+        paths = [os.path.join(self.data_folder, name) for name in names]
+        if len(paths) <= 1 or self.workers == 1:
+            return [parse_bibtex_file(path) for path in paths]
+        with ProcessPoolExecutor(max_workers=min(self.workers or os.cpu_count() or 1, len(paths))) as executor:
+            return list(executor.map(parse_bibtex_file, paths))
+
+    #############################################
+    # DEDUPLICACIÓN CONTRA EL ÍNDICE
+    #############################################
+
+    def _near_candidates(self, conn, keys):
+        """{posición de la entrada nueva: {id de entrada conservada}} que comparten alguna banda."""
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS new_bands (position INTEGER, band INTEGER, bucket INTEGER)")
+        conn.execute("DELETE FROM new_bands")
+        conn.executemany("INSERT INTO new_bands VALUES (?, ?, ?)",
+                         ((position, band, int(bucket)) for position, row in enumerate(keys.view(np.int64))
+                          for band, bucket in enumerate(row)))
+        candidates = {}
+        for position, entry in conn.execute("SELECT DISTINCT n.position, b.entry FROM new_bands n "
+                                            "JOIN bands b ON b.band = n.band AND b.bucket = n.bucket"):
+            candidates.setdefault(position, set()).add(entry)
+        return candidates
+
+    def _deduplicate(self, conn, entries, sources):
+        """
+        Clasifica las entradas nuevas (sources[i]: archivo de entries[i]) y
+        actualiza el índice (sin commit). Retorna (únicas, [(duplicada, id
+        conservada, "exact"|"near", similitud)], omitidas), donde omitidas son
+        las entradas cuya clave ya había aportado el mismo archivo.
+        """
+        titles = [normalize_text(entry.get("title")) for entry in entries]
+        features = {}
+
+        def feature(position):
+            if position not in features:
+                features[position] = entry_features(entries[position], titles[position])
+            return features[position]
+
+        near = [position for position, title in enumerate(titles) if title not in MISSING_VALUES]
+        indexed_candidates, batch_candidates, keys = {}, {}, None
+        if self.near_duplicates and near:
+            signatures = minhash_signatures([titles[position] for position in near], self.num_perm)
+            keys = band_keys(signatures, self.bands, self.rows)
+            indexed_candidates = {near[position]: ids for position, ids in self._near_candidates(conn, keys).items()}
+            for first, second in candidate_pairs(signatures, self.bands, self.rows):
+                batch_candidates.setdefault(near[second], []).append(near[first])
+        band_rows = {position: keys[i] for i, position in enumerate(near)} if keys is not None else {}
+
+        stored_features = {}
+        ids = {}
+        next_id = (conn.execute("SELECT MAX(id) FROM entries").fetchone()[0] or 0) + 1
+        unique, duplicates, skipped = [], [], 0
+        # Claves registradas en esta ejecución: una copia dentro del mismo archivo sí es duplicada
+        added = set()
+        for position, entry in enumerate(entries):
+            key, source = exact_key(entry), sources[position]
+            row = conn.execute("SELECT entry, source = ? FROM keys WHERE key = ? ORDER BY source = ? DESC LIMIT 1",
+                               (source, key, source)).fetchone()
+            if row and row[1] and (key, source) not in added:
+                skipped += 1
+                continue
+            match = (row[0], "exact", 1.0) if row else None
+            if match is None:
+                for entry_id in sorted(indexed_candidates.get(position, ())):
+                    if entry_id not in stored_features:
+                        title, author, doi = conn.execute("SELECT title, author, doi FROM entries WHERE id = ?",
+                                                          (entry_id,)).fetchone()
+                        stored_features[entry_id] = entry_features({"title": title, "author": author, "doi": doi})
+                    if self._similar(feature(position), stored_features[entry_id]):
+                        match = (entry_id, "near", self._similarity(feature(position), stored_features[entry_id]))
+                        break
+            if match is None:
+                for earlier in sorted(batch_candidates.get(position, ())):
+                    if earlier in ids and self._similar(feature(position), feature(earlier)):
+                        match = (ids[earlier], "near", self._similarity(feature(position), feature(earlier)))
+                        break
+            if match is not None:
+                conn.execute("INSERT OR IGNORE INTO keys VALUES (?, ?, ?)", (key, source, match[0]))
+                added.add((key, source))
+                duplicates.append((entry,) + match)
+                continue
+            ids[position] = next_id
+            conn.execute("INSERT OR IGNORE INTO keys VALUES (?, ?, ?)", (key, source, next_id))
+            added.add((key, source))
+            conn.execute("INSERT INTO entries VALUES (?, ?, ?, ?, ?)",
+                         (next_id, entry.get("ID"), entry.get("title"), entry.get("author"), entry.get("doi")))
+            if position in band_rows:
+                conn.executemany("INSERT INTO bands VALUES (?, ?, ?)",
+                                 ((band, int(bucket), next_id)
+                                  for band, bucket in enumerate(band_rows[position].view(np.int64))))
+            next_id += 1
+            unique.append(entry)
+        return unique, duplicates, skipped
+
+    def _similar(self, first, second):
+        return is_near_duplicate(first, second, self.title_threshold, self.author_threshold)
+
+    @staticmethod
+    def _similarity(first, second):
+        union = len(first[0] | second[0])
+        return round(len(first[0] & second[0]) / union, 3) if union else 0.0
+
+    def _update_clusters(self, conn, duplicates):
+        """Agrega los duplicados nuevos al JSON de clusters (agrupados por la entrada conservada)."""
+        records = []
+        if os.path.exists(self.clusters_path):
+            with open(self.clusters_path, encoding="utf-8") as f:
+                records = json.load(f)
+        by_kept = {(record["kept"]["ID"], record["kept"]["title"]): record for record in records}
+        for entry, entry_id, match, similarity in duplicates:
+            bib_id, title, author, doi = conn.execute("SELECT bib_id, title, author, doi FROM entries WHERE id = ?",
+                                                      (entry_id,)).fetchone()
+            kept = {"ID": bib_id, "title": title, "author": author, "doi": doi}
+            record = cluster_record(kept, [(entry, match, similarity)])
+            if (bib_id, title) in by_kept:
+                by_kept[(bib_id, title)]["duplicates"].extend(record["duplicates"])
+            else:
+                by_kept[(bib_id, title)] = record
+                records.append(record)
+        with open(self.clusters_path, "w", encoding="utf-8") as f:
+            json.dump(records, f, ensure_ascii=False, indent=2)
+
+    #############################################
+    # EJECUCIÓN
+    #############################################
+
+    def run(self):
+        """
+        Procesa los .bib nuevos o modificados y retorna
+        {"files", "parsed_files", "entries", "unique", "duplicates", "known", "rebuilt", "seconds"},
+        donde known cuenta las entradas de archivos modificados que ya estaban unificadas.
+        """
+        start = time.perf_counter()
+        conn = self._connect()
+        try:
+            rebuilt = not self._check_outputs(conn)
+            if rebuilt:
+                self._reset(conn)
+            changed = self._changed_files(conn)
+            parsed = self._parse([name for name, _, _, _ in changed])
+            entries = [entry for file_entries in parsed for entry in file_entries]
+            sources = [name for (name, _, _, _), file_entries in zip(changed, parsed) for _ in file_entries]
+            unique, duplicates, known = self._deduplicate(conn, entries, sources)
+
+            # Primero la salida (con fsync) y luego el índice: ver _check_outputs
+            if not os.path.exists(self.unified_path):
+                open(self.unified_path, "w", encoding="utf-8").close()
+            _append_entries(self.unified_path, unique)
+            _append_entries(self.duplicates_path, [duplicate[0] for duplicate in duplicates])
+            if duplicates:
+                self._update_clusters(conn, duplicates)
+            conn.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)", changed)
+            conn.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                             [("unified_size", str(_size(self.unified_path))),
+                              ("duplicates_size", str(_size(self.duplicates_path))),
+                              ("settings", self._settings())])
+            conn.commit()
+            files = sum(1 for name in os.listdir(self.data_folder)
+                        if name.endswith(".bib") and name not in OUTPUT_FILENAMES)
+            return {"files": files, "parsed_files": len(changed), "entries": len(entries), "unique": len(unique),
+                    "duplicates": len(duplicates), "known": known, "rebuilt": rebuilt, "seconds": time.perf_counter() - start}
+        finally:
+            conn.close()